@@ -1,88 +1,97 @@
 """
 Renk Uzayı Dönüşümleri - Ana Modül
 ==================================
-Tüm dönüşüm fonksiyonlarını tek bir modülde toplar.
+Tüm dönüşüm fonksiyonlarını tek bir paket altında toplar.
+
+Alt modüller ilk erişimde yüklenir (PEP 562 modül `__getattr__`):
+`from donusumler import rgb_to_lab` yalnızca `rgb_lab` ve onun ihtiyaç
+duyduğu modülleri içe aktarır. Bir kez yüklenen ad paket içinde saklanır,
+sonraki erişimler doğrudan yapılır.
 
 Kullanım:
     from donusumler import rgb_to_hsv, hsv_to_rgb, rgb_to_lab, lab_to_rgb
-"""
-
-# RGB ↔ HSV
-from rgb_hsv import rgb_to_hsv, hsv_to_rgb, rgb_image_to_hsv, hsv_image_to_rgb
-
-# RGB ↔ HSL
-from rgb_hsl import rgb_to_hsl, hsl_to_rgb, rgb_image_to_hsl, hsl_image_to_rgb
 
-# RGB ↔ XYZ
-from rgb_xyz import (rgb_to_xyz, xyz_to_rgb, rgb_image_to_xyz, xyz_image_to_rgb,
-                     gamma_expand, gamma_compress)
+Modül testleri:
+    python -m donusumler            # kapsamlı test
+    python -m donusumler.rgb_hsv    # tek modül testi
+"""
 
-# XYZ ↔ LAB
-from xyz_lab import xyz_to_lab, lab_to_xyz, xyz_image_to_lab, lab_image_to_xyz, f, f_inverse
+import importlib
 
-# LAB ↔ LCH
-from lab_lch import lab_to_lch, lch_to_lab, lab_image_to_lch, lch_image_to_lab
+# Alt modül → dışa açılan adlar
+_ALT_MODULLER = {
+    # RGB ↔ HSV
+    'rgb_hsv': ('rgb_to_hsv', 'hsv_to_rgb', 'rgb_image_to_hsv', 'hsv_image_to_rgb',
+                'rgb_to_hsv_batch', 'hsv_to_rgb_batch'),
+    # RGB ↔ HSL
+    'rgb_hsl': ('rgb_to_hsl', 'hsl_to_rgb', 'rgb_image_to_hsl', 'hsl_image_to_rgb',
+                'rgb_to_hsl_batch', 'hsl_to_rgb_batch'),
+    # RGB ↔ XYZ
+    'rgb_xyz': ('rgb_to_xyz', 'xyz_to_rgb', 'rgb_image_to_xyz', 'xyz_image_to_rgb',
+                'rgb_to_xyz_batch', 'xyz_to_rgb_batch',
+                'gamma_expand', 'gamma_compress', 'gamma_expand_array', 'gamma_compress_array'),
+    # XYZ ↔ LAB
+    'xyz_lab': ('xyz_to_lab', 'lab_to_xyz', 'xyz_image_to_lab', 'lab_image_to_xyz',
+                'xyz_to_lab_batch', 'lab_to_xyz_batch',
+                'f', 'f_inverse', 'f_array', 'f_inverse_array'),
+    # LAB ↔ LCH
+    'lab_lch': ('lab_to_lch', 'lch_to_lab', 'lab_image_to_lch', 'lch_image_to_lab',
+                'lab_to_lch_batch', 'lch_to_lab_batch',
+                'get_hue_name', 'hue_label_image', 'hue_percentages', 'HUE_NAMES'),
+    # RGB ↔ LAB (Tam Zincir)
+    'rgb_lab': ('rgb_to_lab', 'lab_to_rgb', 'rgb_image_to_lab', 'lab_image_to_rgb',
+                'rgb_to_lab_batch', 'lab_to_rgb_batch'),
+    # RGB → LAB Arama Küpü (8-bit)
+    'lab_kupu': ('build_lab_cube', 'load_lab_cube', 'rgb_image_to_lab_cube'),
+    # Çıktı kodlamaları (float64 / float32 / float16 / uint8)
+    'kodlama': ('KODLAMALAR', 'decode_image'),
+    # Uzaylar arası planlı, birleşik dönüşüm
+    'donusum_grafi': ('convert', 'plan_conversion', 'explain_conversion', 'RENK_UZAYLARI',
+                      'convert_batch',
+                      # Komşu olmayan çiftlerin toplu fonksiyonları
+                      'rgb_to_lch_batch', 'lch_to_rgb_batch',
+                      'hsv_to_hsl_batch', 'hsl_to_hsv_batch',
+                      'hsv_to_xyz_batch', 'xyz_to_hsv_batch',
+                      'hsv_to_lab_batch', 'lab_to_hsv_batch',
+                      'hsv_to_lch_batch', 'lch_to_hsv_batch',
+                      'hsl_to_xyz_batch', 'xyz_to_hsl_batch',
+                      'hsl_to_lab_batch', 'lab_to_hsl_batch',
+                      'hsl_to_lch_batch', 'lch_to_hsl_batch',
+                      'xyz_to_lch_batch', 'lch_to_xyz_batch'),
+    # Çıktı tamponu doğrulama
+    'yardimci': ('check_output',),
+    # Parçalı (out-of-core) dönüşüm
+    'parcali': ('convert_tiled',),
+    # Çok çekirdekli dönüşüm
+    'paralel': ('convert_parallel',),
+    # Delta E
+    'delta_e': ('delta_e_cie76', 'delta_e_cie94', 'delta_e_ciede2000', 'interpret_delta_e',
+                'delta_e_cie76_array', 'delta_e_cie94_array', 'delta_e_ciede2000_array',
+                'CIEDE2000Reference'),
+    # Bellek sınırlı çiftli Delta E (matris, en yakın k, eşik sorguları)
+    'delta_e_matris': ('delta_e_matrix', 'nearest_colors', 'pairs_within'),
+    # LAB paleti için en yakın renk indeksi
+    'palet_indeksi': ('PaletteIndex',),
+    # Aydınlatıcı bağlamı (Bradford adaptasyonu, D50 / A / ... beyaz noktaları)
+    'aydinlatici': ('IlluminantContext', 'illuminant_context', 'bradford_matrix', 'ILLUMINANTS'),
+}
 
-# RGB ↔ LAB (Tam Zincir)
-from rgb_lab import rgb_to_lab, lab_to_rgb, rgb_image_to_lab, lab_image_to_rgb
+# Ad → tanımlandığı alt modül
+_KAYNAK = {ad: modul for modul, adlar in _ALT_MODULLER.items() for ad in adlar}
 
-# Delta E
-from delta_e import delta_e_cie76, delta_e_cie94, delta_e_ciede2000, interpret_delta_e
+__all__ = list(_KAYNAK)
 
 
-__all__ = [
-    # HSV
-    'rgb_to_hsv', 'hsv_to_rgb', 'rgb_image_to_hsv', 'hsv_image_to_rgb',
-    # HSL
-    'rgb_to_hsl', 'hsl_to_rgb', 'rgb_image_to_hsl', 'hsl_image_to_rgb',
-    # XYZ
-    'rgb_to_xyz', 'xyz_to_rgb', 'rgb_image_to_xyz', 'xyz_image_to_rgb',
-    'gamma_expand', 'gamma_compress',
-    # LAB
-    'xyz_to_lab', 'lab_to_xyz', 'xyz_image_to_lab', 'lab_image_to_xyz',
-    'rgb_to_lab', 'lab_to_rgb', 'rgb_image_to_lab', 'lab_image_to_rgb',
-    # LCH
-    'lab_to_lch', 'lch_to_lab', 'lab_image_to_lch', 'lch_image_to_lab',
-    # Delta E
-    'delta_e_cie76', 'delta_e_cie94', 'delta_e_ciede2000', 'interpret_delta_e',
-]
+def __getattr__(name: str):
+    """Dışa açılan adları ve alt modülleri ilk erişimde yükler."""
+    if name in _KAYNAK:
+        deger = getattr(importlib.import_module(f'.{_KAYNAK[name]}', __name__), name)
+        globals()[name] = deger
+        return deger
+    if name in _ALT_MODULLER:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-if __name__ == "__main__":
-    print("=== Renk Uzayı Dönüşümleri - Kapsamlı Test ===\n")
-    
-    # Test RGB değeri
-    r, g, b = 180, 100, 60
-    print(f"Orijinal RGB: ({r}, {g}, {b})\n")
-    
-    # HSV
-    h, s, v = rgb_to_hsv(r, g, b)
-    r2, g2, b2 = hsv_to_rgb(h, s, v)
-    print(f"HSV: ({h:.1f}°, {s:.2f}, {v:.2f}) → RGB: ({r2}, {g2}, {b2})")
-    
-    # HSL
-    h, s, l = rgb_to_hsl(r, g, b)
-    r2, g2, b2 = hsl_to_rgb(h, s, l)
-    print(f"HSL: ({h:.1f}°, {s:.2f}, {l:.2f}) → RGB: ({r2}, {g2}, {b2})")
-    
-    # XYZ
-    x, y, z = rgb_to_xyz(r, g, b)
-    r2, g2, b2 = xyz_to_rgb(x, y, z)
-    print(f"XYZ: ({x:.2f}, {y:.2f}, {z:.2f}) → RGB: ({r2}, {g2}, {b2})")
-    
-    # LAB
-    L, a, b_val = rgb_to_lab(r, g, b)
-    r2, g2, b2 = lab_to_rgb(L, a, b_val)
-    print(f"LAB: ({L:.2f}, {a:.2f}, {b_val:.2f}) → RGB: ({r2}, {g2}, {b2})")
-    
-    # LCH
-    L2, C, h_deg = lab_to_lch(L, a, b_val)
-    L3, a2, b2 = lch_to_lab(L2, C, h_deg)
-    print(f"LCH: ({L2:.2f}, {C:.2f}, {h_deg:.1f}°)")
-    
-    # Delta E
-    lab1 = (50, 20, 30)
-    lab2 = (55, 25, 28)
-    de = delta_e_cie76(lab1, lab2)
-    print(f"\nDelta E (CIE76) between {lab1} and {lab2}: {de:.2f}")
-    print(f"Yorum: {interpret_delta_e(de)}")
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
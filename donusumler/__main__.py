@@ -0,0 +1,48 @@
+"""
+Renk Uzayı Dönüşümleri - Kapsamlı Test
+======================================
+Çalıştırma: python -m donusumler
+"""
+
+from . import (rgb_to_hsv, hsv_to_rgb, rgb_to_hsl, hsl_to_rgb, rgb_to_xyz, xyz_to_rgb,
+               rgb_to_lab, lab_to_rgb, lab_to_lch, lch_to_lab,
+               delta_e_cie76, interpret_delta_e)
+
+
+print("=== Renk Uzayı Dönüşümleri - Kapsamlı Test ===\n")
+
+# Test RGB değeri
+r, g, b = 180, 100, 60
+print(f"Orijinal RGB: ({r}, {g}, {b})\n")
+
+# HSV
+h, s, v = rgb_to_hsv(r, g, b)
+r2, g2, b2 = hsv_to_rgb(h, s, v)
+print(f"HSV: ({h:.1f}°, {s:.2f}, {v:.2f}) → RGB: ({r2}, {g2}, {b2})")
+
+# HSL
+h, s, l = rgb_to_hsl(r, g, b)
+r2, g2, b2 = hsl_to_rgb(h, s, l)
+print(f"HSL: ({h:.1f}°, {s:.2f}, {l:.2f}) → RGB: ({r2}, {g2}, {b2})")
+
+# XYZ
+x, y, z = rgb_to_xyz(r, g, b)
+r2, g2, b2 = xyz_to_rgb(x, y, z)
+print(f"XYZ: ({x:.2f}, {y:.2f}, {z:.2f}) → RGB: ({r2}, {g2}, {b2})")
+
+# LAB
+L, a, b_val = rgb_to_lab(r, g, b)
+r2, g2, b2 = lab_to_rgb(L, a, b_val)
+print(f"LAB: ({L:.2f}, {a:.2f}, {b_val:.2f}) → RGB: ({r2}, {g2}, {b2})")
+
+# LCH
+L2, C, h_deg = lab_to_lch(L, a, b_val)
+L3, a2, b2 = lch_to_lab(L2, C, h_deg)
+print(f"LCH: ({L2:.2f}, {C:.2f}, {h_deg:.1f}°)")
+
+# Delta E
+lab1 = (50, 20, 30)
+lab2 = (55, 25, 28)
+de = delta_e_cie76(lab1, lab2)
+print(f"\nDelta E (CIE76) between {lab1} and {lab2}: {de:.2f}")
+print(f"Yorum: {interpret_delta_e(de)}")
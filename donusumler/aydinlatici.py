@@ -0,0 +1,235 @@
+"""
+Aydınlatıcı (Illuminant) Bağlamı
+================================
+sRGB matrisleri ve LAB dönüşümleri D65 beyaz noktasına göre tanımlıdır.
+Farklı bir aydınlatıcı (ör. baskı için D50, tungsten için A) altında
+çalışırken XYZ değerleri Bradford kromatik adaptasyonu ile hedef beyaz
+noktaya taşınır ve LAB o beyaz noktaya göre hesaplanır.
+
+`IlluminantContext` adaptasyon matrislerini, birleşik RGB ↔ LAB
+matrislerini ve beyaz nokta terslerini bir kez hesaplar; görüntü
+dönüşümleri bu hazır matrislerle çalışır. Aynı aydınlatıcı için bağlam
+önbellekte tutulur (`illuminant_context`).
+
+Kullanım:
+    from donusumler import illuminant_context
+    d50 = illuminant_context('D50')
+    lab = d50.rgb_image_to_lab(goruntu)
+"""
+
+import numpy as np
+from functools import lru_cache, partial
+from .kodlama import encoding_dtype
+from .yardimci import apply_blocked, rgb_input_scale
+from .rgb_xyz import (RGB_TO_XYZ_MATRIX, XYZ_TO_RGB_MATRIX, D65_XN, D65_YN, D65_ZN,
+                      _rgb_to_xyz_kernel, _xyz_to_rgb_kernel)
+from .xyz_lab import _xyz_to_lab_kernel, _lab_to_xyz_kernel
+from .rgb_lab import _rgb_to_lab_kernel, _lab_to_rgb_kernel
+from .rgb_hsv import rgb_image_to_hsv, hsv_image_to_rgb
+from .rgb_hsl import rgb_image_to_hsl, hsl_image_to_rgb
+from .lab_lch import lab_image_to_lch, lch_image_to_lab
+
+# Standart aydınlatıcıların beyaz noktaları (CIE 1931 2°, Y = 100)
+ILLUMINANTS = {
+    'D65': (D65_XN, D65_YN, D65_ZN),
+    'D50': (96.422, 100.000, 82.521),
+    'D55': (95.682, 100.000, 92.149),
+    'D75': (94.972, 100.000, 122.638),
+    'A': (109.850, 100.000, 35.585),
+    'E': (100.000, 100.000, 100.000),
+}
+
+# Bradford koni tepki matrisi (XYZ → LMS)
+BRADFORD = np.array([
+    [ 0.8951,  0.2664, -0.1614],
+    [-0.7502,  1.7135,  0.0367],
+    [ 0.0389, -0.0685,  1.0296]
+])
+
+
+def bradford_matrix(kaynak_beyaz, hedef_beyaz) -> np.ndarray:
+    """
+    Kaynak beyaz noktadan hedef beyaz noktaya Bradford adaptasyon matrisi.
+    
+    M = B⁻¹ · diag(LMS_hedef / LMS_kaynak) · B
+    
+    Args:
+        kaynak_beyaz: Kaynak beyaz nokta (Xn, Yn, Zn)
+        hedef_beyaz: Hedef beyaz nokta (Xn, Yn, Zn)
+    
+    Returns:
+        np.ndarray: 3×3 matris (XYZ_hedef = M @ XYZ_kaynak)
+    """
+    kaynak_lms = BRADFORD @ np.asarray(kaynak_beyaz, dtype=np.float64)
+    hedef_lms = BRADFORD @ np.asarray(hedef_beyaz, dtype=np.float64)
+    return np.linalg.inv(BRADFORD) @ np.diag(hedef_lms / kaynak_lms) @ BRADFORD
+
+
+class IlluminantContext:
+    """
+    Seçilen aydınlatıcı için önceden hesaplanmış dönüşüm bağlamı.
+    
+    Hesaplanan matrisler (bir kez):
+    - adaptation: D65 → hedef beyaz Bradford matrisi
+    - rgb_to_xyz_matrix / xyz_to_rgb_matrix: adapte edilmiş sRGB matrisleri
+    - görüntü çekirdekleri için ölçekli / transpoze ve beyaz noktaya
+      normalize edilmiş birleşik RGB ↔ LAB matrisleri
+    - beyaz nokta ve tersi
+    
+    HSV, HSL ve LCH dönüşümleri aydınlatıcıdan bağımsızdır; bütün görüntü
+    dönüşümlerinin tek arayüzden kullanılabilmesi için bağlamda da bulunur.
+    
+    Args:
+        illuminant: Aydınlatıcı adı ('D65', 'D50', 'A', ...) veya
+                    özel beyaz nokta (Xn, Yn, Zn)
+    """
+    
+    rgb_image_to_hsv = staticmethod(rgb_image_to_hsv)
+    hsv_image_to_rgb = staticmethod(hsv_image_to_rgb)
+    rgb_image_to_hsl = staticmethod(rgb_image_to_hsl)
+    hsl_image_to_rgb = staticmethod(hsl_image_to_rgb)
+    lab_image_to_lch = staticmethod(lab_image_to_lch)
+    lch_image_to_lab = staticmethod(lch_image_to_lab)
+    
+    def __init__(self, illuminant='D65'):
+        if isinstance(illuminant, str):
+            if illuminant.upper() not in ILLUMINANTS:
+                raise ValueError(f"Bilinmeyen aydınlatıcı: {illuminant}. "
+                                 f"Seçenekler: {tuple(ILLUMINANTS)} veya (Xn, Yn, Zn)")
+            self.name = illuminant.upper()
+            beyaz = ILLUMINANTS[self.name]
+        else:
+            self.name = 'özel'
+            beyaz = illuminant
+        self.white = np.asarray(beyaz, dtype=np.float64)
+        if self.white.shape != (3,) or (self.white <= 0).any():
+            raise ValueError(f"Beyaz nokta üç pozitif değer olmalı: {beyaz}")
+        
+        d65 = np.array(ILLUMINANTS['D65'])
+        if np.array_equal(self.white, d65):
+            self.adaptation = np.eye(3)
+        else:
+            self.adaptation = bradford_matrix(d65, self.white)
+        self.rgb_to_xyz_matrix = self.adaptation @ RGB_TO_XYZ_MATRIX
+        self.xyz_to_rgb_matrix = XYZ_TO_RGB_MATRIX @ np.linalg.inv(self.adaptation)
+        
+        # Çekirdek matrisleri (satır vektörleri için transpoze, XYZ 0-100)
+        self._white_inv = 1 / self.white
+        self._rgb_xyz_T = self.rgb_to_xyz_matrix.T * 100
+        xyz_rgb_T = self.xyz_to_rgb_matrix.T / 100
+        self._xyz_rgb_T = xyz_rgb_T.astype(np.float32)
+        self._rgb_xyzn_T = self._rgb_xyz_T * self._white_inv[np.newaxis, :]
+        self._xyzn_rgb_T = (self.white[:, np.newaxis] * xyz_rgb_T).astype(np.float32)
+    
+    def __repr__(self) -> str:
+        xn, yn, zn = self.white
+        return f"IlluminantContext({self.name}: Xn={xn:.3f}, Yn={yn:.3f}, Zn={zn:.3f})"
+    
+    def rgb_image_to_xyz(self, image: np.ndarray, out: np.ndarray = None,
+                         encoding: str = 'float32') -> np.ndarray:
+        """RGB görüntüyü bu aydınlatıcıya adapte edilmiş XYZ'ye dönüştür."""
+        image = np.asarray(image)
+        rgb_input_scale(image)
+        return apply_blocked(partial(_rgb_to_xyz_kernel, matris=self._rgb_xyz_T), image,
+                             encoding_dtype(encoding), out=out, space='xyz')
+    
+    def xyz_image_to_rgb(self, xyz_image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Bu aydınlatıcıya göre XYZ görüntüyü sRGB'ye (uint8) dönüştür."""
+        return apply_blocked(partial(_xyz_to_rgb_kernel, matris=self._xyz_rgb_T),
+                             xyz_image, np.uint8, out=out)
+    
+    def xyz_image_to_lab(self, xyz_image: np.ndarray, out: np.ndarray = None,
+                         encoding: str = 'float32') -> np.ndarray:
+        """XYZ görüntüyü bu aydınlatıcının beyaz noktasına göre LAB'a dönüştür."""
+        return apply_blocked(partial(_xyz_to_lab_kernel, ters=self._white_inv), xyz_image,
+                             encoding_dtype(encoding), out=out, space='lab')
+    
+    def lab_image_to_xyz(self, lab_image: np.ndarray, out: np.ndarray = None,
+                         encoding: str = 'float32') -> np.ndarray:
+        """LAB görüntüyü bu aydınlatıcının beyaz noktasına göre XYZ'ye dönüştür."""
+        return apply_blocked(partial(_lab_to_xyz_kernel, beyaz=self.white), lab_image,
+                             encoding_dtype(encoding), out=out, space='xyz')
+    
+    def rgb_image_to_lab(self, image: np.ndarray, out: np.ndarray = None,
+                         encoding: str = 'float32') -> np.ndarray:
+        """RGB görüntüyü bu aydınlatıcı altında LAB'a dönüştür (birleşik, tek geçiş)."""
+        image = np.asarray(image)
+        rgb_input_scale(image)
+        return apply_blocked(partial(_rgb_to_lab_kernel, matris=self._rgb_xyzn_T), image,
+                             encoding_dtype(encoding), out=out, space='lab')
+    
+    def lab_image_to_rgb(self, lab_image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Bu aydınlatıcı altındaki LAB görüntüyü sRGB'ye (uint8) dönüştür."""
+        return apply_blocked(partial(_lab_to_rgb_kernel, matris=self._xyzn_rgb_T),
+                             lab_image, np.uint8, out=out)
+
+
+@lru_cache(maxsize=None)
+def _cached_context(anahtar) -> IlluminantContext:
+    """Normalize edilmiş anahtar (büyük harf ad veya float demeti) için bağlam."""
+    return IlluminantContext(anahtar)
+
+
+def illuminant_context(illuminant='D65') -> IlluminantContext:
+    """
+    Aydınlatıcı bağlamını döndürür; aynı aydınlatıcı için tek örnek paylaşılır.
+    
+    Anahtar önbelleğe sorulmadan önce normalize edilir: adlar büyük harfe
+    çevrilir ('d65' ve 'D65' aynı bağlamı paylaşır), özel beyaz noktalar
+    (liste, demet veya dizi) float demetine çevrilir.
+    
+    Args:
+        illuminant: Aydınlatıcı adı veya (Xn, Yn, Zn) beyaz noktası
+    
+    Returns:
+        IlluminantContext: Önbellekteki bağlam
+    """
+    if isinstance(illuminant, str):
+        return _cached_context(illuminant.upper())
+    return _cached_context(tuple(float(v) for v in np.ravel(illuminant)))
+
+
+if __name__ == "__main__":
+    from .rgb_lab import rgb_image_to_lab, lab_image_to_rgb
+    from .xyz_lab import xyz_to_lab
+    
+    print("=== Aydınlatıcı Bağlamı Testi ===\n")
+    
+    goruntu = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    
+    # D65 bağlamı modül fonksiyonlarıyla aynı sonucu vermeli
+    d65 = illuminant_context('D65')
+    esit = np.array_equal(d65.rgb_image_to_lab(goruntu), rgb_image_to_lab(goruntu))
+    print(f"D65 bağlamı = rgb_image_to_lab: {'✓' if esit else '✗'}")
+    
+    # Önbellek: ad büyük/küçük harf, özel beyaz nokta liste / dizi olarak
+    d50 = ILLUMINANTS['D50']
+    ayni = (illuminant_context('d65') is d65
+            and illuminant_context(list(d50)) is illuminant_context(np.array(d50)))
+    print(f"Önbellek anahtarı normalize: {'✓' if ayni else '✗'}")
+    
+    for ad in ('D50', 'A'):
+        baglam = illuminant_context(ad)
+        print(f"\n{baglam}")
+        
+        # Beyaz, her aydınlatıcıda kendi beyaz noktasına gitmeli (L=100, a=b=0)
+        beyaz_lab = baglam.rgb_image_to_lab(np.full((1, 1, 3), 255, np.uint8))[0, 0]
+        print(f"  Beyaz → LAB: ({beyaz_lab[0]:.3f}, {beyaz_lab[1]:.3f}, {beyaz_lab[2]:.3f})")
+        
+        # Birleşik yol, XYZ üzerinden iki adımlı yol ile aynı olmalı
+        xyz = baglam.rgb_image_to_xyz(goruntu, encoding='float64')
+        iki_adim = baglam.xyz_image_to_lab(xyz, encoding='float64')
+        fark = np.abs(baglam.rgb_image_to_lab(goruntu, encoding='float64') - iki_adim).max()
+        print(f"  RGB → LAB birleşik / iki adım farkı: {fark:.2e}")
+        
+        # Skaler xyz_to_lab (aynı beyaz nokta ile) karşılaştırması
+        x, y, z = xyz[100, 200]
+        skaler = np.array(xyz_to_lab(x, y, z, *baglam.white))
+        print(f"  Skaler xyz_to_lab farkı: {np.abs(iki_adim[100, 200] - skaler).max():.2e}")
+        
+        # Gidiş-dönüş
+        geri = baglam.lab_image_to_rgb(baglam.rgb_image_to_lab(goruntu))
+        print(f"  RGB → LAB → RGB en büyük fark: {np.abs(geri.astype(int) - goruntu).max()}")
+    
+    print(f"\nÖnbellek: aynı bağlam nesnesi: "
+          f"{'✓' if illuminant_context('D50') is illuminant_context('D50') else '✗'}")
@@ -2,9 +2,19 @@
 Delta E Renk Farkı Metrikleri
 =============================
 CIE76, CIE94 ve CIEDE2000 formülleri
+
+Skaler fonksiyonlar iki LAB üçlüsü alır. `*_array` sürümleri aynı
+formülleri float64 NumPy dizileriyle uygular ve yayınlama (broadcasting)
+yapar: (H, W, 3) görüntü tek bir referansla, (N, 1, 3) küme (M, 3) kümeyle
+karşılaştırılabilir (sonuç (N, M)).
 """
 
 import math
+import numpy as np
+from .yardimci import pixel_blocks
+
+# Hazır referans hesabında blok başına (piksel × referans) çift sayısı
+_DE_BLOK = 4096
 
 
 def delta_e_cie76(lab1: tuple, lab2: tuple) -> float:
@@ -69,6 +79,197 @@ def delta_e_ciede2000(lab1: tuple, lab2: tuple) -> float:
     return math.sqrt((dLp/SL)**2+(dCp/SC)**2+(dHp/SH)**2+RT*(dCp/SC)*(dHp/SH))
 
 
+def _lab_kanallari(lab) -> tuple:
+    """(..., 3) LAB dizisini float64 L, a, b kanallarına ayırır."""
+    lab = np.asarray(lab, dtype=np.float64)
+    if lab.shape[-1] != 3:
+        raise ValueError(f"LAB dizisinin son ekseni 3 olmalı, verilen: {lab.shape}")
+    return lab[..., 0], lab[..., 1], lab[..., 2]
+
+
+def delta_e_cie76_array(lab1, lab2) -> np.ndarray:
+    """CIE76 Delta E (dizi): (..., 3) LAB dizileri yayınlanarak karşılaştırılır."""
+    L1, a1, b1 = _lab_kanallari(lab1)
+    L2, a2, b2 = _lab_kanallari(lab2)
+    return np.sqrt((L1-L2)**2 + (a1-a2)**2 + (b1-b2)**2)
+
+
+def delta_e_cie94_array(lab1, lab2, textile: bool = False) -> np.ndarray:
+    """CIE94 Delta E (dizi). `lab1` referans kabul edilir (SC, SH onun C*'ından)."""
+    L1, a1, b1 = _lab_kanallari(lab1)
+    L2, a2, b2 = _lab_kanallari(lab2)
+    
+    kL, K1, K2 = (2, 0.048, 0.014) if textile else (1, 0.045, 0.015)
+    
+    C1 = np.sqrt(a1**2 + b1**2)
+    delta_L = L1 - L2
+    delta_a = a1 - a2
+    delta_b = b1 - b2
+    delta_C = C1 - np.sqrt(a2**2 + b2**2)
+    delta_H = np.sqrt(np.maximum(0, delta_a**2 + delta_b**2 - delta_C**2))
+    
+    SL, SC, SH = 1, 1 + K1*C1, 1 + K2*C1
+    
+    return np.sqrt((delta_L/(kL*SL))**2 + (delta_C/SC)**2 + (delta_H/SH)**2)
+
+
+def delta_e_ciede2000_array(lab1, lab2) -> np.ndarray:
+    """
+    CIEDE2000 Delta E (dizi).
+    
+    Skaler `delta_e_ciede2000` ile adım adım aynıdır (hue farkı ve ortalama
+    hue dalları maskelerle seçilir); sonuçlar 1e-6 içinde eşleşir.
+    
+    Args:
+        lab1, lab2: Birbirine yayınlanabilen (..., 3) LAB dizileri
+    
+    Returns:
+        np.ndarray: Yayınlanmış biçimde ΔE00 değerleri (float64)
+    """
+    L1, a1, b1 = _lab_kanallari(lab1)
+    L2, a2, b2 = _lab_kanallari(lab2)
+    
+    C1, C2 = np.sqrt(a1**2+b1**2), np.sqrt(a2**2+b2**2)
+    C_bar7 = ((C1+C2)/2)**7
+    G = 0.5*(1-np.sqrt(C_bar7/(C_bar7+25**7)))
+    
+    a1p, a2p = a1*(1+G), a2*(1+G)
+    C1p, C2p = np.sqrt(a1p**2+b1**2), np.sqrt(a2p**2+b2**2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+    
+    dLp, dCp = L2-L1, C2p-C1p
+    dhp = h2p-h1p
+    dhp = np.where(np.abs(dhp) > 180, dhp - np.copysign(360, dhp), dhp)
+    dHp = 2*np.sqrt(C1p*C2p)*np.sin(np.radians(dhp/2))
+    
+    Lbp, Cbp = (L1+L2)/2, (C1p+C2p)/2
+    hbp = (h1p+h2p)/2 + 180*(np.abs(h1p-h2p) > 180)
+    
+    T = 1-0.17*np.cos(np.radians(hbp-30))+0.24*np.cos(np.radians(2*hbp))
+    T += 0.32*np.cos(np.radians(3*hbp+6))-0.20*np.cos(np.radians(4*hbp-63))
+    
+    SL = 1+(0.015*(Lbp-50)**2)/np.sqrt(20+(Lbp-50)**2)
+    SC, SH = 1+0.045*Cbp, 1+0.015*Cbp*T
+    
+    dth = 30*np.exp(-((hbp-275)/25)**2)
+    Cbp7 = Cbp**7
+    RC = 2*np.sqrt(Cbp7/(Cbp7+25**7))
+    RT = -np.sin(np.radians(2*dth))*RC
+    
+    tL, tC, tH = dLp/SL, dCp/SC, dHp/SH
+    return np.sqrt(tL**2+tC**2+tH**2+RT*tC*tH)
+
+
+# T terimindeki açı kaydırmalarının kosinüs / sinüsleri (kat açı formülleri için)
+_C30, _S30 = math.cos(math.radians(30)), math.sin(math.radians(30))
+_C6, _S6 = math.cos(math.radians(6)), math.sin(math.radians(6))
+_C63, _S63 = math.cos(math.radians(63)), math.sin(math.radians(63))
+
+
+class CIEDE2000Reference:
+    """
+    Sabit referans renk(ler)e karşı tekrarlanan CIEDE2000 hesapları için hazır nesne.
+    
+    Referans tarafının L*, a*, b* ve C* değerleri bir kez hesaplanır. G
+    çarpanı iki rengin ortalama chroma'sına bağlı olduğundan sorgu başına
+    hesaplanmak zorundadır; a1′, C1′ ve h1′ de G'ye bağlıdır. Bunun dışında:
+    - T terimindeki dört kosinüs, ortalama hue'nun tek bir sin/cos çiftinden
+      kat açı formülleriyle elde edilir (4 trigonometrik çağrı yerine 2),
+    - hue sarmaları `%` ve `np.where` yerine maske çarpımıyla yapılır,
+    - sorgu, ara diziler önbellekte kalacak şekilde bloklar halinde işlenir.
+    
+    Sonuçlar `delta_e_ciede2000_array` ile 1e-6 içinde eşleşir.
+    
+    Args:
+        reference: Tek referans (3,) veya referans kümesi (M, 3), LAB
+    
+    Kullanım:
+        ref = CIEDE2000Reference(hedef_lab)
+        maske = ref.distance(lab_goruntu) < 5     # (H, W)
+    """
+    
+    def __init__(self, reference):
+        L1, a1, b1 = _lab_kanallari(reference)
+        if np.ndim(L1) > 1:
+            raise ValueError(f"Referans (3,) veya (M, 3) olmalı, verilen: {np.shape(reference)}")
+        self.tekil = np.ndim(L1) == 0
+        self.L1, self.a1, self.b1 = L1, a1, b1
+        self.C1 = np.sqrt(a1**2 + b1**2)
+        self.b1_kare = b1**2
+    
+    def __len__(self) -> int:
+        return 1 if self.tekil else len(self.L1)
+    
+    def _block(self, L2, a2, b2) -> np.ndarray:
+        """Referans(lar) ile bir sorgu bloğu arasındaki ΔE00 (yayınlanmış)."""
+        L1, a1, b1, C1 = self.L1, self.a1, self.b1, self.C1
+        
+        C2 = np.sqrt(a2**2+b2**2)
+        C_bar7 = ((C1+C2)/2)**7
+        G1 = 1.5-0.5*np.sqrt(C_bar7/(C_bar7+25**7))  # 1 + G
+        
+        a1p, a2p = a1*G1, a2*G1
+        C1p, C2p = np.sqrt(a1p**2+self.b1_kare), np.sqrt(a2p**2+b2**2)
+        h1p = np.degrees(np.arctan2(b1, a1p))
+        h1p += 360*(h1p < 0)
+        h2p = np.degrees(np.arctan2(b2, a2p))
+        h2p += 360*(h2p < 0)
+        
+        dLp, dCp = L2-L1, C2p-C1p
+        dhp = h2p-h1p
+        sarma = np.abs(dhp) > 180
+        dhp -= np.copysign(360, dhp)*sarma
+        dHp = 2*np.sqrt(C1p*C2p)*np.sin(np.radians(dhp/2))
+        
+        Lbp, Cbp = (L1+L2)/2, (C1p+C2p)/2
+        hbp = (h1p+h2p)/2 + 180*sarma
+        
+        # T: cos(h-30°), cos(2h), cos(3h+6°), cos(4h-63°) tek sin/cos çiftinden
+        radyan = np.radians(hbp)
+        c1, s1 = np.cos(radyan), np.sin(radyan)
+        c2, s2 = 2*c1*c1-1, 2*s1*c1
+        c3, s3 = c1*(2*c2-1), s1*(2*c2+1)
+        c4, s4 = 2*c2*c2-1, 2*s2*c2
+        T = (1-0.17*(c1*_C30+s1*_S30)+0.24*c2
+             + 0.32*(c3*_C6-s3*_S6)-0.20*(c4*_C63+s4*_S63))
+        
+        SL = 1+(0.015*(Lbp-50)**2)/np.sqrt(20+(Lbp-50)**2)
+        SC, SH = 1+0.045*Cbp, 1+0.015*Cbp*T
+        
+        dth = 30*np.exp(-((hbp-275)/25)**2)
+        Cbp7 = Cbp**7
+        RC = 2*np.sqrt(Cbp7/(Cbp7+25**7))
+        RT = -np.sin(np.radians(2*dth))*RC
+        
+        tL, tC, tH = dLp/SL, dCp/SC, dHp/SH
+        return np.sqrt(tL**2+tC**2+tH**2+RT*tC*tH)
+    
+    def distance(self, lab) -> np.ndarray:
+        """
+        Referans(lar) ile LAB dizisi arasındaki CIEDE2000 ΔE.
+        
+        Args:
+            lab: Sorgu renkleri (..., 3)
+        
+        Returns:
+            np.ndarray: Tek referansta (...), M referansta (..., M) biçiminde ΔE00
+        """
+        lab = np.asarray(lab, dtype=np.float64)
+        noktalar = lab.reshape(-1, 3)
+        M = len(self)
+        sonuc = np.empty((len(noktalar), M))
+        
+        for dilim in pixel_blocks(len(noktalar), max(1, _DE_BLOK // M)):
+            blok = noktalar[dilim]
+            L2, a2, b2 = (blok[:, k:k + 1] for k in range(3))
+            sonuc[dilim] = self._block(L2, a2, b2)
+        
+        return sonuc.reshape(lab.shape[:-1] + (() if self.tekil else (M,)))
+    
+    __call__ = distance
+
+
 def interpret_delta_e(de: float) -> str:
     """Delta E yorumla."""
     if de < 1: return "Algılanamaz"
@@ -89,3 +290,44 @@ if __name__ == "__main__":
     for name, l1, l2 in pairs:
         de76 = delta_e_cie76(l1, l2)
         print(f"{name}: ΔE76={de76:.2f} → {interpret_delta_e(de76)}")
+    
+    # Dizi sürümleri skaler fonksiyonlarla aynı sonucu vermeli
+    rng = np.random.default_rng(0)
+    lab1 = np.column_stack([rng.uniform(0, 100, 2000), rng.uniform(-128, 127, (2000, 2))])
+    lab2 = np.column_stack([rng.uniform(0, 100, 2000), rng.uniform(-128, 127, (2000, 2))])
+    lab2[:100] = lab1[:100]  # Aynı renkler
+    lab2[100:200, 1:] = 0    # Renksiz (C* = 0)
+    
+    print("\nDizi / skaler en büyük fark:")
+    for skaler, dizi in ((delta_e_cie76, delta_e_cie76_array),
+                         (delta_e_cie94, delta_e_cie94_array),
+                         (delta_e_ciede2000, delta_e_ciede2000_array)):
+        beklenen = np.array([skaler(tuple(p), tuple(q)) for p, q in zip(lab1, lab2)])
+        fark = np.abs(dizi(lab1, lab2) - beklenen).max()
+        print(f"  {skaler.__name__:18s}: {fark:.2e} {'✓' if fark < 1e-6 else '✗'}")
+    
+    # Yayınlama: (N, 1, 3) × (M, 3) → (N, M)
+    matris = delta_e_ciede2000_array(lab1[:50, np.newaxis], lab2[:40])
+    print(f"\n(50, 1, 3) × (40, 3) → {matris.shape}")
+    
+    # Hazır referans: tam görüntüye karşı tek renk ve palet
+    import time
+    goruntu = np.column_stack([rng.uniform(0, 100, 500_000),
+                               rng.uniform(-128, 127, (500_000, 2))]).reshape(500, 1000, 3)
+    hedef = lab1[0]
+    
+    bas = time.perf_counter()
+    dogrudan = delta_e_ciede2000_array(goruntu, hedef)
+    sure_dogrudan = time.perf_counter() - bas
+    
+    ref = CIEDE2000Reference(hedef)
+    bas = time.perf_counter()
+    hazir = ref.distance(goruntu)
+    sure_hazir = time.perf_counter() - bas
+    
+    print(f"\nHazır referans (500×1000 görüntü): {sure_dogrudan:.2f} sn → {sure_hazir:.2f} sn, "
+          f"en büyük fark {np.abs(hazir - dogrudan).max():.2e}")
+    
+    palet = CIEDE2000Reference(lab2[:16])
+    fark = np.abs(palet.distance(lab1) - delta_e_ciede2000_array(lab2[:16], lab1[:, np.newaxis])).max()
+    print(f"Hazır palet (16 renk) × 2000 renk, en büyük fark: {fark:.2e}")
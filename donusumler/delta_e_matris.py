@@ -0,0 +1,240 @@
+"""
+Bellek Sınırlı Çiftli Delta E Hesabı
+====================================
+İki LAB renk kümesi arasındaki tüm çiftlerin ΔE değerlerini, N×M matrisi
+bellekte bütün olarak tutmadan, bütçeye göre boyutlandırılmış karolar
+(tile) halinde hesaplar.
+
+Sorgular:
+- delta_e_matrix: Tam N×M matris (ör. bellek eşlemeli bir `out` içine)
+- nearest_colors: Her renk için en yakın k referans (indeks, ΔE)
+- pairs_within: ΔE ≤ eşik olan çiftler, seyrek (i, j, d) dizileri olarak
+
+Karo boyutu, seçilen metriğin çift başına kullandığı float64 ara dizi
+sayısından hesaplanır; tepe bellek kullanımı yaklaşık `budget` ile
+sınırlıdır.
+
+Kullanım:
+    from donusumler import nearest_colors
+    indeks, mesafe = nearest_colors(palet_lab, kutuphane_lab, k=5)
+"""
+
+import numpy as np
+from .delta_e import (delta_e_cie76_array, delta_e_cie94_array, delta_e_ciede2000_array,
+                      CIEDE2000Reference)
+from .yardimci import as_color_array
+
+METRIKLER = {
+    'cie76': delta_e_cie76_array,
+    'cie94': delta_e_cie94_array,
+    'ciede2000': delta_e_ciede2000_array,
+}
+
+# Metrik başına çift başına aynı anda yaşayan float64 ara dizi sayısı (tahmini)
+_GECICI_DIZI = {'cie76': 6, 'cie94': 12, 'ciede2000': 32}
+
+# Varsayılan karo bütçesi (bayt)
+MATRIS_BUTCESI = 64 * 1024 * 1024
+
+
+def tile_shape(n: int, m: int, metric: str = 'ciede2000',
+               budget: int = MATRIS_BUTCESI) -> tuple:
+    """
+    Bellek bütçesine sığan karo boyutunu hesaplar.
+    
+    Önce sütun (referans) ekseni bütçeye sığdırılır, kalan bütçe satırlara
+    verilir; böylece küçük referans kümelerinde karolar tam satır olur.
+    
+    Args:
+        n: Satır (sorgu) renk sayısı
+        m: Sütun (referans) renk sayısı
+        metric: 'cie76', 'cie94' veya 'ciede2000'
+        budget: Karo başına bellek üst sınırı (bayt)
+    
+    Returns:
+        tuple: (satır, sütun) karo boyutu (her biri en az 1)
+    """
+    cift_bayt = 8 * _GECICI_DIZI[metric]
+    ciftler = max(1, budget // cift_bayt)
+    sutun = max(1, min(m, ciftler))
+    satir = max(1, min(n, ciftler // sutun))
+    return satir, sutun
+
+
+def _metrik(metric: str):
+    """Metrik adını dizi fonksiyonuna çevirir."""
+    if metric not in METRIKLER:
+        raise ValueError(f"Bilinmeyen metrik: {metric}. Seçenekler: {tuple(METRIKLER)}")
+    return METRIKLER[metric]
+
+
+def iter_delta_e_tiles(lab1, lab2, metric: str = 'ciede2000',
+                       budget: int = MATRIS_BUTCESI):
+    """
+    ΔE matrisini karo karo üretir.
+    
+    Args:
+        lab1: Sorgu renkleri (N, 3), LAB
+        lab2: Referans renkleri (M, 3), LAB
+        metric: 'cie76', 'cie94' (lab1 referans tarafıdır) veya 'ciede2000'
+        budget: Karo başına bellek üst sınırı (bayt)
+    
+    Yields:
+        tuple: (satır dilimi, sütun dilimi, ΔE karosu (satır, sütun) float64)
+    """
+    fonksiyon = _metrik(metric)
+    lab1 = as_color_array(lab1).astype(np.float64, copy=False)
+    lab2 = as_color_array(lab2).astype(np.float64, copy=False)
+    n, m = len(lab1), len(lab2)
+    satir, sutun = tile_shape(n, m, metric, budget)
+    
+    # CIEDE2000 simetriktir: sütun karosu hazır referans olarak kullanılır
+    hazir = metric == 'ciede2000'
+    
+    for j in range(0, m, sutun):
+        sutunlar = slice(j, min(j + sutun, m))
+        referans = CIEDE2000Reference(lab2[sutunlar]) if hazir else lab2[sutunlar]
+        for i in range(0, n, satir):
+            satirlar = slice(i, min(i + satir, n))
+            if hazir:
+                yield satirlar, sutunlar, referans.distance(lab1[satirlar])
+            else:
+                yield satirlar, sutunlar, fonksiyon(lab1[satirlar, np.newaxis], referans)
+
+
+def delta_e_matrix(lab1, lab2, metric: str = 'ciede2000', out: np.ndarray = None,
+                   budget: int = MATRIS_BUTCESI) -> np.ndarray:
+    """
+    Tam N×M ΔE matrisini karo karo doldurur.
+    
+    Matrisin kendisi belleğe sığmıyorsa `out` olarak bellek eşlemeli bir
+    dizi (`np.lib.format.open_memmap`) verilebilir; ara bellek yine
+    `budget` ile sınırlı kalır.
+    
+    Args:
+        lab1: Sorgu renkleri (N, 3)
+        lab2: Referans renkleri (M, 3)
+        metric: 'cie76', 'cie94' veya 'ciede2000'
+        out: İsteğe bağlı (N, M) çıktı dizisi (float32 veya float64)
+        budget: Karo başına bellek üst sınırı (bayt)
+    
+    Returns:
+        np.ndarray: (N, M) ΔE matrisi
+    """
+    n, m = len(lab1), len(lab2)
+    if out is None:
+        out = np.empty((n, m), dtype=np.float64)
+    elif out.shape != (n, m):
+        raise ValueError(f"out biçimi {out.shape}, beklenen {(n, m)}")
+    
+    for satirlar, sutunlar, karo in iter_delta_e_tiles(lab1, lab2, metric, budget):
+        out[satirlar, sutunlar] = karo
+    return out
+
+
+def nearest_colors(lab1, lab2, k: int = 1, metric: str = 'ciede2000',
+                   budget: int = MATRIS_BUTCESI) -> tuple:
+    """
+    Her sorgu rengi için en yakın k referans rengini bulur.
+    
+    Her karoda, o ana kadarki en iyi k aday ile karonun sütunları
+    birleştirilip `argpartition` ile yeniden k adaya indirilir; karolar
+    arasında yalnızca (N, k) boyutunda durum taşınır.
+    
+    Args:
+        lab1: Sorgu renkleri (N, 3)
+        lab2: Referans renkleri (M, 3)
+        k: İstenen komşu sayısı (≤ M)
+        metric: 'cie76', 'cie94' veya 'ciede2000'
+        budget: Karo başına bellek üst sınırı (bayt)
+    
+    Returns:
+        tuple: (indeksler (N, k) int64, mesafeler (N, k) float64),
+               her satır artan ΔE sırasında
+    """
+    n, m = len(lab1), len(lab2)
+    if not 1 <= k <= m:
+        raise ValueError(f"k 1 ile referans sayısı ({m}) arasında olmalı: {k}")
+    
+    en_iyi_d = np.full((n, k), np.inf)
+    en_iyi_i = np.zeros((n, k), dtype=np.int64)
+    
+    for satirlar, sutunlar, karo in iter_delta_e_tiles(lab1, lab2, metric, budget):
+        aday_d = np.concatenate([en_iyi_d[satirlar], karo], axis=1)
+        aday_i = np.concatenate([en_iyi_i[satirlar],
+                                 np.broadcast_to(np.arange(sutunlar.start, sutunlar.stop),
+                                                 karo.shape)], axis=1)
+        secilen = np.argpartition(aday_d, k - 1, axis=1)[:, :k]
+        en_iyi_d[satirlar] = np.take_along_axis(aday_d, secilen, axis=1)
+        en_iyi_i[satirlar] = np.take_along_axis(aday_i, secilen, axis=1)
+    
+    sira = np.argsort(en_iyi_d, axis=1, kind='stable')
+    return np.take_along_axis(en_iyi_i, sira, axis=1), np.take_along_axis(en_iyi_d, sira, axis=1)
+
+
+def pairs_within(lab1, lab2, esik: float, metric: str = 'ciede2000',
+                 budget: int = MATRIS_BUTCESI) -> tuple:
+    """
+    ΔE ≤ esik olan tüm (i, j) çiftlerini seyrek olarak döndürür.
+    
+    Yalnızca eşiği geçen çiftler saklanır; sonuç boyutu eşleşme sayısıyla
+    orantılıdır. Çiftler (i, j) sırasındadır (COO seyrek matris biçimi).
+    
+    Args:
+        lab1: Sorgu renkleri (N, 3)
+        lab2: Referans renkleri (M, 3)
+        esik: ΔE eşiği (dahil)
+        metric: 'cie76', 'cie94' veya 'ciede2000'
+        budget: Karo başına bellek üst sınırı (bayt)
+    
+    Returns:
+        tuple: (i int64, j int64, d float64) dizileri
+    """
+    parcalar_i, parcalar_j, parcalar_d = [], [], []
+    for satirlar, sutunlar, karo in iter_delta_e_tiles(lab1, lab2, metric, budget):
+        ii, jj = np.nonzero(karo <= esik)
+        parcalar_i.append(ii + satirlar.start)
+        parcalar_j.append(jj + sutunlar.start)
+        parcalar_d.append(karo[ii, jj])
+    
+    if not parcalar_i:
+        bos = np.zeros(0, dtype=np.int64)
+        return bos, bos.copy(), np.zeros(0)
+    
+    i = np.concatenate(parcalar_i).astype(np.int64, copy=False)
+    j = np.concatenate(parcalar_j).astype(np.int64, copy=False)
+    d = np.concatenate(parcalar_d)
+    sira = np.lexsort((j, i))
+    return i[sira], j[sira], d[sira]
+
+
+if __name__ == "__main__":
+    import time
+    
+    print("=== Çiftli Delta E Testi ===\n")
+    
+    rng = np.random.default_rng(0)
+    palet = np.column_stack([rng.uniform(0, 100, 3000), rng.uniform(-100, 100, (3000, 2))])
+    kutuphane = np.column_stack([rng.uniform(0, 100, 2000), rng.uniform(-100, 100, (2000, 2))])
+    
+    tam = delta_e_ciede2000_array(palet[:, np.newaxis], kutuphane)
+    kucuk_butce = 1024 * 1024
+    print(f"Karo boyutu (1 MB bütçe): {tile_shape(len(palet), len(kutuphane), budget=kucuk_butce)}")
+    
+    bas = time.perf_counter()
+    matris = delta_e_matrix(palet, kutuphane, budget=kucuk_butce)
+    print(f"delta_e_matrix: {time.perf_counter() - bas:.2f} sn, "
+          f"tam hesapla aynı: {'✓' if np.allclose(matris, tam, rtol=0, atol=1e-9) else '✗'}")
+    
+    bas = time.perf_counter()
+    indeks, mesafe = nearest_colors(palet, kutuphane, k=5, budget=kucuk_butce)
+    beklenen = np.sort(tam, axis=1)[:, :5]
+    print(f"nearest_colors (k=5): {time.perf_counter() - bas:.2f} sn, "
+          f"doğru: {'✓' if np.allclose(mesafe, beklenen, rtol=0, atol=1e-9) else '✗'}")
+    
+    bas = time.perf_counter()
+    i, j, d = pairs_within(palet, kutuphane, esik=5.0, budget=kucuk_butce)
+    beklenen = np.argwhere(tam <= 5.0)
+    dogru = np.array_equal(np.column_stack([i, j]), beklenen)
+    print(f"pairs_within (ΔE ≤ 5): {len(i)} çift, {time.perf_counter() - bas:.2f} sn, "
+          f"doğru: {'✓' if dogru else '✗'}")
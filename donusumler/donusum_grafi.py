@@ -0,0 +1,330 @@
+"""
+Dönüşüm Grafı ve Birleşik Dönüşüm
+=================================
+Renk uzayları (RGB, HSV, HSL, XYZ, LAB, LCH) bir graf oluşturur; her
+kenar bir blok çekirdeğidir (ör. `_rgb_to_lab_kernel`). `convert`
+kaynak ve hedef uzay arasındaki en kısa yolu genişlik öncelikli arama
+(BFS) ile planlar ve yol üzerindeki adımları tek bir blok çekirdeğinde
+birleştirir: her piksel bloğu bütün adımlardan geçip doğrudan çıktıya
+yazılır. Adımlar arasında görüntü boyutunda ara dizi oluşmaz; ara
+sonuçlar blok boyutundaki (önbelleğe sığan) tamponlarda tutulur.
+
+Sonuç, aynı yoldaki görüntü fonksiyonlarını art arda çağırmakla birebir
+aynıdır. RGB'ye dönen adımlar (ör. HSV → RGB) zincirde olduğu gibi
+uint8'e yuvarlar; HSV → LAB bu nedenle RGB üzerinden 8-bit doğrulukla
+geçer.
+
+Komşu olmayan her uzay çifti için `<kaynak>_to_<hedef>_batch` toplu
+fonksiyonları da buradan üretilir (ör. `rgb_to_lch_batch`); komşu
+çiftlerin toplu fonksiyonları kendi modüllerindedir.
+
+Kullanım:
+    from donusumler import convert, explain_conversion
+    lch = convert(goruntu, 'rgb', 'lch')
+    print(explain_conversion('hsv', 'lch'))
+"""
+
+import numpy as np
+from collections import deque
+from functools import lru_cache, partial
+from .kodlama import encoding_dtype
+from .yardimci import apply_blocked, as_color_array, input_scale, rgb_input_scale, work_dtype, BLOK_PIKSEL
+from .rgb_hsv import _rgb_to_hsv_kernel, _hsv_to_rgb_kernel
+from .rgb_hsl import _rgb_to_hsl_kernel, _hsl_to_rgb_kernel
+from .rgb_xyz import _rgb_to_xyz_kernel, _xyz_to_rgb_kernel
+from .xyz_lab import _xyz_to_lab_kernel, _lab_to_xyz_kernel
+from .rgb_lab import _rgb_to_lab_kernel, _lab_to_rgb_kernel
+from .lab_lch import _lab_to_lch_kernel, _lch_to_lab_kernel
+
+RENK_UZAYLARI = ('rgb', 'hsv', 'hsl', 'xyz', 'lab', 'lch')
+
+# (kaynak, hedef) → blok çekirdeği. RGB ↔ LAB için birleşik (tek geçiş)
+# çekirdek doğrudan kenar olarak bulunur; BFS onu XYZ üzerinden iki adıma
+# tercih eder. Sıra, eşit uzunluktaki yollar arasındaki seçimi belirler.
+KENARLAR = {
+    ('rgb', 'lab'): _rgb_to_lab_kernel,
+    ('lab', 'rgb'): _lab_to_rgb_kernel,
+    ('rgb', 'hsv'): _rgb_to_hsv_kernel,
+    ('hsv', 'rgb'): _hsv_to_rgb_kernel,
+    ('rgb', 'hsl'): _rgb_to_hsl_kernel,
+    ('hsl', 'rgb'): _hsl_to_rgb_kernel,
+    ('rgb', 'xyz'): _rgb_to_xyz_kernel,
+    ('xyz', 'rgb'): _xyz_to_rgb_kernel,
+    ('xyz', 'lab'): _xyz_to_lab_kernel,
+    ('lab', 'xyz'): _lab_to_xyz_kernel,
+    ('lab', 'lch'): _lab_to_lch_kernel,
+    ('lch', 'lab'): _lch_to_lab_kernel,
+}
+
+# RGB girdisinin ölçeğini `olcek` parametresiyle alan çekirdekler
+# (diğer RGB çekirdekleri ölçeği girdi veri tipinden kendileri bulur)
+_OLCEKLI = {('rgb', 'hsv'), ('rgb', 'hsl')}
+
+
+def _space(ad: str) -> str:
+    """Uzay adını doğrular ve küçük harfe çevirir."""
+    uzay = ad.lower()
+    if uzay not in RENK_UZAYLARI:
+        raise ValueError(f"Bilinmeyen renk uzayı: {ad}. Seçenekler: {RENK_UZAYLARI}")
+    return uzay
+
+
+@lru_cache(maxsize=None)
+def plan_conversion(src: str, dst: str) -> tuple:
+    """
+    Kaynak uzaydan hedef uzaya en az adımlı dönüşüm yolunu bulur (BFS).
+    
+    Args:
+        src: Kaynak uzay ('rgb', 'hsv', 'hsl', 'xyz', 'lab', 'lch')
+        dst: Hedef uzay
+    
+    Returns:
+        tuple: ((kaynak, hedef), ...) adımları; src == dst ise boş
+    """
+    src, dst = _space(src), _space(dst)
+    onceki = {src: None}
+    kuyruk = deque([src])
+    while kuyruk:
+        uzay = kuyruk.popleft()
+        if uzay == dst:
+            break
+        for kaynak, hedef in KENARLAR:
+            if kaynak == uzay and hedef not in onceki:
+                onceki[hedef] = uzay
+                kuyruk.append(hedef)
+    
+    if dst not in onceki:
+        raise ValueError(f"{src} → {dst} için dönüşüm yolu yok")
+    
+    adimlar = []
+    uzay = dst
+    while onceki[uzay] is not None:
+        adimlar.append((onceki[uzay], uzay))
+        uzay = onceki[uzay]
+    return tuple(reversed(adimlar))
+
+
+def _step_dtype(hedef: str, tip: type) -> np.dtype:
+    """Bir adımın ara tampon veri tipi: RGB adımları uint8, diğerleri `tip`."""
+    return np.dtype(np.uint8) if hedef == 'rgb' else np.dtype(tip)
+
+
+def _fused_kernel(adimlar: tuple, girdi_dtype):
+    """
+    Adım çekirdeklerini tek bir blok çekirdeğinde birleştirir.
+    
+    Her ara adım blok boyutunda bir tampona yazar, son adım doğrudan
+    `cikti` dilimine yazar. Tamponlar ilk blokta, çıktının hesap
+    hassasiyetine göre (bkz. `work_dtype`) bir kez ayrılır.
+    
+    Args:
+        adimlar: `plan_conversion` sonucu
+        girdi_dtype: Görüntünün veri tipi (ilk RGB adımının ölçeği için)
+    
+    Returns:
+        callable: kernel(blok, cikti)
+    """
+    cekirdekler = []
+    for sira, adim in enumerate(adimlar):
+        cekirdek = KENARLAR[adim]
+        if adim in _OLCEKLI:
+            # Ara RGB tamponları uint8 olduğundan ölçek yalnızca ilk adımda farklıdır
+            olcek = 255 / input_scale(girdi_dtype) if sira == 0 else 1.0
+            cekirdek = partial(cekirdek, olcek=olcek)
+        cekirdekler.append(cekirdek)
+    
+    tamponlar = []
+    
+    def _kernel(blok: np.ndarray, cikti: np.ndarray):
+        if not tamponlar:
+            tip = work_dtype(cikti)
+            tamponlar.extend(np.empty((BLOK_PIKSEL, 3), dtype=_step_dtype(hedef, tip))
+                             for _, hedef in adimlar[:-1])
+        n = blok.shape[0]
+        for cekirdek, tampon in zip(cekirdekler, tamponlar):
+            ara = tampon[:n]
+            cekirdek(blok, ara)
+            blok = ara
+        cekirdekler[-1](blok, cikti)
+    
+    return _kernel
+
+
+def convert(image: np.ndarray, src: str = 'rgb', dst: str = 'lab', out: np.ndarray = None,
+            encoding: str = 'float32') -> np.ndarray:
+    """
+    Görüntüyü herhangi iki renk uzayı arasında tek geçişte dönüştürür.
+    
+    Yol `plan_conversion` ile seçilir, adımlar blok başına birleştirilir.
+    Girdi ve çıktı ölçekleri tek adımlı görüntü fonksiyonlarıyla aynıdır
+    (ör. HSV: H 0-360, S ve V 0-255).
+    
+    Args:
+        image: Kaynak uzaydaki görüntü (H, W, 3)
+        src: Kaynak uzay ('rgb', 'hsv', 'hsl', 'xyz', 'lab', 'lch')
+        dst: Hedef uzay
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması (bkz. `kodlama`); hedef RGB ise
+                  çıktı her zaman uint8'dir
+    
+    Returns:
+        np.ndarray: Hedef uzaydaki görüntü (H, W, 3); src == dst ise kopya
+    """
+    image = np.asarray(image)
+    adimlar = plan_conversion(src, dst)
+    if not adimlar:
+        if out is None:
+            return image.copy()
+        out[...] = image
+        return out
+    
+    if adimlar[0][0] == 'rgb':
+        rgb_input_scale(image)  # 0-255 ölçekli float girdiyi reddet
+    hedef = adimlar[-1][1]
+    if hedef == 'rgb':
+        return apply_blocked(_fused_kernel(adimlar, image.dtype), image, np.uint8, out=out)
+    return apply_blocked(_fused_kernel(adimlar, image.dtype), image, encoding_dtype(encoding),
+                         out=out, space=hedef)
+
+
+# Toplu fonksiyonlarda skaler fonksiyonlarla aynı birimler: HSV / HSL'nin
+# S, V ve L kanalları 0-1 (görüntü fonksiyonlarında 0-255)
+_ORAN_KANALLI = ('hsv', 'hsl')
+
+
+def convert_batch(colors, src: str = 'rgb', dst: str = 'lab') -> np.ndarray:
+    """
+    N rengi tek çağrıda herhangi iki renk uzayı arasında dönüştürür.
+    
+    `convert` ile aynı plan kullanılır; birimler ise skaler ve toplu
+    (`*_batch`) fonksiyonlarla aynıdır: HSV / HSL'de S, V, L 0-1, RGB
+    girdisi tamsayıda 0-255, float'ta 0-1, RGB çıktısı uint8.
+    
+    Args:
+        colors: Kaynak uzaydaki renkler (N, 3)
+        src: Kaynak uzay
+        dst: Hedef uzay
+    
+    Returns:
+        np.ndarray: Hedef uzaydaki renkler (N, 3); RGB ise uint8, diğerleri float32
+    """
+    renkler = as_color_array(colors)
+    if _space(src) in _ORAN_KANALLI:
+        renkler = renkler.astype(np.float32)
+        renkler[:, 1:] *= 255
+    sonuc = convert(renkler, src, dst)
+    if _space(dst) in _ORAN_KANALLI:
+        sonuc = sonuc.astype(np.float32, copy=False)
+        sonuc[:, 1:] /= 255
+    return sonuc
+
+
+def _batch_function(src: str, dst: str):
+    """`convert_batch(colors, src, dst)` için adlandırılmış toplu fonksiyon üretir."""
+    def fonksiyon(colors) -> np.ndarray:
+        return convert_batch(colors, src, dst)
+    
+    yol = ' → '.join([src] + [hedef for _, hedef in plan_conversion(src, dst)])
+    fonksiyon.__name__ = fonksiyon.__qualname__ = f'{src}_to_{dst}_batch'
+    fonksiyon.__doc__ = (f"N rengi tek çağrıda dönüştür: {src.upper()} → {dst.upper()} "
+                         f"(yol: {yol}; birimler için bkz. `convert_batch`).")
+    return fonksiyon
+
+
+# Komşu olmayan çiftlerin toplu fonksiyonları (komşu çiftler kendi modüllerinde)
+BATCH_FONKSIYONLARI = tuple(f'{kaynak}_to_{hedef}_batch'
+                            for kaynak in RENK_UZAYLARI for hedef in RENK_UZAYLARI
+                            if kaynak != hedef and (kaynak, hedef) not in KENARLAR)
+for _ad in BATCH_FONKSIYONLARI:
+    _kaynak, _hedef = _ad[:-len('_batch')].split('_to_')
+    globals()[_ad] = _batch_function(_kaynak, _hedef)
+del _ad, _kaynak, _hedef
+
+
+def explain_conversion(src: str, dst: str, encoding: str = 'float32') -> str:
+    """
+    Seçilen dönüşüm planını okunabilir metin olarak döndürür.
+    
+    Her adım için kullanılan çekirdek ve ara tamponun veri tipi ile blok
+    başına boyutu listelenir (hata ayıklama ve performans incelemesi için).
+    
+    Args:
+        src: Kaynak uzay
+        dst: Hedef uzay
+        encoding: Çıktı kodlaması (ara tampon hassasiyetini belirler)
+    
+    Returns:
+        str: Plan açıklaması
+    """
+    adimlar = plan_conversion(src, dst)
+    if not adimlar:
+        return f"{_space(src)} → {_space(dst)}: dönüşüm yok (kopya)"
+    
+    tip = np.float64 if encoding_dtype(encoding) == np.float64 else np.float32
+    yol = ' → '.join([adimlar[0][0]] + [hedef for _, hedef in adimlar])
+    satirlar = [f"{yol} ({len(adimlar)} adım, blok: {BLOK_PIKSEL} piksel)"]
+    for sira, (kaynak, hedef) in enumerate(adimlar, 1):
+        if sira < len(adimlar):
+            ara_tip = _step_dtype(hedef, tip)
+            yer = f"ara tampon {ara_tip.name} ({BLOK_PIKSEL * 3 * ara_tip.itemsize // 1024} KB)"
+        else:
+            yer = f"çıktı ({'uint8' if hedef == 'rgb' else encoding})"
+        satirlar.append(f"  {sira}. {KENARLAR[(kaynak, hedef)].__name__:22s} → {yer}")
+    return '\n'.join(satirlar)
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    from .rgb_hsv import rgb_image_to_hsv, hsv_image_to_rgb
+    from .rgb_lab import rgb_image_to_lab
+    from .lab_lch import lab_image_to_lch
+    
+    print("=== Dönüşüm Grafı Testi ===\n")
+    
+    for src, dst in (('rgb', 'lch'), ('hsv', 'lch'), ('xyz', 'hsl'), ('lch', 'rgb')):
+        print(explain_conversion(src, dst))
+    
+    goruntu = np.random.default_rng(0).integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+    
+    # Birleşik yol, görüntü fonksiyonlarının zinciriyle aynı olmalı
+    esit = np.array_equal(convert(goruntu, 'rgb', 'lch'),
+                          lab_image_to_lch(rgb_image_to_lab(goruntu)))
+    print(f"\nrgb → lch = rgb_image_to_lab + lab_image_to_lch: {'✓' if esit else '✗'}")
+    
+    hsv = rgb_image_to_hsv(goruntu)
+    esit = np.array_equal(convert(hsv, 'hsv', 'lab', encoding='uint8'),
+                          rgb_image_to_lab(hsv_image_to_rgb(hsv), encoding='uint8'))
+    print(f"hsv → lab (uint8) = hsv_image_to_rgb + rgb_image_to_lab: {'✓' if esit else '✗'}")
+    
+    # Toplu fonksiyonlar: komşu çiftlerin toplu fonksiyonlarının zinciriyle aynı
+    import donusumler
+    renkler = goruntu[0, :1000]
+    uyumlu = []
+    for ad in BATCH_FONKSIYONLARI:
+        kaynak, hedef = ad[:-len('_batch')].split('_to_')
+        girdi = renkler if kaynak == 'rgb' else convert_batch(renkler, 'rgb', kaynak)
+        zincir = girdi
+        for adim in plan_conversion(kaynak, hedef):
+            zincir = getattr(donusumler, f'{adim[0]}_to_{adim[1]}_batch')(zincir)
+        uyumlu.append(np.allclose(getattr(donusumler, ad)(girdi), zincir, atol=1e-4))
+    print(f"{len(BATCH_FONKSIYONLARI)} toplu fonksiyon = komşu toplu fonksiyon zinciri: "
+          f"{'✓' if all(uyumlu) else '✗'}")
+    
+    # Gidiş-dönüş (her uzay için RGB → uzay → RGB)
+    print()
+    for uzay in RENK_UZAYLARI[1:]:
+        geri = convert(convert(goruntu, 'rgb', uzay), uzay, 'rgb')
+        print(f"rgb → {uzay} → rgb en büyük fark: {np.abs(geri.astype(int) - goruntu).max()}")
+    
+    print()
+    # Tepe bellek ve süre: zincir (tam boy ara dizi) / birleşik
+    for ad, fonksiyon in (('zincir', lambda: lab_image_to_lch(rgb_image_to_lab(goruntu))),
+                          ('birleşik', lambda: convert(goruntu, 'rgb', 'lch'))):
+        tracemalloc.start()
+        bas = time.perf_counter()
+        fonksiyon()
+        sure = time.perf_counter() - bas
+        tepe = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"1080p rgb → lch {ad:8s}: {sure * 1000:4.0f} ms, tepe bellek {tepe / 1e6:5.1f} MB")
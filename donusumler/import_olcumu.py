@@ -0,0 +1,67 @@
+"""
+İçe Aktarma Süresi Ölçümü
+=========================
+Tembel (lazy) yüklemenin başlangıç süresine etkisini ölçer. Her senaryo
+temiz bir Python sürecinde birkaç kez çalıştırılır ve en kısa süre alınır.
+
+Senaryolar:
+- tembel: `from donusumler import rgb_to_lab` (yalnızca gereken modüller)
+- hepsi: tüm dışa açılan adlara erişim (eski, her şeyi yükleyen __init__)
+
+NumPy'nin kendi yükleme süresi ayrıca ölçülür ve paket süresinden ayrılır.
+
+Çalıştırma: python -m donusumler.import_olcumu
+"""
+
+import os
+import subprocess
+import sys
+
+SENARYOLAR = {
+    'tembel': "from donusumler import rgb_to_lab",
+    'hepsi': "import donusumler; [getattr(donusumler, ad) for ad in donusumler.__all__]",
+}
+
+_OLCUM_KODU = """
+import time
+t0 = time.perf_counter()
+import numpy
+t1 = time.perf_counter()
+{kod}
+t2 = time.perf_counter()
+import sys
+print(t1 - t0, t2 - t1, sum(m.startswith('donusumler') for m in sys.modules))
+"""
+
+
+def measure(kod: str, tekrar: int = 7) -> tuple:
+    """
+    Bir içe aktarma ifadesini temiz süreçlerde ölçer.
+    
+    Args:
+        kod: Ölçülecek Python kodu
+        tekrar: Süreç sayısı (en kısa süre raporlanır)
+    
+    Returns:
+        tuple: (numpy_sn, paket_sn, yüklenen_modül_sayısı)
+    """
+    kok = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sonuclar = []
+    for _ in range(tekrar):
+        cikti = subprocess.run([sys.executable, "-c", _OLCUM_KODU.format(kod=kod)],
+                               cwd=kok, capture_output=True, text=True, check=True).stdout
+        numpy_sn, paket_sn, modul = cikti.split()
+        sonuclar.append((float(numpy_sn), float(paket_sn), int(modul)))
+    return min(sonuclar, key=lambda s: s[1])
+
+
+if __name__ == "__main__":
+    print("=== İçe Aktarma Süresi ===\n")
+    
+    olcumler = {ad: measure(kod) for ad, kod in SENARYOLAR.items()}
+    for ad, (numpy_sn, paket_sn, modul) in olcumler.items():
+        print(f"{ad:7s}: paket {paket_sn * 1000:6.1f} ms  "
+              f"(numpy {numpy_sn * 1000:.1f} ms, {modul} modül)")
+    
+    kazanc = olcumler['hepsi'][1] / max(olcumler['tembel'][1], 1e-9)
+    print(f"\nTembel yükleme paket süresini {kazanc:.1f}× kısaltıyor.")
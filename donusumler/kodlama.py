@@ -0,0 +1,137 @@
+"""
+Çıktı Kodlamaları (Encodings)
+=============================
+Görüntü dönüşümlerinin sonucu hangi hassasiyet ve biçimde saklayacağını
+belirler:
+
+- float64: Referans çalışmalar için (hesap da float64 ile yapılır)
+- float32: Varsayılan
+- float16: Yarı boyut (L* ≈ 100 civarında 0.06 çözünürlük)
+- uint8: OpenCV 8-bit uyumlu (kaynak görüntüyle aynı boyut)
+
+uint8 kodlaması uzaya göre OpenCV'nin 8-bit karşılığını izler:
+- lab: L·255/100, a+128, b+128 (COLOR_BGR2LAB)
+- hsv / hsl: H/2 (0-180), S ve V/L 0-255 (COLOR_BGR2HSV / HLS; kanal
+  sırası H, S, V/L olarak korunur)
+- xyz: X, Y, Z · 255/100
+- lch: L·255/100, C (0-255'e kırpılır), h/2 (0-180)
+
+Kompakt kodlamalar blok blok yazılır; tam hassasiyetli, görüntü boyutunda
+bir ara dizi oluşturulmaz.
+"""
+
+import numpy as np
+
+KODLAMALAR = ('float64', 'float32', 'float16', 'uint8')
+
+# Uzay başına uint8 kodlaması: kodlanmış = değer × ölçek + kaydırma
+UINT8_KODLARI = {
+    'lab': ((255 / 100, 1.0, 1.0), (0.0, 128.0, 128.0)),
+    'hsv': ((0.5, 1.0, 1.0), (0.0, 0.0, 0.0)),
+    'hsl': ((0.5, 1.0, 1.0), (0.0, 0.0, 0.0)),
+    'xyz': ((255 / 100, 255 / 100, 255 / 100), (0.0, 0.0, 0.0)),
+    'lch': ((255 / 100, 1.0, 0.5), (0.0, 0.0, 0.0)),
+}
+
+# Açı kanalı: 360° → 180 değeri 0'a sarılır (OpenCV'deki gibi H < 180)
+_ACI_KANALI = {'hsv': 0, 'hsl': 0, 'lch': 2}
+
+
+def encoding_dtype(encoding: str) -> np.dtype:
+    """
+    Kodlama adını çıktı veri tipine çevirir.
+    
+    Args:
+        encoding: 'float64', 'float32', 'float16' veya 'uint8'
+    
+    Returns:
+        np.dtype: Çıktı veri tipi
+    """
+    if encoding not in KODLAMALAR:
+        raise ValueError(f"Bilinmeyen kodlama: {encoding}. Seçenekler: {KODLAMALAR}")
+    return np.dtype(encoding)
+
+
+def _uint8_kodu(space: str):
+    """Uzayın uint8 ölçek ve kaydırma dizilerini (float32) döndürür."""
+    if space not in UINT8_KODLARI:
+        raise ValueError(f"'{space}' uzayı için uint8 kodlaması yok")
+    olcek, kaydirma = UINT8_KODLARI[space]
+    return np.array(olcek, dtype=np.float32), np.array(kaydirma, dtype=np.float32)
+
+
+def encode_block(blok: np.ndarray, cikti: np.ndarray, space: str):
+    """
+    (N, 3) float32 bloğu çıktı dilimine hedef kodlamayla yazar.
+    
+    Args:
+        blok: Dönüşüm sonucu (N, 3), float32 (üzerine yazılabilir)
+        cikti: Hedef dilim (N, 3): float16 veya uint8
+        space: Renk uzayı ('lab', 'hsv', 'hsl', 'xyz', 'lch')
+    """
+    if cikti.dtype != np.uint8:
+        cikti[...] = blok
+        return
+    olcek, kaydirma = _uint8_kodu(space)
+    blok *= olcek
+    blok += kaydirma
+    np.rint(blok, out=blok)
+    if space in _ACI_KANALI:
+        aci = blok[:, _ACI_KANALI[space]]
+        aci -= np.float32(180) * (aci >= 180)
+    np.clip(blok, 0, 255, out=blok)
+    cikti[...] = blok
+
+
+def decode_image(image: np.ndarray, space: str, out: np.ndarray = None) -> np.ndarray:
+    """
+    Kodlanmış bir görüntüyü float32 değerlere geri çevirir.
+    
+    uint8 girdide `encode_block` ölçeği geri alınır (ör. LAB için
+    L·100/255, a-128, b-128); float girdiler yalnızca float32'ye çevrilir.
+    
+    Args:
+        image: Kodlanmış görüntü (..., 3)
+        space: Renk uzayı ('lab', 'hsv', 'hsl', 'xyz', 'lch')
+        out: İsteğe bağlı float32 çıktı tamponu
+    
+    Returns:
+        np.ndarray: Çözülmüş görüntü (..., 3), float32
+    """
+    from .yardimci import apply_blocked
+    
+    image = np.asarray(image)
+    if image.dtype == np.uint8:
+        olcek, kaydirma = _uint8_kodu(space)
+        ters = np.float32(1) / olcek
+        
+        def _kernel(blok: np.ndarray, cikti: np.ndarray):
+            cikti[...] = blok
+            cikti -= kaydirma
+            cikti *= ters
+    else:
+        def _kernel(blok: np.ndarray, cikti: np.ndarray):
+            cikti[...] = blok
+    
+    return apply_blocked(_kernel, image, np.float32, out=out)
+
+
+if __name__ == "__main__":
+    from .rgb_lab import rgb_image_to_lab
+    
+    print("=== Çıktı Kodlamaları Testi ===\n")
+    
+    goruntu = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    referans = rgb_image_to_lab(goruntu, encoding='float64')
+    
+    for encoding in KODLAMALAR:
+        lab = rgb_image_to_lab(goruntu, encoding=encoding)
+        fark = np.abs(decode_image(lab, 'lab') - referans).max(axis=(0, 1))
+        print(f"{encoding:8s}: {lab.nbytes / 1e6:5.1f} MB  "
+              f"en büyük fark L={fark[0]:.4f} a={fark[1]:.4f} b={fark[2]:.4f}")
+    
+    import cv2
+    cv_lab = cv2.cvtColor(goruntu[..., ::-1].copy(), cv2.COLOR_BGR2LAB)
+    bizim = rgb_image_to_lab(goruntu, encoding='uint8')
+    fark = np.abs(bizim.astype(np.int16) - cv_lab).max()
+    print(f"\nOpenCV COLOR_BGR2LAB ile en büyük fark (uint8): {fark}")
@@ -0,0 +1,150 @@
+"""
+RGB → LAB Arama Küpü
+====================
+8-bit girdi için olası tüm RGB üçlülerinin (256³ ≈ 16.7M) LAB karşılığını
+bir kez hesaplayıp `.npy` dosyasına yazar. Dönüşüm sırasında tablo bellek
+eşlemeli (memory-mapped) açılır ve görüntü tek bir indeksleme (gather)
+işlemiyle dönüştürülür; küp kök hesabı tekrar yapılmaz.
+
+Aynı dosyayı açan tüm işlemler tabloyu işletim sisteminin sayfa önbelleği
+üzerinden paylaşır.
+
+Kodlamalar:
+- int16: LAB × 100 yuvarlanmış (0.01 çözünürlük)
+- float16: LAB doğrudan (L* ≈ 100 civarında 0.06 çözünürlük)
+
+Her girdi (L, a, b, 0) biçiminde 4 × 16 bit = 8 bayttır (~134 MB). Dolgu
+kanalı sayesinde bir piksel tek bir 64-bit okuma ile toplanır ve hiçbir
+girdi önbellek satırı sınırını aşmaz.
+"""
+
+import numpy as np
+from .rgb_lab import rgb_image_to_lab
+from .kodlama import encoding_dtype
+from .yardimci import apply_blocked
+
+# int16 kodlamasında LAB değerlerinin ölçeği (0.01 çözünürlük)
+INT16_OLCEK = 100
+
+KUP_BICIMI = (256, 256, 256, 4)
+
+KUP_KODLAMALARI = ('int16', 'float16')
+
+
+def build_lab_cube(path: str, kodlama: str = 'int16') -> np.ndarray:
+    """
+    256³ RGB → LAB tablosunu oluşturup `.npy` dosyasına yazar.
+    
+    Değerler `rgb_image_to_lab` ile (yani `rgb_to_lab` anlamıyla) R
+    dilimleri halinde hesaplanır; tablo bellekte bütün olarak tutulmaz.
+    
+    Args:
+        path: Hedef `.npy` dosya yolu
+        kodlama: 'int16' (LAB × 100) veya 'float16'
+    
+    Returns:
+        np.ndarray: Yazılan tablo (256, 256, 256, 4), bellek eşlemeli
+    """
+    if kodlama not in KUP_KODLAMALARI:
+        raise ValueError(f"Bilinmeyen kodlama: {kodlama}. Seçenekler: {KUP_KODLAMALARI}")
+    
+    kup = np.lib.format.open_memmap(path, mode='w+', dtype=np.dtype(kodlama),
+                                    shape=KUP_BICIMI)
+    
+    # Bir R dilimindeki tüm (G, B) çiftleri
+    g, b = np.meshgrid(np.arange(256, dtype=np.uint8),
+                       np.arange(256, dtype=np.uint8), indexing='ij')
+    dilim = np.empty((256, 256, 3), dtype=np.uint8)
+    dilim[..., 1] = g
+    dilim[..., 2] = b
+    
+    for r in range(256):
+        dilim[..., 0] = r
+        lab = rgb_image_to_lab(dilim)
+        if kodlama == 'int16':
+            lab *= INT16_OLCEK
+            np.rint(lab, out=lab)
+        kup[r, ..., :3] = lab
+        kup[r, ..., 3] = 0
+    
+    kup.flush()
+    return kup
+
+
+def load_lab_cube(path: str) -> np.ndarray:
+    """
+    LAB küpünü salt okunur, bellek eşlemeli olarak açar.
+    
+    Args:
+        path: `build_lab_cube` ile yazılmış `.npy` dosyası
+    
+    Returns:
+        np.ndarray: Tablo (256, 256, 256, 4)
+    """
+    kup = np.load(path, mmap_mode='r')
+    if kup.shape != KUP_BICIMI or kup.dtype.name not in KUP_KODLAMALARI:
+        raise ValueError(f"Geçersiz LAB küpü: {kup.shape}, {kup.dtype}")
+    return kup
+
+
+def rgb_image_to_lab_cube(image: np.ndarray, kup: np.ndarray,
+                          out: np.ndarray = None, encoding: str = 'float32') -> np.ndarray:
+    """
+    uint8 RGB görüntüyü LAB küpünden okuyarak dönüştür.
+    
+    Her piksel için düz indeks (R << 16 | G << 8 | B) hesaplanır ve tablo,
+    girdiler 64-bit sözcük olarak görülerek tek bir gather ile toplanır.
+    
+    Args:
+        image: RGB görüntü (H, W, 3), uint8
+        kup: `load_lab_cube` ile açılmış tablo
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması (bkz. `kodlama`)
+    
+    Returns:
+        np.ndarray: LAB görüntü (H, W, 3), `encoding` veri tipinde
+    """
+    image = np.asarray(image)
+    if image.dtype != np.uint8:
+        raise TypeError(f"LAB küpü yalnızca uint8 girdi kabul eder: {image.dtype}")
+    
+    tablo = np.asarray(kup).reshape(-1, 4).view(np.int64).ravel()
+    olcek = np.float32(1 / INT16_OLCEK) if kup.dtype == np.int16 else None
+    
+    def _kernel(blok: np.ndarray, cikti: np.ndarray):
+        indeks = blok[:, 0].astype(np.int32) << 16
+        indeks |= blok[:, 1].astype(np.int32) << 8
+        indeks |= blok[:, 2]
+        girdiler = np.take(tablo, indeks).view(kup.dtype).reshape(-1, 4)
+        cikti[...] = girdiler[:, :3]
+        if olcek is not None:
+            cikti *= olcek
+    
+    return apply_blocked(_kernel, image, encoding_dtype(encoding), out=out, space='lab')
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    from .rgb_lab import rgb_to_lab
+    
+    print("=== RGB → LAB Arama Küpü Testi ===\n")
+    
+    yol = os.path.join(tempfile.gettempdir(), "rgb_lab_kupu.npy")
+    bas = time.perf_counter()
+    build_lab_cube(yol)
+    print(f"Küp oluşturuldu: {yol} ({time.perf_counter() - bas:.1f} sn)")
+    
+    kup = load_lab_cube(yol)
+    goruntu = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    
+    bas = time.perf_counter()
+    lab = rgb_image_to_lab_cube(goruntu, kup)
+    sure = time.perf_counter() - bas
+    print(f"Küp ile dönüşüm: {goruntu.shape[0] * goruntu.shape[1] / sure / 1e6:.1f} MP/sn")
+    
+    ornek = goruntu[::97, ::89].reshape(-1, 3)
+    skaler = np.array([rgb_to_lab(*(c / 255.0)) for c in ornek])
+    fark = np.abs(lab[::97, ::89].reshape(-1, 3) - skaler).max()
+    print(f"Skaler rgb_to_lab ile en büyük fark: {fark:.4f}")
@@ -15,6 +15,8 @@ Dönüşüm:
 
 import numpy as np
 import math
+from .kodlama import encoding_dtype
+from .yardimci import apply_blocked, as_color_array, work_dtype
 
 
 def lab_to_lch(L: float, a: float, b: float) -> tuple:
@@ -74,30 +76,88 @@ def lch_to_lab(L: float, C: float, h: float) -> tuple:
     return (L, a, b)
 
 
-def lab_image_to_lch(lab_image: np.ndarray) -> np.ndarray:
-    """LAB görüntüyü LCH'ye dönüştür."""
-    lch_image = np.zeros_like(lab_image, dtype=np.float32)
+def _lab_to_lch_kernel(blok: np.ndarray, cikti: np.ndarray):
+    """(N, 3) LAB bloğunu LCH'ye çevirip `cikti` içine yazar."""
+    blok = blok.astype(work_dtype(cikti), copy=False)
+    a, b = blok[:, 1], blok[:, 2]
     
-    for i in range(lab_image.shape[0]):
-        for j in range(lab_image.shape[1]):
-            L, a, b = lab_image[i, j]
-            L_out, C, h = lab_to_lch(L, a, b)
-            lch_image[i, j] = [L_out, C, h]
+    h = np.degrees(np.arctan2(b, a))
+    h += np.float32(360) * (h < 0)  # 0-360 aralığına getir
     
-    return lch_image
+    cikti[:, 0] = blok[:, 0]
+    cikti[:, 1] = np.hypot(a, b)
+    cikti[:, 2] = h
 
 
-def lch_image_to_lab(lch_image: np.ndarray) -> np.ndarray:
-    """LCH görüntüyü LAB'a dönüştür."""
-    lab_image = np.zeros_like(lch_image, dtype=np.float32)
+def _lch_to_lab_kernel(blok: np.ndarray, cikti: np.ndarray):
+    """(N, 3) LCH bloğunu LAB'a çevirip `cikti` içine yazar."""
+    blok = blok.astype(work_dtype(cikti), copy=False)
+    C = blok[:, 1]
+    h_rad = np.radians(blok[:, 2])
     
-    for i in range(lch_image.shape[0]):
-        for j in range(lch_image.shape[1]):
-            L, C, h = lch_image[i, j]
-            L_out, a, b = lch_to_lab(L, C, h)
-            lab_image[i, j] = [L_out, a, b]
+    cikti[:, 0] = blok[:, 0]
+    cikti[:, 1] = C * np.cos(h_rad)
+    cikti[:, 2] = C * np.sin(h_rad)
+
+
+def lab_image_to_lch(lab_image: np.ndarray, out: np.ndarray = None,
+                     encoding: str = 'float32') -> np.ndarray:
+    """
+    LAB görüntüyü LCH'ye dönüştür (vektörel).
+    
+    Args:
+        lab_image: LAB görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması (bkz. `kodlama`); 'uint8' için h/2
     
-    return lab_image
+    Returns:
+        np.ndarray: LCH görüntü (H, W, 3), `encoding` veri tipinde - h: 0-360
+    """
+    return apply_blocked(_lab_to_lch_kernel, lab_image, encoding_dtype(encoding),
+                         out=out, space='lch')
+
+
+def lch_image_to_lab(lch_image: np.ndarray, out: np.ndarray = None,
+                     encoding: str = 'float32') -> np.ndarray:
+    """
+    LCH görüntüyü LAB'a dönüştür (vektörel).
+    
+    Args:
+        lch_image: LCH görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması (bkz. `kodlama`); 'uint8' OpenCV LAB
+    
+    Returns:
+        np.ndarray: LAB görüntü (H, W, 3), `encoding` veri tipinde
+    """
+    return apply_blocked(_lch_to_lab_kernel, lch_image, encoding_dtype(encoding),
+                         out=out, space='lab')
+
+
+def lab_to_lch_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda LAB'dan LCH'ye dönüştür.
+    
+    Args:
+        colors: LAB renkler (N, 3)
+    
+    Returns:
+        np.ndarray: LCH renkler (N, 3), float32
+    """
+    return lab_image_to_lch(as_color_array(colors))
+
+
+def lch_to_lab_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda LCH'den LAB'a dönüştür.
+    
+    Args:
+        colors: LCH renkler (N, 3)
+    
+    Returns:
+        np.ndarray: LAB renkler (N, 3), float32
+    """
+    return lch_image_to_lab(as_color_array(colors))
 
 
 def get_hue_name(h: float) -> str:
@@ -119,6 +179,70 @@ def get_hue_name(h: float) -> str:
     return "Bilinmiyor"
 
 
+# get_hue_name sonuçları için etiket numaraları (etiket = listedeki sıra)
+HUE_NAMES = ("Kırmızı", "Turuncu", "Sarı", "Yeşil", "Cyan", "Mavi", "Mor/Magenta")
+
+# Chroma eşiğinin altındaki (renksiz) pikseller için etiket
+ACHROMATIC_LABEL = 255
+
+# Tam sayı derece → etiket tablosu (get_hue_name sınırları tam sayı olduğundan
+# 360 kutu yeterlidir)
+_HUE_TABLOSU = np.array([HUE_NAMES.index(get_hue_name(h)) for h in range(360)],
+                        dtype=np.uint8)
+
+
+def hue_label_image(lch_image: np.ndarray, min_chroma: float = 0.0) -> np.ndarray:
+    """
+    LCH görüntüden piksel bazında renk adı etiket haritası üretir.
+    
+    Her piksel `get_hue_name` ile aynı sınırlara göre sınıflanır; sonuç,
+    `HUE_NAMES` içindeki sıraya karşılık gelen uint8 etiketlerdir.
+    Sınıflama önceden hesaplanmış 360 kutulu tablodan tek okuma ile yapılır.
+    Hue önce 0-360 aralığına sarılıp aşağı yuvarlanır (negatif açılar da
+    doğru kutuya düşer); NaN / sonsuz hue ACHROMATIC_LABEL alır.
+    
+    Args:
+        lch_image: LCH görüntü (H, W, 3)
+        min_chroma: Bu değerin altındaki C* için ACHROMATIC_LABEL atanır
+    
+    Returns:
+        np.ndarray: Etiket haritası (H, W), uint8
+    """
+    lch_image = np.asarray(lch_image)
+    ton = lch_image[..., 2]
+    gecersiz = ~np.isfinite(ton)
+    if gecersiz.any():
+        ton = np.where(gecersiz, 0, ton)
+    
+    kutu = np.floor(np.mod(ton, 360.0)).astype(np.int32)
+    kutu %= 360  # np.mod çok küçük negatif açılarda 360.0 verebilir
+    etiketler = _HUE_TABLOSU[kutu]
+    etiketler[gecersiz] = ACHROMATIC_LABEL
+    
+    if min_chroma > 0:
+        etiketler[lch_image[..., 1] < min_chroma] = ACHROMATIC_LABEL
+    
+    return etiketler
+
+
+def hue_percentages(etiketler: np.ndarray) -> dict:
+    """
+    Etiket haritasındaki her renk adının yüzdesini hesaplar.
+    
+    Args:
+        etiketler: `hue_label_image` çıktısı
+    
+    Returns:
+        dict: {renk_adı: yüzde}; renksiz pikseller "Renksiz" altında
+    """
+    sayilar = np.bincount(np.asarray(etiketler).ravel(), minlength=ACHROMATIC_LABEL + 1)
+    toplam = max(int(sayilar.sum()), 1)
+    
+    yuzdeler = {ad: 100.0 * sayilar[i] / toplam for i, ad in enumerate(HUE_NAMES)}
+    yuzdeler["Renksiz"] = 100.0 * sayilar[ACHROMATIC_LABEL] / toplam
+    return yuzdeler
+
+
 # Test
 if __name__ == "__main__":
     print("=== LAB ↔ LCH Dönüşüm Testi ===\n")
@@ -145,3 +269,13 @@ if __name__ == "__main__":
         print(f"  → LAB({L2:.2f}, {a2:.2f}, {b2:.2f})")
         match = abs(L-L2) < 0.01 and abs(a-a2) < 0.01 and abs(b-b2) < 0.01
         print(f"  Doğrulama: {'✓' if match else '✗'}\n")
+    
+    # Vektörel görüntü dönüşümü ve renk adı haritası
+    lab_goruntu = np.array([[[L, a, b] for _, L, a, b in test_colors]], dtype=np.float32)
+    lch_goruntu = lab_image_to_lch(lab_goruntu)
+    print("Görüntü dönüşümü:")
+    print(f"  Geri dönüşüm farkı: {np.abs(lch_image_to_lab(lch_goruntu) - lab_goruntu).max():.2e}")
+    etiketler = hue_label_image(lch_goruntu, min_chroma=5)
+    for ad, yuzde in hue_percentages(etiketler).items():
+        if yuzde > 0:
+            print(f"  {ad}: %{yuzde:.1f}")
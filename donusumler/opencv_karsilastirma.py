@@ -2,12 +2,33 @@
 OpenCV Karşılaştırma
 ====================
 Kendi dönüşüm fonksiyonlarımızı OpenCV ile karşılaştırır.
+
+- compare_hsv / compare_lab: Birkaç seçilmiş renkte yan yana çıktı
+- benchmark: Tüm 256³ RGB küpü (veya küpün tabakalı bir örneği) üzerinde
+  HSV ve LAB yollarının kanal başına en büyük ve %99'luk hatası ile
+  MP/s hızı; sonuç JSON rapor olarak yazılabilir
+
+Hatalar float64 referansa (`encoding='float64'`) göre, bizim ölçeklerde
+ölçülür: HSV için H derece (dairesel fark), S ve V 0-255; LAB için L, a, b.
+
+Çalıştırma:
+    python -m donusumler.opencv_karsilastirma                      # seçilmiş renkler
+    python -m donusumler.opencv_karsilastirma --benchmark          # tabakalı örnek
+    python -m donusumler.opencv_karsilastirma --benchmark --tam-kup --rapor rapor.json
 """
 
+import json
+import platform
+import time
 import numpy as np
 import cv2
-from rgb_hsv import rgb_to_hsv, hsv_to_rgb
-from rgb_lab import rgb_to_lab, lab_to_rgb
+from .rgb_hsv import rgb_to_hsv, hsv_to_rgb, rgb_image_to_hsv
+from .rgb_lab import rgb_to_lab, lab_to_rgb, rgb_image_to_lab
+from .kodlama import decode_image
+
+# Küp tabakaları: her eksen 16 dilime bölünür (16³ = 4096 hücre)
+TABAKA = 16
+TABAKA_SAYISI = TABAKA ** 3
 
 
 def compare_hsv():
@@ -22,9 +43,9 @@ def compare_hsv():
         
         # OpenCV (BGR sırası!)
         bgr = np.uint8([[[b, g, r]]])
-        hsv_cv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)[0][0]
+        hsv_cv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)[0][0].astype(np.float64)
         
-        # OpenCV'de H: 0-180, S: 0-255, V: 0-255
+        # OpenCV'de H: 0-180, S: 0-255, V: 0-255 (uint8 taşmasın diye float'a çevrildi)
         h_cv = hsv_cv[0] * 2  # 0-360'a çevir
         s_cv = hsv_cv[1] / 255
         v_cv = hsv_cv[2] / 255
@@ -48,9 +69,9 @@ def compare_lab():
         
         # OpenCV (BGR sırası!)
         bgr = np.uint8([[[b, g, r]]])
-        lab_cv = cv2.cvtColor(bgr, cv2.COLOR_BGR2LAB)[0][0]
+        lab_cv = cv2.cvtColor(bgr, cv2.COLOR_BGR2LAB)[0][0].astype(np.float64)
         
-        # OpenCV'de L: 0-255, a: 0-255, b: 0-255 (128 offset)
+        # OpenCV'de L: 0-255, a: 0-255, b: 0-255 (128 offset; float'a çevrildi)
         L_cv = lab_cv[0] * 100 / 255
         a_cv = lab_cv[1] - 128
         b_cv = lab_cv[2] - 128
@@ -62,7 +83,177 @@ def compare_lab():
         print(f"  Eşleşme: {'✓' if match else '≈'}\n")
 
 
+def rgb_cube() -> np.ndarray:
+    """
+    Tüm 256³ RGB renklerini içeren görüntü.
+    
+    Returns:
+        np.ndarray: (4096, 4096, 3) uint8 RGB görüntü (her renk bir kez)
+    """
+    deger = np.arange(256, dtype=np.uint8)
+    r, g, b = np.meshgrid(deger, deger, deger, indexing='ij')
+    return np.stack([r, g, b], axis=-1).reshape(4096, 4096, 3)
+
+
+def stratified_cube_sample(ornek: int, seed: int = 0) -> np.ndarray:
+    """
+    RGB küpünden tabakalı örnek alır.
+    
+    Küp 16×16×16 hücreye bölünür ve her hücreden eşit sayıda rastgele
+    renk seçilir; böylece küçük örneklerde de koyu, doygun ve gri
+    bölgelerin hepsi temsil edilir.
+    
+    Args:
+        ornek: İstenen yaklaşık renk sayısı (4096'nın katına yuvarlanır)
+        seed: Rastgele sayı üreteci tohumu
+    
+    Returns:
+        np.ndarray: (k, 4096, 3) uint8 RGB görüntü, k = ornek // 4096 (en az 1)
+    """
+    k = max(1, ornek // TABAKA_SAYISI)
+    rng = np.random.default_rng(seed)
+    hucre = np.indices((TABAKA, TABAKA, TABAKA)).reshape(3, -1).T * (256 // TABAKA)
+    kayma = rng.integers(0, 256 // TABAKA, (k, TABAKA_SAYISI, 3))
+    return (hucre[np.newaxis] + kayma).astype(np.uint8)
+
+
+def _channel_errors(sonuc: np.ndarray, referans: np.ndarray, aci_kanali: int = None) -> dict:
+    """Kanal başına en büyük ve %99'luk mutlak hata (açı kanalı dairesel)."""
+    hata = np.abs(sonuc.reshape(-1, 3).astype(np.float64) - referans.reshape(-1, 3))
+    if aci_kanali is not None:
+        aci = hata[:, aci_kanali]
+        np.minimum(aci, 360 - aci, out=aci)
+    return {
+        'max': [round(float(d), 6) for d in hata.max(axis=0)],
+        'p99': [round(float(d), 6) for d in np.percentile(hata, 99, axis=0)],
+    }
+
+
+def _timed(fonksiyon, tekrar: int) -> tuple:
+    """Fonksiyonu `tekrar` kez çalıştırır; (son sonuç, en iyi süre) döndürür."""
+    en_iyi = np.inf
+    for _ in range(tekrar):
+        bas = time.perf_counter()
+        sonuc = fonksiyon()
+        en_iyi = min(en_iyi, time.perf_counter() - bas)
+    return sonuc, en_iyi
+
+
+def _hsv_paths(rgb: np.ndarray, bgr: np.ndarray) -> dict:
+    """HSV yolları: ad → (dönüşüm, sonucu bizim float ölçeğe çeviren fonksiyon)."""
+    sv_olcek = np.array([1, 255, 255], dtype=np.float32)
+    return {
+        'donusumler_float32': (lambda: rgb_image_to_hsv(rgb), None),
+        'donusumler_uint8': (lambda: rgb_image_to_hsv(rgb, encoding='uint8'),
+                             lambda x: decode_image(x, 'hsv')),
+        'opencv_uint8': (lambda: cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV),
+                         lambda x: decode_image(x, 'hsv')),
+        'opencv_float32': (lambda: cv2.cvtColor(bgr.astype(np.float32) / 255, cv2.COLOR_BGR2HSV),
+                           lambda x: x * sv_olcek),
+    }
+
+
+def _lab_paths(rgb: np.ndarray, bgr: np.ndarray) -> dict:
+    """LAB yolları: ad → (dönüşüm, sonucu bizim float ölçeğe çeviren fonksiyon)."""
+    return {
+        'donusumler_float32': (lambda: rgb_image_to_lab(rgb), None),
+        'donusumler_uint8': (lambda: rgb_image_to_lab(rgb, encoding='uint8'),
+                             lambda x: decode_image(x, 'lab')),
+        'opencv_uint8': (lambda: cv2.cvtColor(bgr, cv2.COLOR_BGR2LAB),
+                         lambda x: decode_image(x, 'lab')),
+        'opencv_float32': (lambda: cv2.cvtColor(bgr.astype(np.float32) / 255, cv2.COLOR_BGR2LAB),
+                           None),
+    }
+
+
+def benchmark(ornek: int = 1 << 20, tam_kup: bool = False, tekrar: int = 3,
+              rapor: str = None, seed: int = 0) -> dict:
+    """
+    HSV ve LAB dönüşümlerini OpenCV ile doğruluk ve hız açısından karşılaştırır.
+    
+    Her yol için kanal başına en büyük ve %99'luk hata (float64 referansa
+    göre) ile en iyi `tekrar` ölçümünden MP/s hesaplanır. Bizim yollar
+    RGB, OpenCV yolları BGR girdi alır; kanal sırası çevirmesi ölçüme
+    dahil değildir (görüntü her iki sırada önceden hazırlanır). OpenCV
+    float32 yollarında girdinin 0-1 ölçeğine çevrilmesi ölçüme dahildir.
+    
+    Args:
+        ornek: Tabakalı örnek boyutu (tam_kup=False iken)
+        tam_kup: True ise 256³ renklerin tamamı kullanılır
+        tekrar: Hız ölçümü tekrar sayısı
+        rapor: Verilirse JSON raporun yazılacağı dosya yolu
+        seed: Tabakalı örnek tohumu
+    
+    Returns:
+        dict: Rapor (meta, hsv, lab bölümleri)
+    """
+    rgb = rgb_cube() if tam_kup else stratified_cube_sample(ornek, seed)
+    bgr = np.ascontiguousarray(rgb[..., ::-1])
+    piksel = rgb.shape[0] * rgb.shape[1]
+    
+    sonuclar = {
+        'meta': {
+            'mod': 'tam_kup' if tam_kup else 'tabakali',
+            'piksel': piksel,
+            'tekrar': tekrar,
+            'numpy': np.__version__,
+            'opencv': cv2.__version__,
+            'python': platform.python_version(),
+            'kanallar': {'hsv': ['H', 'S', 'V'], 'lab': ['L', 'a', 'b']},
+        },
+    }
+    
+    for uzay, yollar, referans_fonksiyonu, aci in (
+            ('hsv', _hsv_paths(rgb, bgr), rgb_image_to_hsv, 0),
+            ('lab', _lab_paths(rgb, bgr), rgb_image_to_lab, None)):
+        referans = referans_fonksiyonu(rgb, encoding='float64')
+        bolum = {}
+        for ad, (donusum, cozucu) in yollar.items():
+            sonuc, sure = _timed(donusum, tekrar)
+            if cozucu is not None:
+                sonuc = cozucu(sonuc)
+            bolum[ad] = {'mp_s': round(piksel / 1e6 / sure, 2),
+                         **_channel_errors(sonuc, referans, aci)}
+            del sonuc
+        sonuclar[uzay] = bolum
+        del referans
+    
+    if rapor is not None:
+        with open(rapor, 'w', encoding='utf-8') as dosya:
+            json.dump(sonuclar, dosya, ensure_ascii=False, indent=2)
+    return sonuclar
+
+
+def print_benchmark(sonuclar: dict):
+    """`benchmark` raporunu tablo olarak yazdırır."""
+    meta = sonuclar['meta']
+    print(f"=== OpenCV Karşılaştırma ({meta['mod']}, {meta['piksel']:,} piksel) ===")
+    for uzay in ('hsv', 'lab'):
+        kanallar = meta['kanallar'][uzay]
+        print(f"\n{uzay.upper():20s} {'MP/s':>7s}   "
+              + ' '.join(f"{k + ' max':>8s}" for k in kanallar) + '   '
+              + ' '.join(f"{k + ' p99':>8s}" for k in kanallar))
+        for ad, satir in sonuclar[uzay].items():
+            print(f"{ad:20s} {satir['mp_s']:7.1f}   "
+                  + ' '.join(f"{d:8.4f}" for d in satir['max']) + '   '
+                  + ' '.join(f"{d:8.4f}" for d in satir['p99']))
+
+
 if __name__ == "__main__":
-    compare_hsv()
-    compare_lab()
-    print("Not: Küçük farklar yuvarlama ve gamma düzeltme farklılıklarından kaynaklanır.")
+    import argparse
+    
+    ayristirici = argparse.ArgumentParser(description="OpenCV ile doğruluk / hız karşılaştırması")
+    ayristirici.add_argument('--benchmark', action='store_true', help="küp taraması yap")
+    ayristirici.add_argument('--tam-kup', action='store_true', help="256³ renklerin tamamı")
+    ayristirici.add_argument('--ornek', type=int, default=1 << 20, help="tabakalı örnek boyutu")
+    ayristirici.add_argument('--tekrar', type=int, default=3, help="hız ölçümü tekrar sayısı")
+    ayristirici.add_argument('--rapor', help="JSON rapor dosyası")
+    secenekler = ayristirici.parse_args()
+    
+    if secenekler.benchmark:
+        print_benchmark(benchmark(secenekler.ornek, secenekler.tam_kup, secenekler.tekrar,
+                                  secenekler.rapor))
+    else:
+        compare_hsv()
+        compare_lab()
+        print("Not: Küçük farklar yuvarlama ve gamma düzeltme farklılıklarından kaynaklanır.")
@@ -0,0 +1,115 @@
+"""
+Parçalı (Out-of-Core) Görüntü Dönüşümü
+======================================
+Belleğe sığmayan görüntüleri (ör. gigapiksel ortofoto mozaikleri) satır
+şeritleri halinde dönüştürür. Girdi `np.memmap` ya da `.npy` dosyasından
+okunur, sonuç bellek eşlemeli bir çıktıya şerit şerit yazılır.
+
+Tepe bellek kullanımı şerit boyutuyla sınırlıdır; sonuç, görüntünün
+tamamını bellekte dönüştürmekle birebir aynıdır (dönüşümler piksel
+bağımsız olduğundan).
+
+Kullanım:
+    from donusumler import rgb_image_to_lab, convert_tiled
+    convert_tiled(rgb_image_to_lab, "mozaik_rgb.npy", "mozaik_lab.npy")
+"""
+
+import numpy as np
+from .yardimci import probe_output_dtype
+
+# Varsayılan şerit bütçesi: girdi + çıktı şeridi toplamı (bayt)
+SERIT_BUTCESI = 64 * 1024 * 1024
+
+
+def _open_source(src):
+    """Girdiyi dizi olarak döndürür; dosya yolu ise salt okunur eşler."""
+    if isinstance(src, np.ndarray):
+        return src
+    return np.load(src, mmap_mode='r')
+
+
+def strip_rows_for_budget(shape: tuple, in_dtype, out_dtype,
+                          budget: int = SERIT_BUTCESI) -> int:
+    """
+    Bellek bütçesine sığan şerit yüksekliğini (satır sayısı) hesaplar.
+    
+    Args:
+        shape: Görüntü biçimi (H, W, 3)
+        in_dtype: Girdi veri tipi
+        out_dtype: Çıktı veri tipi
+        budget: Bir şeridin girdi + çıktı boyutu için üst sınır (bayt)
+    
+    Returns:
+        int: Şerit başına satır sayısı (en az 1)
+    """
+    satir_bayt = int(np.prod(shape[1:])) * (np.dtype(in_dtype).itemsize
+                                            + np.dtype(out_dtype).itemsize)
+    return max(1, budget // max(satir_bayt, 1))
+
+
+def convert_tiled(converter, src, dst, strip_rows: int = None,
+                  budget: int = SERIT_BUTCESI) -> np.ndarray:
+    """
+    Bir `donusumler` görüntü dönüşümünü şerit şerit uygular.
+    
+    Her şerit için `converter(girdi_şeridi, out=çıktı_şeridi)` çağrılır;
+    çıktı şeridi doğrudan hedef dizinin bir dilimidir, ara kopya yapılmaz.
+    Yazılan şeritler diske aktarılır (flush) ve sayfa önbelleğinden
+    geri alınabilir kalır.
+    
+    Args:
+        converter: `out=` destekleyen görüntü dönüşüm fonksiyonu
+        src: Girdi görüntüsü: `.npy` dosya yolu veya (bellek eşlemeli) dizi
+        dst: Çıktı: `.npy` dosya yolu (oluşturulur) veya yazılabilir dizi
+        strip_rows: Şerit yüksekliği; verilmezse `budget`'tan hesaplanır
+        budget: Şerit başına girdi + çıktı bellek bütçesi (bayt)
+    
+    Returns:
+        np.ndarray: Çıktı dizisi (dosya yolu verildiyse bellek eşlemeli)
+    """
+    kaynak = _open_source(src)
+    
+    # Çıktı veri tipi dönüşümün kendisinden öğrenilir (1 piksellik deneme)
+    out_dtype = probe_output_dtype(converter, kaynak[:1])
+    
+    if isinstance(dst, np.ndarray):
+        hedef = dst
+    else:
+        hedef = np.lib.format.open_memmap(dst, mode='w+', dtype=out_dtype,
+                                          shape=kaynak.shape)
+    
+    if strip_rows is None:
+        strip_rows = strip_rows_for_budget(kaynak.shape, kaynak.dtype, out_dtype, budget)
+    
+    for bas in range(0, kaynak.shape[0], strip_rows):
+        son = min(bas + strip_rows, kaynak.shape[0])
+        converter(np.asarray(kaynak[bas:son]), out=hedef[bas:son])
+        if isinstance(hedef, np.memmap):
+            hedef.flush()
+    
+    return hedef
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    from .rgb_lab import rgb_image_to_lab
+    
+    print("=== Parçalı Dönüşüm Testi ===\n")
+    
+    klasor = tempfile.mkdtemp()
+    girdi_yolu = os.path.join(klasor, "rgb.npy")
+    cikti_yolu = os.path.join(klasor, "lab.npy")
+    
+    girdi = np.lib.format.open_memmap(girdi_yolu, mode='w+', dtype=np.uint8,
+                                      shape=(2000, 3000, 3))
+    girdi[:] = np.random.default_rng(0).integers(0, 256, girdi.shape, dtype=np.uint8)
+    girdi.flush()
+    
+    bas = time.perf_counter()
+    lab = convert_tiled(rgb_image_to_lab, girdi_yolu, cikti_yolu, budget=8 * 1024 * 1024)
+    print(f"Şeritli dönüşüm: {time.perf_counter() - bas:.2f} sn")
+    
+    esit = np.array_equal(lab, rgb_image_to_lab(np.load(girdi_yolu)))
+    print(f"Bellek içi dönüşümle aynı: {'✓' if esit else '✗'}")
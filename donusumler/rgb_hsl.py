@@ -14,6 +14,12 @@ HSV vs HSL Farkı:
 """
 
 import numpy as np
+from .kodlama import encoding_dtype
+from .yardimci import apply_blocked, as_color_array, rgb_input_scale, work_dtype
+from .rgb_hsv import _hue_array
+
+# Sıfıra bölmeyi önleyen küçük sayı (pay da sıfır olduğunda sonuç 0 kalır)
+_EPS = np.float32(1e-30)
 
 
 def rgb_to_hsl(r: float, g: float, b: float) -> tuple:
@@ -113,32 +119,129 @@ def hsl_to_rgb(h: float, s: float, l: float) -> tuple:
     return (r, g, b)
 
 
-def rgb_image_to_hsl(image: np.ndarray) -> np.ndarray:
-    """RGB görüntüyü HSL'ye dönüştür."""
-    hsl_image = np.zeros_like(image, dtype=np.float32)
+def _rgb_to_hsl_kernel(blok: np.ndarray, cikti: np.ndarray, olcek: float = 1.0):
+    """(N, 3) RGB bloğunu (0-255 / olcek ölçeğinde) HSL'ye çevirip `cikti` içine yazar."""
+    tip = work_dtype(cikti)
+    r, g, b = (blok[:, k].astype(tip) for k in range(3))
+    if olcek != 1.0:
+        r, g, b = r * olcek, g * olcek, b * olcek
+    
+    c_max = np.maximum(np.maximum(r, g), b)
+    c_min = np.minimum(np.minimum(r, g), b)
+    delta = c_max - c_min
+    toplam = c_max + c_min  # = 2L × 255
+    
+    # 0-255 ölçeğinde: S × 255 = Δ × 255 / (255 - |2L×255 - 255|)
+    payda = np.abs(toplam - 255)
+    np.subtract(255, payda, out=payda)
+    
+    cikti[:, 0] = _hue_array(r, g, b, c_max, delta)
+    cikti[:, 1] = delta * np.float32(255) / np.maximum(payda, _EPS)
+    cikti[:, 2] = toplam * np.float32(0.5)
+
+
+def _hsl_to_rgb_kernel(blok: np.ndarray, cikti: np.ndarray):
+    """(N, 3) HSL bloğunu (S, L: 0-255) RGB'ye (uint8) çevirip `cikti` içine yazar."""
+    h, s, l = (blok[:, k].astype(np.float32) for k in range(3))
+    
+    h_30 = h / np.float32(30)
+    if h_30.min() < 0 or h_30.max() > 12:
+        h_30 = np.mod(h_30, 12)
+    
+    # a = S × min(L, 1 - L) = C / 2 (0-255 ölçeğinde)
+    a = np.minimum(l, 255 - l)
+    a *= s
+    a /= 255
+    
+    for kanal, n in enumerate((0, 8, 4)):
+        k = h_30 + n
+        k -= np.float32(12) * (k >= 12)
+        agirlik = np.minimum(k - 3, 9 - k)
+        np.clip(agirlik, -1, 1, out=agirlik)
+        agirlik *= a
+        deger = np.subtract(l, agirlik, out=agirlik)
+        np.rint(deger, out=deger)
+        np.clip(deger, 0, 255, out=deger)
+        cikti[:, kanal] = deger
+
+
+def rgb_image_to_hsl(image: np.ndarray, out: np.ndarray = None,
+                     encoding: str = 'float32') -> np.ndarray:
+    """
+    RGB görüntüyü HSL'ye dönüştür (vektörel).
+    
+    Girdi ölçeği piksel başına tahmin edilmez, veri tipinden bir kez okunur
+    (bkz. `yardimci.input_scale`): uint8 → 0-255, uint16 → 0-65535,
+    float → 0-1; 0-255 ölçekli float girdi ValueError ile reddedilir.
+    Hesap float32 ile (encoding='float64' ise float64), önbelleğe sığan
+    piksel bloklarında yürür.
+    
+    Args:
+        image: RGB görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması (bkz. `kodlama`); 'uint8' OpenCV gibi H/2
+    
+    Returns:
+        np.ndarray: HSL görüntü (H, W, 3), float32 - H: 0-360, S: 0-255, L: 0-255
+    """
+    image = np.asarray(image)
+    olcek = 255 / rgb_input_scale(image)
+    
+    return apply_blocked(lambda blok, cikti: _rgb_to_hsl_kernel(blok, cikti, olcek),
+                         image, encoding_dtype(encoding), out=out, space='hsl')
+
+
+def hsl_image_to_rgb(hsl_image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    HSL görüntüyü RGB'ye dönüştür (vektörel).
+    
+    Bölge seçimi yerine dallanmasız eşdeğer formül kullanılır:
+    - k = (n + H/30) mod 12,  n = 0 (R), 8 (G), 4 (B)
+    - kanal = L - S × min(L, 1 - L) × max(-1, min(k - 3, 9 - k, 1))
     
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            r, g, b = image[i, j]
-            h, s, l = rgb_to_hsl(r, g, b)
-            hsl_image[i, j] = [h, s * 255, l * 255]
+    S ve L, `rgb_image_to_hsl` çıktısındaki gibi 0-255 ölçeğinde kabul edilir.
     
-    return hsl_image
+    Args:
+        hsl_image: HSL görüntü (H, W, 3) - H: 0-360, S: 0-255, L: 0-255
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+    
+    Returns:
+        np.ndarray: RGB görüntü (H, W, 3), uint8
+    """
+    return apply_blocked(_hsl_to_rgb_kernel, hsl_image, np.uint8, out=out)
 
 
-def hsl_image_to_rgb(hsl_image: np.ndarray) -> np.ndarray:
-    """HSL görüntüyü RGB'ye dönüştür."""
-    rgb_image = np.zeros((hsl_image.shape[0], hsl_image.shape[1], 3), dtype=np.uint8)
+def rgb_to_hsl_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda RGB'den HSL'ye dönüştür.
     
-    for i in range(hsl_image.shape[0]):
-        for j in range(hsl_image.shape[1]):
-            h, s, l = hsl_image[i, j]
-            s = s / 255.0 if s > 1 else s
-            l = l / 255.0 if l > 1 else l
-            r, g, b = hsl_to_rgb(h, s, l)
-            rgb_image[i, j] = [r, g, b]
+    `rgb_to_hsl` ile aynı birimleri döndürür; girdi ölçeği veri tipinden
+    okunur (tamsayı → 0-255, float → 0-1).
     
-    return rgb_image
+    Args:
+        colors: RGB renkler (N, 3)
+    
+    Returns:
+        np.ndarray: HSL renkler (N, 3), float32 - H: 0-360, S: 0-1, L: 0-1
+    """
+    hsl = rgb_image_to_hsl(as_color_array(colors))
+    hsl[:, 1:] /= 255
+    return hsl
+
+
+def hsl_to_rgb_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda HSL'den RGB'ye dönüştür.
+    
+    Args:
+        colors: HSL renkler (N, 3) - H: 0-360, S: 0-1, L: 0-1
+    
+    Returns:
+        np.ndarray: RGB renkler (N, 3), uint8
+    """
+    hsl = as_color_array(colors).astype(np.float32)
+    hsl[:, 1:] *= 255
+    return hsl_image_to_rgb(hsl)
 
 
 # Test
@@ -162,3 +265,12 @@ if __name__ == "__main__":
         print(f"  HSL → RGB({r2}, {g2}, {b2})")
         match = abs(r-r2) <= 1 and abs(g-g2) <= 1 and abs(b-b2) <= 1
         print(f"  Doğrulama: {'✓' if match else '✗'}\n")
+    
+    # Vektörel görüntü dönüşümü: uint8, uint16 ve float girdiler aynı sonucu vermeli
+    goruntu = np.array([[[r, g, b] for _, r, g, b in test_colors]], dtype=np.uint8)
+    hsl_goruntu = rgb_image_to_hsl(goruntu)
+    hsl_16 = rgb_image_to_hsl(goruntu.astype(np.uint16) * 257)
+    hsl_f = rgb_image_to_hsl(goruntu / 255.0)
+    print("Görüntü dönüşümü:")
+    print(f"  dtype farkı: {max(np.abs(hsl_goruntu - hsl_16).max(), np.abs(hsl_goruntu - hsl_f).max()):.2e}")
+    print(f"  Geri dönüşüm: {'✓' if np.array_equal(hsl_image_to_rgb(hsl_goruntu), goruntu) else '✗'}")
@@ -9,7 +9,14 @@ HSV Bileşenleri:
 - V (Value): Parlaklık, 0-1
 """
 
+from functools import lru_cache
+
 import numpy as np
+from .kodlama import encoding_dtype
+from .yardimci import apply_blocked, as_color_array, rgb_input_scale, work_dtype
+
+# Sıfıra bölmeyi önleyen küçük sayı (pay da sıfır olduğunda sonuç 0 kalır)
+_EPS = np.float32(1e-30)
 
 
 def rgb_to_hsv(r: float, g: float, b: float) -> tuple:
@@ -108,48 +115,226 @@ def hsv_to_rgb(h: float, s: float, v: float) -> tuple:
     return (r, g, b)
 
 
-def rgb_image_to_hsv(image: np.ndarray) -> np.ndarray:
+def _hue_array(r: np.ndarray, g: np.ndarray, b: np.ndarray,
+               c_max: np.ndarray, delta: np.ndarray) -> np.ndarray:
+    """
+    Kanal dizilerinden hue açısını (0-360) hesaplar.
+    
+    Skaler fonksiyondaki R > G > B öncelik sırası korunur: önce max = B
+    varsayılır, sonra G ve R dalları üzerine yazılır.
+    """
+    # 60 / delta bir kez hesaplanır; delta = 0 iken paylar da 0 olduğundan H = 0
+    ters = np.float32(60) / np.maximum(delta, _EPS)
+    
+    h = (r - g) * ters
+    h += 240
+    h_g = (b - r) * ters
+    h_g += 120
+    h = np.where(c_max == g, h_g, h)
+    h_r = (g - b) * ters
+    h_r += np.float32(360) * (h_r < 0)  # mod 6 sarması
+    return np.where(c_max == r, h_r, h)
+
+
+@lru_cache(maxsize=None)
+def _uint8_hue_tablosu() -> np.ndarray:
+    """
+    uint8 girdi için hue tablosu: (sıra kodu, max - min, orta - min) → H.
+    
+    Sıra kodu bitleri 1: R ≥ G, 2: G ≥ B, 4: B ≥ R. Her kod için max = d,
+    min = 0, orta = x olan temsilci renk float32 çekirdekten geçirilir;
+    hue yalnızca kanal farklarına bağlı olduğundan sonuç bit düzeyinde aynıdır.
+    """
+    d, x = (k.astype(np.uint8).ravel() for k in np.indices((256, 256)))
+    sifir = np.zeros_like(d)
+    temsilciler = {
+        0b011: (d, x, sifir),   # R ≥ G ≥ B
+        0b010: (x, d, sifir),   # G > R ≥ B
+        0b110: (sifir, d, x),   # G ≥ B > R
+        0b100: (sifir, x, d),   # B > G > R
+        0b101: (x, sifir, d),   # B ≥ R > G
+        0b001: (d, sifir, x),   # R > B > G
+    }
+    tablo = np.zeros((8, 256 * 256), dtype=np.float32)
+    for kod, kanallar in temsilciler.items():
+        hsv = np.empty((d.size, 3), dtype=np.float32)
+        _rgb_to_hsv_kernel(np.stack(kanallar, axis=1).astype(np.float32), hsv)
+        tablo[kod] = hsv[:, 0]
+    return tablo.ravel()
+
+
+def _rgb_to_hsv_uint8(blok: np.ndarray, cikti: np.ndarray):
+    """
+    uint8 (N, 3) RGB bloğunu float32'ye yükseltmeden HSV'ye çevirir.
+    
+    max/min/delta uint8 üzerinde hesaplanır; orta kanal XOR ile bulunur
+    (max ve min, R/G/B'den ikisidir). H, sıra kodu ve (delta, orta - min)
+    ile `_uint8_hue_tablosu`ndan okunur. Sonuç float32 çekirdekle aynıdır.
     """
-    RGB görüntüyü HSV'ye dönüştür.
+    kanallar = np.empty((3, blok.shape[0]), dtype=np.uint8)
+    np.copyto(kanallar.T, blok)
+    r, g, b = kanallar
+    
+    c_max = np.maximum(r, g)
+    np.maximum(c_max, b, out=c_max)
+    c_min = np.minimum(r, g)
+    np.minimum(c_min, b, out=c_min)
+    delta = c_max - c_min
+    orta = np.bitwise_xor(r, g)
+    orta ^= b
+    orta ^= c_max
+    orta ^= c_min
+    orta -= c_min
+    
+    # Sıra kodu: kaydırma yerine toplama (uint8 toplamı SIMD ile yürür)
+    kod = np.greater_equal(b, r).view(np.uint8)
+    kod = kod + kod
+    kod += np.greater_equal(g, b).view(np.uint8)
+    kod += kod
+    kod += np.greater_equal(r, g).view(np.uint8)
+    indeks = kod.astype(np.uint32)
+    indeks <<= 8
+    indeks |= delta
+    indeks <<= 8
+    indeks |= orta
+    cikti[:, 0] = _uint8_hue_tablosu().take(indeks)
+    
+    v = c_max.astype(np.float32)
+    cikti[:, 2] = v
+    s = delta.astype(np.float32)
+    s *= np.float32(255)
+    s /= np.maximum(v, _EPS, out=v)
+    cikti[:, 1] = s
+
+
+def _rgb_to_hsv_kernel(blok: np.ndarray, cikti: np.ndarray, olcek: float = 1.0):
+    """(N, 3) RGB bloğunu (0-255 / olcek ölçeğinde) HSV'ye çevirip `cikti` içine yazar."""
+    tip = work_dtype(cikti)
+    if blok.dtype == np.uint8 and tip == np.float32:
+        return _rgb_to_hsv_uint8(blok, cikti)
+    
+    r, g, b = (blok[:, k].astype(tip) for k in range(3))
+    if olcek != 1.0:
+        r, g, b = r * olcek, g * olcek, b * olcek
+    
+    c_max = np.maximum(np.maximum(r, g), b)
+    delta = c_max - np.minimum(np.minimum(r, g), b)
+    
+    cikti[:, 0] = _hue_array(r, g, b, c_max, delta)
+    cikti[:, 1] = delta * np.float32(255) / np.maximum(c_max, _EPS)
+    cikti[:, 2] = c_max
+
+
+def _hsv_to_rgb_kernel(blok: np.ndarray, cikti: np.ndarray):
+    """(N, 3) HSV bloğunu RGB'ye (uint8) çevirip `cikti` içine yazar."""
+    h, s, v = (blok[:, k].astype(np.float32) for k in range(3))
+    
+    h_prime = h / np.float32(60)
+    if h_prime.min() < 0 or h_prime.max() > 6:
+        h_prime = np.mod(h_prime, 6)
+    
+    # S ve V 0-255 ölçeğinde: chroma × 255 = V × S / 255
+    chroma = v * s
+    chroma /= 255
+    
+    for kanal, n in enumerate((5, 3, 1)):
+        k = h_prime + n
+        k -= np.float32(6) * (k >= 6)
+        agirlik = np.minimum(k, 4 - k)
+        np.clip(agirlik, 0, 1, out=agirlik)
+        agirlik *= chroma
+        deger = np.subtract(v, agirlik, out=agirlik)
+        np.rint(deger, out=deger)
+        np.clip(deger, 0, 255, out=deger)
+        cikti[:, kanal] = deger
+
+
+def rgb_image_to_hsv(image: np.ndarray, out: np.ndarray = None,
+                     encoding: str = 'float32') -> np.ndarray:
+    """
+    RGB görüntüyü HSV'ye dönüştür (vektörel).
+    
+    Piksel döngüsü yerine max/min/delta, bölge (sextant) seçimi ve hue
+    sarması NumPy dizi işlemleriyle, önbelleğe sığan piksel bloklarında
+    yapılır. Hesap float32 ile yürür (encoding='float64' ise float64);
+    skaler `rgb_to_hsv` sonucundan farkı H için 1e-3 dereceden, S ve V
+    (0-255 ölçeğinde) için 1e-3'ten küçüktür. uint8 girdide float32'ye
+    yükseltme yapılmaz: max/min/delta uint8 üzerinde bulunur, H tablodan
+    okunur (bkz. `_rgb_to_hsv_uint8`); 1080p'de ~2 kat hızlıdır.
+    
+    Normalizasyon görüntü başına bir kez, veri tipinden yapılır
+    (bkz. `yardimci.input_scale`): uint8 → 0-255, uint16 → 0-65535,
+    float → 0-1 (0-255 ölçekli float girdi ValueError ile reddedilir).
     
     Args:
-        image: RGB görüntü (H, W, 3), değerler 0-255
+        image: RGB görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması (bkz. `kodlama`); 'uint8' OpenCV gibi H/2
     
     Returns:
-        np.ndarray: HSV görüntü (H, W, 3)
+        np.ndarray: HSV görüntü (H, W, 3), float32 - H: 0-360, S: 0-255, V: 0-255
     """
-    hsv_image = np.zeros_like(image, dtype=np.float32)
-    
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            r, g, b = image[i, j]
-            h, s, v = rgb_to_hsv(r, g, b)
-            hsv_image[i, j] = [h, s * 255, v * 255]
+    image = np.asarray(image)
+    olcek = 255 / rgb_input_scale(image)
     
-    return hsv_image
+    return apply_blocked(lambda blok, cikti: _rgb_to_hsv_kernel(blok, cikti, olcek),
+                         image, encoding_dtype(encoding), out=out, space='hsv')
 
 
-def hsv_image_to_rgb(hsv_image: np.ndarray) -> np.ndarray:
+def hsv_image_to_rgb(hsv_image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
     """
-    HSV görüntüyü RGB'ye dönüştür.
+    HSV görüntüyü RGB'ye dönüştür (vektörel).
+    
+    Bölge seçimi yerine dallanmasız eşdeğer formül kullanılır:
+    - k = (n + H/60) mod 6,  n = 5 (R), 3 (G), 1 (B)
+    - kanal = V - V × S × max(0, min(k, 4 - k, 1))
+    
+    H ∈ [0, 360] için skaler `hsv_to_rgb` ile aynı değerleri verir; yalnızca
+    tam .5 sınırına düşen değerlerde yuvarlama ±1 farklı olabilir. S ve V,
+    `rgb_image_to_hsv` çıktısındaki gibi her zaman 0-255 ölçeğinde kabul
+    edilir (piksel başına `> 1` tahmini koyu pikselleri yanlış ölçekler).
     
     Args:
-        hsv_image: HSV görüntü (H, W, 3)
+        hsv_image: HSV görüntü (H, W, 3) - H: 0-360, S: 0-255, V: 0-255
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
     
     Returns:
         np.ndarray: RGB görüntü (H, W, 3), değerler 0-255
     """
-    rgb_image = np.zeros_like(hsv_image, dtype=np.uint8)
+    return apply_blocked(_hsv_to_rgb_kernel, hsv_image, np.uint8, out=out)
+
+
+def rgb_to_hsv_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda RGB'den HSV'ye dönüştür.
+    
+    `rgb_to_hsv` ile aynı birimleri döndürür; girdi ölçeği veri tipinden
+    okunur (tamsayı → 0-255, float → 0-1).
     
-    for i in range(hsv_image.shape[0]):
-        for j in range(hsv_image.shape[1]):
-            h, s, v = hsv_image[i, j]
-            s = s / 255.0 if s > 1 else s
-            v = v / 255.0 if v > 1 else v
-            r, g, b = hsv_to_rgb(h, s, v)
-            rgb_image[i, j] = [r, g, b]
+    Args:
+        colors: RGB renkler (N, 3)
     
-    return rgb_image
+    Returns:
+        np.ndarray: HSV renkler (N, 3), float32 - H: 0-360, S: 0-1, V: 0-1
+    """
+    hsv = rgb_image_to_hsv(as_color_array(colors))
+    hsv[:, 1:] /= 255
+    return hsv
+
+
+def hsv_to_rgb_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda HSV'den RGB'ye dönüştür.
+    
+    Args:
+        colors: HSV renkler (N, 3) - H: 0-360, S: 0-1, V: 0-1
+    
+    Returns:
+        np.ndarray: RGB renkler (N, 3), uint8
+    """
+    hsv = as_color_array(colors).astype(np.float32)
+    hsv[:, 1:] *= 255
+    return hsv_image_to_rgb(hsv)
 
 
 # Test
@@ -172,3 +357,26 @@ if __name__ == "__main__":
         print(f"  RGB({r}, {g}, {b}) → HSV({h:.1f}°, {s:.2f}, {v:.2f})")
         print(f"  HSV → RGB({r2}, {g2}, {b2})")
         print(f"  Doğrulama: {'✓' if (r, g, b) == (r2, g2, b2) else '✗'}\n")
+    
+    # Vektörel görüntü dönüşümü: skaler sonuçlarla ve geri dönüşümle karşılaştır
+    goruntu = np.array([[[r, g, b] for _, r, g, b in test_colors]], dtype=np.uint8)
+    hsv_goruntu = rgb_image_to_hsv(goruntu)
+    skaler = np.array([[[h, s * 255, v * 255] for h, s, v in
+                        (rgb_to_hsv(r, g, b) for _, r, g, b in test_colors)]])
+    print("Görüntü dönüşümü:")
+    print(f"  Skaler ile fark: {np.abs(hsv_goruntu - skaler).max():.2e}")
+    print(f"  Geri dönüşüm: {'✓' if np.array_equal(hsv_image_to_rgb(hsv_goruntu), goruntu) else '✗'}")
+    
+    # uint8 hızlı yolu: float64 hesapla karşılaştırma ve 1080p hız ölçümü
+    import time
+    
+    goruntu = np.random.default_rng(0).integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+    fark = np.abs(rgb_image_to_hsv(goruntu) - rgb_image_to_hsv(goruntu, encoding='float64')).max(axis=(0, 1))
+    print(f"\nuint8 hızlı yol, float64 ile en büyük fark: H={fark[0]:.1e} S={fark[1]:.1e} V={fark[2]:.1e}")
+    for ad, girdi in (("uint8", goruntu), ("float32", goruntu.astype(np.float32) / 255)):
+        sureler = []
+        for _ in range(5):
+            baslangic = time.perf_counter()
+            rgb_image_to_hsv(girdi)
+            sureler.append(time.perf_counter() - baslangic)
+        print(f"  1080p {ad:7s}: {min(sureler) * 1e3:5.1f} ms ({goruntu.size / 3 / min(sureler) / 1e6:.0f} MP/sn)")
@@ -5,8 +5,17 @@ RGB → XYZ → LAB ve LAB → XYZ → RGB tam yol dönüşümleri
 """
 
 import numpy as np
-from rgb_xyz import rgb_to_xyz, xyz_to_rgb, gamma_expand, gamma_compress
-from xyz_lab import xyz_to_lab, lab_to_xyz
+from .rgb_xyz import (rgb_to_xyz, xyz_to_rgb, gamma_expand, gamma_compress,
+                     _RGB_TO_XYZ_T, _XYZ_TO_RGB_T, _linearize, _compress_to_uint8)
+from .xyz_lab import (xyz_to_lab, lab_to_xyz, f_array, f_inverse_array,
+                     _D65_BEYAZ, _D65_TERS, _lab_from_f, _f_from_lab)
+from .kodlama import encoding_dtype
+from .yardimci import apply_blocked, as_color_array, rgb_input_scale, work_dtype
+
+# Birleşik matrisler: linear RGB → beyaz noktaya göre normalize XYZ ve tersi.
+# XYZ ara görüntüsü hiç oluşturulmaz; normalizasyon matrise katılmıştır.
+_RGB_TO_XYZN_T = _RGB_TO_XYZ_T * _D65_TERS[np.newaxis, :]
+_XYZN_TO_RGB_T = (_D65_BEYAZ[:, np.newaxis] * _XYZ_TO_RGB_T).astype(np.float32)
 
 
 def rgb_to_lab(r: float, g: float, b: float) -> tuple:
@@ -43,30 +52,91 @@ def lab_to_rgb(L: float, a: float, b: float) -> tuple:
     return (r, g, b_val)
 
 
-def rgb_image_to_lab(image: np.ndarray) -> np.ndarray:
-    """RGB görüntüyü LAB'a dönüştür."""
-    lab_image = np.zeros_like(image, dtype=np.float32)
+def _rgb_to_lab_kernel(blok: np.ndarray, cikti: np.ndarray, matris: np.ndarray = _RGB_TO_XYZN_T):
+    """(N, 3) RGB bloğunu tek geçişte LAB'a çevirip `cikti` içine yazar."""
+    tip = work_dtype(cikti)
+    _lab_from_f(f_array(_linearize(blok, tip) @ matris.astype(tip)), cikti)
+
+
+def _lab_to_rgb_kernel(blok: np.ndarray, cikti: np.ndarray, matris: np.ndarray = _XYZN_TO_RGB_T):
+    """(N, 3) LAB bloğunu tek geçişte RGB'ye (uint8) çevirip `cikti` içine yazar."""
+    lin = f_inverse_array(_f_from_lab(blok)) @ matris
+    _compress_to_uint8(lin, cikti)
+
+
+def rgb_image_to_lab(image: np.ndarray, out: np.ndarray = None,
+                     encoding: str = 'float32') -> np.ndarray:
+    """
+    RGB görüntüyü LAB'a dönüştür (birleşik, tek geçiş).
+    
+    RGB → Linear RGB → XYZ → LAB zinciri her piksel bloğu için art arda
+    uygulanır; tam boyutlu bir XYZ ara görüntüsü oluşturulmaz. Ek bellek
+    kullanımı, sonuç dizisi dışında blok boyutuyla sınırlı küçük bir
+    sabittir (bkz. `yardimci.BLOK_PIKSEL`).
+    
+    `encoding='uint8'` ile sonuç OpenCV'nin 8-bit LAB biçiminde
+    (L·255/100, a+128, b+128) doğrudan kaynak görüntü boyutunda yazılır.
+    
+    Girdi ölçeği veri tipinden bir kez okunur (bkz. `yardimci.input_scale`):
+    uint8 → 0-255, uint16 → 0-65535, float → 0-1. 0-255 ölçekli float
+    girdi ValueError ile reddedilir (bkz. `yardimci.rgb_input_scale`).
     
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            r, g, b = image[i, j]
-            L, a, b_val = rgb_to_lab(r, g, b)
-            lab_image[i, j] = [L, a, b_val]
+    Args:
+        image: RGB görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması: 'float64', 'float32', 'float16', 'uint8'
     
-    return lab_image
+    Returns:
+        np.ndarray: LAB görüntü (H, W, 3), `encoding` veri tipinde
+    """
+    image = np.asarray(image)
+    rgb_input_scale(image)
+    
+    return apply_blocked(_rgb_to_lab_kernel, image, encoding_dtype(encoding),
+                         out=out, space='lab')
 
 
-def lab_image_to_rgb(lab_image: np.ndarray) -> np.ndarray:
-    """LAB görüntüyü RGB'ye dönüştür."""
-    rgb_image = np.zeros((lab_image.shape[0], lab_image.shape[1], 3), dtype=np.uint8)
+def lab_image_to_rgb(lab_image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    LAB görüntüyü RGB'ye dönüştür (birleşik, tek geçiş).
     
-    for i in range(lab_image.shape[0]):
-        for j in range(lab_image.shape[1]):
-            L, a, b = lab_image[i, j]
-            r, g, b_val = lab_to_rgb(L, a, b)
-            rgb_image[i, j] = [r, g, b_val]
+    sRGB gamutu dışına düşen renkler, skaler `xyz_to_rgb` ile aynı şekilde
+    linear RGB'de [0, 1] aralığına kırpılır.
     
-    return rgb_image
+    Args:
+        lab_image: LAB görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+    
+    Returns:
+        np.ndarray: RGB görüntü (H, W, 3), uint8
+    """
+    return apply_blocked(_lab_to_rgb_kernel, lab_image, np.uint8, out=out)
+
+
+def rgb_to_lab_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda RGB'den LAB'a dönüştür.
+    
+    Args:
+        colors: RGB renkler (N, 3); tamsayı → 0-255, float → 0-1
+    
+    Returns:
+        np.ndarray: LAB renkler (N, 3), float32
+    """
+    return rgb_image_to_lab(as_color_array(colors))
+
+
+def lab_to_rgb_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda LAB'dan RGB'ye dönüştür.
+    
+    Args:
+        colors: LAB renkler (N, 3)
+    
+    Returns:
+        np.ndarray: RGB renkler (N, 3), uint8
+    """
+    return lab_image_to_rgb(as_color_array(colors))
 
 
 if __name__ == "__main__":
@@ -88,3 +158,11 @@ if __name__ == "__main__":
         print(f"  RGB({r},{g},{b}) → LAB({L:.1f},{a:.1f},{b_val:.1f}) → RGB({r2},{g2},{b2})")
         match = abs(r-r2)<=1 and abs(g-g2)<=1 and abs(b-b2)<=1
         print(f"  Doğrulama: {'✓' if match else '✗'}\n")
+    
+    # Birleşik görüntü dönüşümü: skaler zincirle ve geri dönüşümle karşılaştır
+    goruntu = np.array([[[r, g, b] for _, r, g, b in test_colors]], dtype=np.uint8)
+    lab_goruntu = rgb_image_to_lab(goruntu)
+    skaler = np.array([[rgb_to_lab(r, g, b) for _, r, g, b in test_colors]])
+    print("Görüntü dönüşümü:")
+    print(f"  Skaler ile fark: {np.abs(lab_goruntu - skaler).max():.2e}")
+    print(f"  Geri dönüşüm: {'✓' if np.array_equal(lab_image_to_rgb(lab_goruntu), goruntu) else '✗'}")
@@ -14,6 +14,9 @@ CIE XYZ:
 """
 
 import numpy as np
+from functools import lru_cache
+from .kodlama import encoding_dtype
+from .yardimci import apply_blocked, as_color_array, input_scale, rgb_input_scale, work_dtype
 
 # D65 Beyaz Nokta Referansı
 D65_XN = 95.047
@@ -34,6 +37,16 @@ XYZ_TO_RGB_MATRIX = np.array([
     [ 0.0556434, -0.2040259,  1.0572252]
 ])
 
+# Görüntü dönüşümlerinde satır vektörleriyle (N, 3) @ M.T çarpımı için
+# hazır matrisler; XYZ'nin 0-100 ölçeği de matrise katılmıştır. float64
+# saklanır, çekirdekte hesap hassasiyetine (float32/float64) çevrilir.
+_RGB_TO_XYZ_T = RGB_TO_XYZ_MATRIX.T * 100
+_XYZ_TO_RGB_T = (XYZ_TO_RGB_MATRIX.T / 100).astype(np.float32)
+
+# gamma_compress için yoğun tablo: [0, 1] aralığında eşit aralıklı örnekler.
+# Doğrusal ara değerlemenin hatası 0-255 ölçeğinde 1e-3'ten küçüktür.
+_COMPRESS_TABLO_BOYUT = 1 << 14
+
 
 def gamma_expand(c: float) -> float:
     """
@@ -75,6 +88,77 @@ def gamma_compress(c: float) -> float:
         return 1.055 * (c ** (1 / 2.4)) - 0.055
 
 
+def gamma_expand_array(c: np.ndarray) -> np.ndarray:
+    """
+    `gamma_expand` fonksiyonunun dizi sürümü.
+    
+    Args:
+        c: sRGB değerleri (0-1)
+    
+    Returns:
+        np.ndarray: Linear RGB değerleri (0-1)
+    """
+    c = np.asarray(c)
+    return np.where(c <= 0.04045, c / 12.92, np.power((c + 0.055) / 1.055, 2.4))
+
+
+def gamma_compress_array(c: np.ndarray) -> np.ndarray:
+    """
+    `gamma_compress` fonksiyonunun dizi sürümü.
+    
+    Args:
+        c: Linear RGB değerleri (0-1)
+    
+    Returns:
+        np.ndarray: sRGB değerleri (0-1)
+    """
+    c = np.asarray(c)
+    kuvvet = np.power(np.maximum(c, 0.0031308), 1 / 2.4)
+    return np.where(c <= 0.0031308, 12.92 * c, 1.055 * kuvvet - 0.055)
+
+
+@lru_cache(maxsize=None)
+def _expand_lut(seviye: int, tip: str = 'float32') -> np.ndarray:
+    """0..seviye-1 tamsayı girdiler için linear RGB tablosu (float32/float64)."""
+    return gamma_expand_array(np.arange(seviye) / (seviye - 1)).astype(tip)
+
+
+@lru_cache(maxsize=None)
+def _compress_tablo() -> tuple:
+    """gamma_compress × 255 için örnek ve fark tabloları (float32)."""
+    ornekler = gamma_compress_array(np.linspace(0, 1, _COMPRESS_TABLO_BOYUT + 1)) * 255
+    return ornekler[:-1].astype(np.float32), np.diff(ornekler).astype(np.float32)
+
+
+def _linearize(blok: np.ndarray, tip: type = np.float32) -> np.ndarray:
+    """(N, 3) sRGB bloğunu linear RGB'ye (`tip`: float32/float64) çevirir."""
+    if blok.dtype == np.uint8:
+        return _expand_lut(256, np.dtype(tip).name)[blok]
+    if blok.dtype == np.uint16:
+        return _expand_lut(65536, np.dtype(tip).name)[blok]
+    olcekli = blok.astype(tip) / tip(input_scale(blok.dtype))
+    return gamma_expand_array(olcekli).astype(tip, copy=False)
+
+
+def _compress_to_uint8(lin: np.ndarray, cikti: np.ndarray):
+    """
+    Linear RGB değerlerini kırpar, tablo ile sıkıştırır ve 0-255 tamsayıya yuvarlar.
+    
+    gamma_compress, eşit aralıklı yoğun tablo üzerinde doğrusal ara değerleme
+    ile uygulanır; her eleman için iki tablo okuması yeterlidir.
+    """
+    ornek, fark = _compress_tablo()
+    np.clip(lin, 0, 1, out=lin)
+    lin *= _COMPRESS_TABLO_BOYUT
+    indeks = lin.astype(np.int32)
+    np.minimum(indeks, _COMPRESS_TABLO_BOYUT - 1, out=indeks)
+    lin -= indeks
+    lin *= fark[indeks]
+    lin += ornek[indeks]
+    np.rint(lin, out=lin)
+    cikti[...] = lin
+
+
 def rgb_to_xyz(r: float, g: float, b: float) -> tuple:
     """
     RGB'den XYZ'ye dönüşüm.
@@ -145,30 +229,89 @@ def xyz_to_rgb(x: float, y: float, z: float) -> tuple:
     return (r, g, b)
 
 
-def rgb_image_to_xyz(image: np.ndarray) -> np.ndarray:
-    """RGB görüntüyü XYZ'ye dönüştür."""
-    xyz_image = np.zeros_like(image, dtype=np.float32)
+def _rgb_to_xyz_kernel(blok: np.ndarray, cikti: np.ndarray, matris: np.ndarray = _RGB_TO_XYZ_T):
+    """(N, 3) RGB bloğunu XYZ'ye çevirip `cikti` içine yazar (matris: (RGB → XYZ)ᵀ)."""
+    tip = work_dtype(cikti)
+    np.matmul(_linearize(blok, tip), matris.astype(tip), out=cikti)
+
+
+def _xyz_to_rgb_kernel(blok: np.ndarray, cikti: np.ndarray, matris: np.ndarray = _XYZ_TO_RGB_T):
+    """(N, 3) XYZ bloğunu RGB'ye (uint8) çevirip `cikti` içine yazar."""
+    lin = blok.astype(np.float32, copy=False) @ matris
+    _compress_to_uint8(lin, cikti)
+
+
+def rgb_image_to_xyz(image: np.ndarray, out: np.ndarray = None,
+                     encoding: str = 'float32') -> np.ndarray:
+    """
+    RGB görüntüyü XYZ'ye dönüştür (vektörel).
+    
+    uint8 (ve uint16) girdilerde gamma açma 256 (65536) elemanlı bir tablodan
+    okunur; ardından her blok için tek bir (N, 3) @ (3, 3) matris çarpımı
+    yapılır. Float girdiler 0-1 kabul edilir ve formül doğrudan uygulanır.
     
-    for i in range(image.shape[0]):
-        for j in range(image.shape[1]):
-            r, g, b = image[i, j]
-            x, y, z = rgb_to_xyz(r, g, b)
-            xyz_image[i, j] = [x, y, z]
+    Girdi ölçeği veri tipinden bir kez okunur (bkz. `yardimci.input_scale`):
+    uint8 → 0-255, uint16 → 0-65535, float → 0-1. 0-255 ölçekli float
+    girdi ValueError ile reddedilir (bkz. `yardimci.rgb_input_scale`).
+    
+    Args:
+        image: RGB görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması (bkz. `kodlama`); varsayılan float32
+    
+    Returns:
+        np.ndarray: XYZ görüntü (H, W, 3), `encoding` veri tipinde
+    """
+    image = np.asarray(image)
+    rgb_input_scale(image)
     
-    return xyz_image
+    return apply_blocked(_rgb_to_xyz_kernel, image, encoding_dtype(encoding),
+                         out=out, space='xyz')
 
 
-def xyz_image_to_rgb(xyz_image: np.ndarray) -> np.ndarray:
-    """XYZ görüntüyü RGB'ye dönüştür."""
-    rgb_image = np.zeros((xyz_image.shape[0], xyz_image.shape[1], 3), dtype=np.uint8)
+def xyz_image_to_rgb(xyz_image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    XYZ görüntüyü RGB'ye dönüştür (vektörel).
     
-    for i in range(xyz_image.shape[0]):
-        for j in range(xyz_image.shape[1]):
-            x, y, z = xyz_image[i, j]
-            r, g, b = xyz_to_rgb(x, y, z)
-            rgb_image[i, j] = [r, g, b]
+    Ters matris çarpımından sonra gamma sıkıştırma yoğun bir tablo üzerinde
+    ara değerleme ile yapılır (bkz. `_compress_to_uint8`). Skaler
+    `xyz_to_rgb` ile fark yalnızca yuvarlama sınırına 1e-3'ten yakın
+    değerlerde ±1 olabilir.
+    
+    Args:
+        xyz_image: XYZ görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
     
-    return rgb_image
+    Returns:
+        np.ndarray: RGB görüntü (H, W, 3), uint8
+    """
+    return apply_blocked(_xyz_to_rgb_kernel, xyz_image, np.uint8, out=out)
+
+
+def rgb_to_xyz_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda RGB'den XYZ'ye dönüştür.
+    
+    Args:
+        colors: RGB renkler (N, 3); tamsayı → 0-255, float → 0-1
+    
+    Returns:
+        np.ndarray: XYZ renkler (N, 3), float32
+    """
+    return rgb_image_to_xyz(as_color_array(colors))
+
+
+def xyz_to_rgb_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda XYZ'den RGB'ye dönüştür.
+    
+    Args:
+        colors: XYZ renkler (N, 3)
+    
+    Returns:
+        np.ndarray: RGB renkler (N, 3), uint8
+    """
+    return xyz_image_to_rgb(as_color_array(colors))
 
 
 # Test
@@ -192,3 +335,11 @@ if __name__ == "__main__":
         print(f"  XYZ → RGB({r2}, {g2}, {b2})")
         match = abs(r-r2) <= 1 and abs(g-g2) <= 1 and abs(b-b2) <= 1
         print(f"  Doğrulama: {'✓' if match else '✗'}\n")
+    
+    # Vektörel görüntü dönüşümü: skaler sonuçlarla ve geri dönüşümle karşılaştır
+    goruntu = np.array([[[r, g, b] for _, r, g, b in test_colors]], dtype=np.uint8)
+    xyz_goruntu = rgb_image_to_xyz(goruntu)
+    skaler = np.array([[rgb_to_xyz(r, g, b) for _, r, g, b in test_colors]])
+    print("Görüntü dönüşümü:")
+    print(f"  Skaler ile fark: {np.abs(xyz_goruntu - skaler).max():.2e}")
+    print(f"  Geri dönüşüm: {'✓' if np.array_equal(xyz_image_to_rgb(xyz_goruntu), goruntu) else '✗'}")
@@ -16,6 +16,8 @@ CIE Standart Sabitleri:
 """
 
 import numpy as np
+from .kodlama import encoding_dtype
+from .yardimci import apply_blocked, as_color_array, work_dtype
 
 # CIE Standart Sabitleri
 DELTA = 6 / 29                    # ≈ 0.206896551724
@@ -27,6 +29,11 @@ D65_XN = 95.047
 D65_YN = 100.000
 D65_ZN = 108.883
 
+# Görüntü dönüşümleri için beyaz nokta ve tersi (bir kez hesaplanır; float64
+# saklanır, çekirdekte hesap hassasiyetine çevrilir)
+_D65_BEYAZ = np.array([D65_XN, D65_YN, D65_ZN])
+_D65_TERS = 1 / _D65_BEYAZ
+
 
 def f(t: float) -> float:
     """
@@ -68,6 +75,36 @@ def f_inverse(t: float) -> float:
         return (116 * t - 16) / KAPPA
 
 
+def f_array(t: np.ndarray) -> np.ndarray:
+    """
+    `f` fonksiyonunun dizi sürümü.
+    
+    Küp kök / doğrusal ayrımı maske ile yapılır.
+    
+    Args:
+        t: Normalize XYZ değerleri
+    
+    Returns:
+        np.ndarray: f(t) sonuçları
+    """
+    t = np.asarray(t)
+    return np.where(t > DELTA_CUBE, np.cbrt(t), (KAPPA * t + 16) / 116)
+
+
+def f_inverse_array(t: np.ndarray) -> np.ndarray:
+    """
+    `f_inverse` fonksiyonunun dizi sürümü.
+    
+    Args:
+        t: f(t) değerleri
+    
+    Returns:
+        np.ndarray: Orijinal t değerleri
+    """
+    t = np.asarray(t)
+    return np.where(t > DELTA, t * t * t, (116 * t - 16) / KAPPA)
+
+
 def xyz_to_lab(x: float, y: float, z: float,
                xn: float = D65_XN, yn: float = D65_YN, zn: float = D65_ZN) -> tuple:
     """
@@ -143,30 +180,101 @@ def lab_to_xyz(L: float, a: float, b: float,
     return (X, Y, Z)
 
 
-def xyz_image_to_lab(xyz_image: np.ndarray) -> np.ndarray:
-    """XYZ görüntüyü LAB'a dönüştür."""
-    lab_image = np.zeros_like(xyz_image, dtype=np.float32)
+def _lab_from_f(ft: np.ndarray, cikti: np.ndarray):
+    """(N, 3) f(X/Xn), f(Y/Yn), f(Z/Zn) bloğundan L*, a*, b* hesaplar."""
+    fx, fy, fz = ft[:, 0], ft[:, 1], ft[:, 2]
+    
+    cikti[:, 0] = 116 * fy - 16
+    cikti[:, 1] = 500 * (fx - fy)
+    cikti[:, 2] = 200 * (fy - fz)
+
+
+def _f_from_lab(blok: np.ndarray, tip: type = np.float32) -> np.ndarray:
+    """(N, 3) LAB bloğundan fx, fy, fz ara değerlerini (`tip`) hesaplar."""
+    blok = blok.astype(tip, copy=False)
+    
+    ft = np.empty(blok.shape, dtype=tip)
+    ft[:, 1] = (blok[:, 0] + 16) / 116
+    ft[:, 0] = blok[:, 1] / 500 + ft[:, 1]
+    ft[:, 2] = ft[:, 1] - blok[:, 2] / 200
+    return ft
+
+
+def _xyz_to_lab_kernel(blok: np.ndarray, cikti: np.ndarray, ters: np.ndarray = _D65_TERS):
+    """(N, 3) XYZ bloğunu LAB'a çevirip `cikti` içine yazar (ters: 1 / beyaz nokta)."""
+    tip = work_dtype(cikti)
+    _lab_from_f(f_array(blok.astype(tip) * ters.astype(tip)), cikti)
+
+
+def _lab_to_xyz_kernel(blok: np.ndarray, cikti: np.ndarray, beyaz: np.ndarray = _D65_BEYAZ):
+    """(N, 3) LAB bloğunu XYZ'ye çevirip `cikti` içine yazar (beyaz: beyaz nokta)."""
+    tip = work_dtype(cikti)
+    np.multiply(f_inverse_array(_f_from_lab(blok, tip)), beyaz.astype(tip), out=cikti)
+
+
+def xyz_image_to_lab(xyz_image: np.ndarray, out: np.ndarray = None,
+                     encoding: str = 'float32') -> np.ndarray:
+    """
+    XYZ görüntüyü LAB'a dönüştür (vektörel, D65).
     
-    for i in range(xyz_image.shape[0]):
-        for j in range(xyz_image.shape[1]):
-            x, y, z = xyz_image[i, j]
-            L, a, b = xyz_to_lab(x, y, z)
-            lab_image[i, j] = [L, a, b]
+    Beyaz nokta tersleri modül yüklenirken bir kez hesaplanır; f(t)'nin
+    doğrusal / küp kök ayrımı maskelerle yapılır ve sonuç önceden ayrılmış
+    diziye blok blok, istenen kodlamada yazılır.
+    
+    Args:
+        xyz_image: XYZ görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması (bkz. `kodlama`); 'uint8' OpenCV LAB
+                  (L·255/100, a+128, b+128)
     
-    return lab_image
+    Returns:
+        np.ndarray: LAB görüntü (H, W, 3), `encoding` veri tipinde
+    """
+    return apply_blocked(_xyz_to_lab_kernel, xyz_image, encoding_dtype(encoding),
+                         out=out, space='lab')
 
 
-def lab_image_to_xyz(lab_image: np.ndarray) -> np.ndarray:
-    """LAB görüntüyü XYZ'ye dönüştür."""
-    xyz_image = np.zeros_like(lab_image, dtype=np.float32)
+def lab_image_to_xyz(lab_image: np.ndarray, out: np.ndarray = None,
+                     encoding: str = 'float32') -> np.ndarray:
+    """
+    LAB görüntüyü XYZ'ye dönüştür (vektörel, D65).
     
-    for i in range(lab_image.shape[0]):
-        for j in range(lab_image.shape[1]):
-            L, a, b = lab_image[i, j]
-            x, y, z = lab_to_xyz(L, a, b)
-            xyz_image[i, j] = [x, y, z]
+    Args:
+        lab_image: LAB görüntü (H, W, 3)
+        out: İsteğe bağlı çıktı tamponu; verilirse sonuç buraya yazılır
+        encoding: Çıktı kodlaması (bkz. `kodlama`); varsayılan float32
     
-    return xyz_image
+    Returns:
+        np.ndarray: XYZ görüntü (H, W, 3), `encoding` veri tipinde
+    """
+    return apply_blocked(_lab_to_xyz_kernel, lab_image, encoding_dtype(encoding),
+                         out=out, space='xyz')
+
+
+def xyz_to_lab_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda XYZ'den LAB'a dönüştür (D65).
+    
+    Args:
+        colors: XYZ renkler (N, 3)
+    
+    Returns:
+        np.ndarray: LAB renkler (N, 3), float32
+    """
+    return xyz_image_to_lab(as_color_array(colors))
+
+
+def lab_to_xyz_batch(colors) -> np.ndarray:
+    """
+    N rengi tek çağrıda LAB'dan XYZ'ye dönüştür (D65).
+    
+    Args:
+        colors: LAB renkler (N, 3)
+    
+    Returns:
+        np.ndarray: XYZ renkler (N, 3), float32
+    """
+    return lab_image_to_xyz(as_color_array(colors))
 
 
 # Test
@@ -192,3 +300,11 @@ if __name__ == "__main__":
         print(f"  LAB → XYZ({x2:.2f}, {y2:.2f}, {z2:.2f})")
         match = abs(x-x2) < 0.01 and abs(y-y2) < 0.01 and abs(z-z2) < 0.01
         print(f"  Doğrulama: {'✓' if match else '✗'}\n")
+    
+    # Vektörel görüntü dönüşümü: skaler sonuçlarla ve geri dönüşümle karşılaştır
+    xyz_goruntu = np.array([[[x, y, z] for _, x, y, z in test_colors]], dtype=np.float32)
+    lab_goruntu = xyz_image_to_lab(xyz_goruntu)
+    skaler = np.array([[xyz_to_lab(x, y, z) for _, x, y, z in test_colors]])
+    print("Görüntü dönüşümü:")
+    print(f"  Skaler ile fark: {np.abs(lab_goruntu - skaler).max():.2e}")
+    print(f"  Geri dönüşüm farkı: {np.abs(lab_image_to_xyz(lab_goruntu) - xyz_goruntu).max():.2e}")
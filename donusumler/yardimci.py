@@ -0,0 +1,217 @@
+"""
+Dizi İşlemleri için Yardımcılar
+===============================
+Görüntü dönüşümlerinin ortak kullandığı blok (parça) yardımcıları.
+
+Vektörel dönüşümler tüm görüntüyü tek seferde işlemek yerine piksel
+bloklarıyla çalışır. Böylece ara diziler işlemci önbelleğinde kalır ve
+ek bellek kullanımı görüntü boyutundan bağımsız, küçük bir sabit olur.
+"""
+
+import numpy as np
+from .kodlama import encode_block
+
+# Blok başına piksel sayısı (float32 ara diziler ≈ 64 KB → L2 önbelleğe sığar)
+BLOK_PIKSEL = 1 << 14
+
+
+def pixel_blocks(n: int, blok: int = BLOK_PIKSEL):
+    """
+    0..n aralığını ardışık bloklara böler.
+    
+    Args:
+        n: Toplam piksel sayısı
+        blok: Blok başına piksel sayısı
+    
+    Yields:
+        slice: Her blok için piksel aralığı
+    """
+    for bas in range(0, n, blok):
+        yield slice(bas, min(bas + blok, n))
+
+
+def check_output(out: np.ndarray, shape: tuple, dtype) -> np.ndarray:
+    """
+    Çağıranın verdiği çıktı tamponunu doğrular.
+    
+    Tampon doğrudan blok blok yazılacağı için biçim ve veri tipi birebir
+    uymalı, dizi C-sıralı bitişik ve yazılabilir olmalıdır. Dönüştürme
+    veya kopyalama yapılmaz; uymayan tampon açık bir hata ile reddedilir.
+    
+    Args:
+        out: Çıktı tamponu
+        shape: Beklenen biçim
+        dtype: Beklenen veri tipi
+    
+    Returns:
+        np.ndarray: Doğrulanmış tampon (`out`)
+    """
+    if not isinstance(out, np.ndarray):
+        raise TypeError(f"out bir np.ndarray olmalı, verilen: {type(out).__name__}")
+    if out.shape != tuple(shape):
+        raise ValueError(f"out biçimi {out.shape}, beklenen {tuple(shape)}")
+    if out.dtype != np.dtype(dtype):
+        raise TypeError(f"out veri tipi {out.dtype}, beklenen {np.dtype(dtype)}")
+    if not out.flags.c_contiguous:
+        raise ValueError("out C-sıralı bitişik bir dizi olmalı")
+    if not out.flags.writeable:
+        raise ValueError("out yazılabilir olmalı")
+    return out
+
+
+def apply_blocked(kernel, image: np.ndarray, dtype, out: np.ndarray = None,
+                  space: str = None) -> np.ndarray:
+    """
+    (..., 3) biçimli bir diziye bloklar halinde çekirdek fonksiyon uygular.
+    
+    Girdi (N, 3) biçimine düzleştirilir, her blok için `kernel(girdi, çıktı)`
+    çağrılır ve sonuç girdiyle aynı biçimde döndürülür.
+    
+    `out` verilirse sonuç yeni dizi ayrılmadan bu tampona yazılır. Tampon
+    girdinin kendisi olabilir (yerinde dönüşüm); bu durumda her blok
+    işlenmeden önce küçük bir geçici kopyaya alınır.
+    
+    float32/float64 çıktılarda çekirdek doğrudan çıktı dilimine yazar.
+    `space` verilmiş ve çıktı float16/uint8 ise çekirdek blok boyutunda bir
+    float32 ara diziye yazar, sonuç `encode_block` ile kodlanarak aktarılır.
+    
+    Args:
+        kernel: (blok, 3) girdi ve çıktı dilimlerini alan fonksiyon
+        image: Girdi dizisi (..., 3)
+        dtype: Çıktı veri tipi
+        out: İsteğe bağlı çıktı tamponu (bkz. `check_output`)
+        space: Kodlanacak renk uzayı (bkz. `kodlama.encode_block`)
+    
+    Returns:
+        np.ndarray: Çıktı dizisi (..., 3)
+    """
+    image = np.asarray(image)
+    kaynak = image.reshape(-1, 3)
+    
+    if out is None:
+        sonuc = np.empty(kaynak.shape, dtype=dtype)
+        yerinde = False
+    else:
+        sonuc = check_output(out, image.shape, dtype).reshape(-1, 3)
+        yerinde = np.may_share_memory(kaynak, sonuc)
+        if yerinde and not (kaynak.ctypes.data == sonuc.ctypes.data
+                            and kaynak.strides == sonuc.strides):
+            raise ValueError("out girdi ile kısmen örtüşüyor; yalnızca tam yerinde dönüşüm desteklenir")
+    
+    kodla = space is not None and sonuc.dtype not in (np.float32, np.float64)
+    ara = np.empty((min(BLOK_PIKSEL, kaynak.shape[0]), 3), dtype=np.float32) if kodla else None
+    
+    for dilim in pixel_blocks(kaynak.shape[0]):
+        blok = kaynak[dilim]
+        if yerinde:
+            blok = blok.copy()
+        if ara is None:
+            kernel(blok, sonuc[dilim])
+        else:
+            hedef = ara[:dilim.stop - dilim.start]
+            kernel(blok, hedef)
+            encode_block(hedef, sonuc[dilim], space)
+    
+    return sonuc.reshape(image.shape) if out is None else out
+
+
+def work_dtype(cikti: np.ndarray) -> type:
+    """
+    Çekirdeklerin hesap hassasiyetini çıktı dilimine göre seçer.
+    
+    Args:
+        cikti: Çekirdeğin yazacağı çıktı dilimi
+    
+    Returns:
+        type: float64 çıktıda np.float64, diğer durumlarda np.float32
+    """
+    return np.float64 if cikti.dtype == np.float64 else np.float32
+
+
+def probe_output_dtype(converter, image: np.ndarray) -> np.dtype:
+    """
+    Bir görüntü dönüşümünün çıktı veri tipini tek piksel dönüştürerek bulur.
+    
+    Args:
+        converter: Görüntü dönüşüm fonksiyonu
+        image: Girdi dizisi (..., 3)
+    
+    Returns:
+        np.dtype: Çıktı veri tipi
+    """
+    image = np.asarray(image)
+    return converter(image.reshape(-1, 3)[:1]).dtype
+
+
+def as_color_array(colors) -> np.ndarray:
+    """
+    Toplu (batch) fonksiyonların girdisini (N, 3) diziye çevirir.
+    
+    Args:
+        colors: Renk listesi veya dizisi [(c1, c2, c3), ...]
+    
+    Returns:
+        np.ndarray: (N, 3) dizi (veri tipi korunur)
+    """
+    colors = np.asarray(colors)
+    if colors.ndim != 2 or colors.shape[1] != 3:
+        raise ValueError(f"Renkler (N, 3) biçiminde olmalı, verilen: {colors.shape}")
+    return colors
+
+
+def input_scale(dtype) -> float:
+    """
+    Girdi görüntünün tam ölçek değerini veri tipinden belirler.
+    
+    Piksel başına `max(r, g, b) > 1` kontrolü yerine ölçek görüntü başına
+    bir kez, yalnızca dtype'a bakılarak seçilir:
+    - uint16: 0-65535
+    - diğer tamsayı tipleri (uint8, int32, ...): 0-255
+    - float: 0-1 (değer aralığı burada sınanmaz, bkz. `rgb_input_scale`)
+    
+    Args:
+        dtype: Girdi dizisinin veri tipi
+    
+    Returns:
+        float: Tam ölçek (beyaz) değeri
+    """
+    dtype = np.dtype(dtype)
+    if dtype == np.uint16:
+        return 65535.0
+    if dtype.kind in 'ui':
+        return 255.0
+    if dtype.kind == 'f':
+        return 1.0
+    raise TypeError(f"Desteklenmeyen görüntü veri tipi: {dtype}")
+
+
+# Float girdide kabul edilen en büyük değer: beyazın bir 8-bit adım üstü
+# (yuvarlama / gamut dışı küçük taşmalar reddedilmesin diye)
+FLOAT_UST_SINIR = 1.0 + 1 / 255
+
+
+def rgb_input_scale(image: np.ndarray) -> float:
+    """
+    RGB görüntünün tam ölçeğini bulur; float girdinin 0-1 olduğunu sınar.
+    
+    Ölçek `input_scale` ile veri tipinden seçilir. Float girdi her zaman
+    0-1 kabul edildiğinden 0-255 ölçekli bir float görüntü (ör.
+    `img.astype(np.float32)`) sessizce 255 kat parlak yorumlanırdı. Bunu
+    yakalamak için görüntü başına bir kez, eşit aralıklı en fazla
+    `BLOK_PIKSEL` pikselin en büyük değerine bakılır; tam tarama yapılmaz.
+    
+    Args:
+        image: RGB görüntü (..., 3)
+    
+    Returns:
+        float: Tam ölçek (beyaz) değeri
+    """
+    olcek = input_scale(image.dtype)
+    if image.dtype.kind == 'f' and image.size:
+        kaynak = image.reshape(-1, 3)
+        ornek = kaynak[::max(1, kaynak.shape[0] // BLOK_PIKSEL)]
+        en_buyuk = ornek.max()
+        if en_buyuk > FLOAT_UST_SINIR:
+            raise ValueError(f"Float RGB girdi 0-1 aralığında olmalı, en büyük değer {en_buyuk:g}; "
+                             f"0-255 ölçekli görüntüyü 255'e bölün veya uint8'e çevirin")
+    return olcek
@@ -99,10 +99,11 @@ def gorev3_delta_e_gruplama(goruntu: np.ndarray):
     grup_sayisi = len(grup_renkleri)
     renk_paleti = np.zeros((100, grup_sayisi * 100, 3), dtype=np.uint8)
 
-    for i, renk_lab in enumerate(grup_renkleri):
-        lab_pixel = np.uint8([[renk_lab]])
-        bgr_pixel = cv2.cvtColor(lab_pixel.reshape(1, 1, 3), cv2.COLOR_LAB2BGR)
-        renk_bgr = bgr_pixel[0, 0]
+    # Tüm paleti tek bir (1, N, 3) görüntü olarak tek çağrıda BGR'ye çeviriyorum
+    lab_paleti = np.uint8([grup_renkleri])
+    bgr_paleti = cv2.cvtColor(lab_paleti, cv2.COLOR_LAB2BGR)[0]
+
+    for i, renk_bgr in enumerate(bgr_paleti):
         renk_paleti[:, i*100:(i+1)*100] = renk_bgr
 
     # 5️⃣ Paleti göster
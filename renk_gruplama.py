@@ -7,6 +7,7 @@ LAB uzayında benzer renkleri gruplar.
 import cv2
 import numpy as np
 from collections import defaultdict
+from donusumler import PaletteIndex, delta_e_matrix, nearest_colors
 
 
 def delta_e_cie76(lab1, lab2):
@@ -14,103 +15,783 @@ def delta_e_cie76(lab1, lab2):
     return np.sqrt(np.sum((np.array(lab1) - np.array(lab2)) ** 2))
 
 
-def dominant_renkler_bul(goruntu: np.ndarray, k: int = 8) -> np.ndarray:
+# Örnekleme yöntemleri (dominant_renkler_bul)
+# - duzgun: Tüm piksellerden eşit olasılıklı rastgele seçim
+# - izgara: Görüntü hücrelere bölünür, her hücreden bir rastgele piksel
+# - doygunluk: Seçilme olasılığı LAB kromasıyla (doygunluk) orantılı
+ORNEKLEME_YONTEMLERI = ('duzgun', 'izgara', 'doygunluk')
+
+# Varsayılan örnek bütçesi: palet bu boyutun üzerinde pek değişmiyor
+PIKSEL_BUTCESI = 200_000
+
+
+def pikselleri_ornekle(lab: np.ndarray, yontem: str = 'duzgun',
+                       butce: int = PIKSEL_BUTCESI, seed: int = 0) -> np.ndarray:
+    """
+    K-Means için LAB görüntüden en fazla `butce` piksel örnekler.
+    
+    Args:
+        lab: LAB görüntü (H, W, 3), OpenCV 8-bit ölçeği
+        yontem: 'duzgun', 'izgara' veya 'doygunluk'
+        butce: İstenen örnek sayısı (yaklaşık; ızgarada hücre sayısı kadar)
+        seed: Rastgele sayı üreteci tohumu
+    
+    Returns:
+        np.ndarray: (n, 3) örnek pikseller, uint8
+    """
+    if yontem not in ORNEKLEME_YONTEMLERI:
+        raise ValueError(f"Bilinmeyen örnekleme: {yontem}. Seçenekler: {ORNEKLEME_YONTEMLERI}")
+    
+    h, w = lab.shape[:2]
+    pikseller = lab.reshape(-1, 3)
+    if h * w <= butce:
+        return pikseller
+    rng = np.random.default_rng(seed)
+    
+    if yontem == 'duzgun':
+        return pikseller[rng.choice(h * w, butce, replace=False)]
+    
+    if yontem == 'izgara':
+        # Kenarı `adim` piksel olan hücreler, her hücreden bir piksel
+        adim = int(np.ceil(np.sqrt(h * w / butce)))
+        satirlar = np.arange(0, h, adim)
+        sutunlar = np.arange(0, w, adim)
+        kayma = rng.integers(0, adim, (2, len(satirlar), len(sutunlar)))
+        y = np.minimum(satirlar[:, np.newaxis] + kayma[0], h - 1)
+        x = np.minimum(sutunlar[np.newaxis, :] + kayma[1], w - 1)
+        return lab[y.ravel(), x.ravel()]
+    
+    # Doygunluk ağırlıklı (yerine koyarak): ağırlık = kroma + 1 (griler de seçilebilsin)
+    a = pikseller[:, 1].astype(np.float32) - 128
+    b = pikseller[:, 2].astype(np.float32) - 128
+    agirlik = np.hypot(a, b) + 1
+    return pikseller[rng.choice(h * w, butce, p=agirlik / agirlik.sum())]
+
+
+# Histogram modunda kanal başına bit sayısı (5 bit → 32³ kutu)
+HISTOGRAM_BITI = 5
+
+
+def renk_histogrami(goruntu: np.ndarray, uzay: str = 'lab', bit: int = HISTOGRAM_BITI,
+                    lab: np.ndarray = None) -> tuple:
+    """
+    Görüntüyü kanal başına `bit` bitle niceler ve dolu kutuları döndürür.
+    
+    Her dolu kutu, içine düşen piksellerin ortalaması ile temsil edilir
+    (kutu merkezinden daha doğru); ağırlığı piksel sayısıdır. Sonuç her
+    durumda LAB'dadır: BGR'de nicelenen kutuların ortalamaları LAB'a
+    çevrilir.
+    
+    Args:
+        goruntu: BGR formatında görüntü
+        uzay: Niceleme uzayı ('lab' veya 'bgr')
+        bit: Kanal başına bit sayısı (1-8)
+        lab: İsteğe bağlı, önceden hesaplanmış LAB görüntü
+    
+    Returns:
+        tuple: (kutu renkleri (n, 3) float32 LAB, ağırlıklar (n,) float64)
+    """
+    if uzay not in ('lab', 'bgr'):
+        raise ValueError(f"Bilinmeyen histogram uzayı: {uzay}. Seçenekler: ('lab', 'bgr')")
+    if not 1 <= bit <= 8:
+        raise ValueError(f"bit 1 ile 8 arasında olmalı: {bit}")
+    
+    if uzay == 'lab':
+        kaynak = cv2.cvtColor(goruntu, cv2.COLOR_BGR2LAB) if lab is None else lab
+    else:
+        kaynak = goruntu
+    pikseller = kaynak.reshape(-1, 3)
+    
+    # Kutu kodu: her kanalın üst `bit` biti yan yana
+    kayma = 8 - bit
+    kod = (pikseller[:, 0] >> kayma).astype(np.int32) << (2 * bit)
+    kod |= (pikseller[:, 1] >> kayma).astype(np.int32) << bit
+    kod |= pikseller[:, 2] >> kayma
+    
+    sayilar = np.bincount(kod, minlength=1 << (3 * bit))
+    dolu = np.flatnonzero(sayilar)
+    agirliklar = sayilar[dolu].astype(np.float64)
+    ortalamalar = np.stack([np.bincount(kod, weights=pikseller[:, c], minlength=len(sayilar))[dolu]
+                            for c in range(3)], axis=1) / agirliklar[:, np.newaxis]
+    
+    if uzay == 'bgr':
+        bgr = np.clip(np.rint(ortalamalar), 0, 255).astype(np.uint8)
+        ortalamalar = cv2.cvtColor(bgr[np.newaxis], cv2.COLOR_BGR2LAB)[0]
+    return ortalamalar.astype(np.float32), agirliklar
+
+
+def agirlikli_kmeans(noktalar: np.ndarray, agirliklar: np.ndarray, k: int,
+                     deneme: int = 10, max_iter: int = 100, eps: float = 0.2,
+                     seed: int = 0) -> np.ndarray:
+    """
+    Ağırlıklı K-Means (Lloyd) - cv2.kmeans ağırlık desteklemediği için NumPy ile.
+    
+    Her denemede merkezler ağırlıklı k-means++ ile seçilir; merkezler
+    ağırlıklı ortalama ile güncellenir ve hiçbir merkez `eps`'ten fazla
+    kaymayınca (veya `max_iter` sonunda) durulur. En küçük ağırlıklı hata
+    kareleri toplamını veren deneme döndürülür. Nokta sayısı histogram
+    kutuları kadar (birkaç bin) olduğundan (n, k) mesafe dizisi küçüktür.
+    
+    Args:
+        noktalar: (n, 3) noktalar
+        agirliklar: (n,) negatif olmayan ağırlıklar
+        k: Küme sayısı (≤ n)
+        deneme: Farklı başlangıçla deneme sayısı
+        max_iter: Deneme başına en fazla iterasyon
+        eps: Merkez kayması durma eşiği
+        seed: Rastgele sayı üreteci tohumu
+    
+    Returns:
+        np.ndarray: (k, 3) merkezler, float32
+    """
+    noktalar = np.asarray(noktalar, dtype=np.float64)
+    agirliklar = np.asarray(agirliklar, dtype=np.float64)
+    n = len(noktalar)
+    if not 1 <= k <= n:
+        raise ValueError(f"k 1 ile nokta sayısı ({n}) arasında olmalı: {k}")
+    rng = np.random.default_rng(seed)
+    
+    en_iyi_hata, en_iyi = np.inf, None
+    for _ in range(deneme):
+        # Ağırlıklı k-means++ başlangıcı
+        merkezler = np.empty((k, 3))
+        merkezler[0] = noktalar[rng.choice(n, p=agirliklar / agirliklar.sum())]
+        en_yakin_kare = ((noktalar - merkezler[0]) ** 2).sum(axis=1)
+        for j in range(1, k):
+            olasilik = agirliklar * en_yakin_kare
+            toplam = olasilik.sum()
+            secilen = rng.choice(n, p=olasilik / toplam) if toplam > 0 else rng.integers(n)
+            merkezler[j] = noktalar[secilen]
+            np.minimum(en_yakin_kare, ((noktalar - merkezler[j]) ** 2).sum(axis=1),
+                       out=en_yakin_kare)
+        
+        for _ in range(max_iter):
+            mesafe = ((noktalar[:, np.newaxis] - merkezler[np.newaxis]) ** 2).sum(axis=2)
+            etiketler = mesafe.argmin(axis=1)
+            kutle = np.bincount(etiketler, weights=agirliklar, minlength=k)
+            yeni = np.stack([np.bincount(etiketler, weights=agirliklar * noktalar[:, c], minlength=k)
+                             for c in range(3)], axis=1)
+            bos = kutle == 0
+            yeni[~bos] /= kutle[~bos, np.newaxis]
+            yeni[bos] = merkezler[bos]  # Boş küme: merkez yerinde kalır
+            kayma = np.sqrt(((yeni - merkezler) ** 2).sum(axis=1)).max()
+            merkezler = yeni
+            if kayma <= eps:
+                break
+        
+        mesafe = ((noktalar[:, np.newaxis] - merkezler[np.newaxis]) ** 2).sum(axis=2)
+        hata = (agirliklar * mesafe.min(axis=1)).sum()
+        if hata < en_iyi_hata:
+            en_iyi_hata, en_iyi = hata, merkezler
+    
+    return en_iyi.astype(np.float32)
+
+
+def dominant_renkler_bul(goruntu: np.ndarray, k: int = 8, ornekleme: str = None,
+                         butce: int = PIKSEL_BUTCESI, etiketleri_dondur: bool = False,
+                         seed: int = 0, histogram: str = None, bit: int = HISTOGRAM_BITI):
     """
     K-Means ile görüntüdeki baskın renkleri bulur.
     
+    `ornekleme` verilirse K-Means tüm pikseller yerine en fazla `butce`
+    örnek üzerinde çalışır (bkz. `pikselleri_ornekle`); maliyet
+    çözünürlükten bağımsız olur.
+    
+    `histogram` verilirse renkler o uzayda kanal başına `bit` bitle
+    nicelenir ve K-Means dolu kutular üzerinde, piksel sayıları ağırlık
+    olarak çalışır (bkz. `renk_histogrami`, `agirlikli_kmeans`). 12 MP'lik
+    bir görüntü birkaç bin ağırlıklı noktaya iner.
+    
+    Etiketler istenirse bütün pikseller kümelemeden sonra tek vektörel
+    geçişle en yakın merkeze atanır.
+    
     Args:
         goruntu: BGR formatında görüntü
         k: Renk sayısı
+        ornekleme: None (tüm pikseller), 'duzgun', 'izgara' veya 'doygunluk'
+        butce: Örnekleme modunda piksel bütçesi
+        etiketleri_dondur: True ise (merkezler, etiketler (H, W) uint8) döner
+        seed: Örnekleme / ağırlıklı K-Means tohumu
+        histogram: None, 'lab' veya 'bgr' (niceleme uzayı)
+        bit: Histogram modunda kanal başına bit sayısı
     
     Returns:
-        np.ndarray: Baskın renkler (LAB formatında)
+        np.ndarray: Baskın renkler (LAB formatında); etiketleri_dondur ise
+        (merkezler, etiketler) demeti
     """
+    if ornekleme is not None and histogram is not None:
+        raise ValueError("ornekleme ve histogram birlikte kullanılamaz")
+    
     # LAB'a dönüştür
     lab = cv2.cvtColor(goruntu, cv2.COLOR_BGR2LAB)
-    pixels = lab.reshape(-1, 3).astype(np.float32)
     
-    # K-Means
-    criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 100, 0.2)
-    _, labels, centers = cv2.kmeans(pixels, k, None, criteria, 10, cv2.KMEANS_RANDOM_CENTERS)
+    if histogram is not None:
+        # Ağırlıklı K-Means (dolu histogram kutuları üzerinde)
+        kutular, agirliklar = renk_histogrami(goruntu, histogram, bit, lab=lab)
+        centers = agirlikli_kmeans(kutular, agirliklar, min(k, len(kutular)), seed=seed)
+    else:
+        if ornekleme is None:
+            pixels = lab.reshape(-1, 3).astype(np.float32)
+        else:
+            pixels = pikselleri_ornekle(lab, ornekleme, butce, seed).astype(np.float32)
+        
+        # K-Means
+        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 100, 0.2)
+        _, labels, centers = cv2.kmeans(pixels, k, None, criteria, 10, cv2.KMEANS_RANDOM_CENTERS)
+    
+    if not etiketleri_dondur:
+        return centers
     
-    return centers
+    # Tüm pikselleri tek geçişte son merkezlere ata
+    etiketler = PaletteIndex(centers).labels(lab, out=np.empty(lab.shape[:2], dtype=np.uint8))
+    return centers, etiketler
 
 
-def renkleri_grupla(renkler_lab: list, esik: float = 10.0) -> dict:
+def palet_kaymasi(palet: np.ndarray, referans: np.ndarray) -> tuple:
     """
-    Delta E eşiğine göre benzer renkleri gruplar.
+    İki palet arasındaki kaymayı Delta E (CIE76) olarak ölçer.
+    
+    Her renk diğer paletteki en yakın rengiyle eşlenir (iki yönde);
+    sıralamadan bağımsızdır.
     
     Args:
-        renkler_lab: LAB renk listesi [(L, a, b), ...]
-        esik: Maksimum Delta E değeri (aynı grup için)
+        palet: (k, 3) LAB palet
+        referans: (m, 3) LAB referans palet (ör. tüm veriyle K-Means)
     
     Returns:
-        dict: {grup_id: [renkler]}
+        tuple: (ortalama ΔE, en büyük ΔE)
     """
-    gruplar = defaultdict(list)
-    atanmis = set()
-    grup_id = 0
+    mesafe = delta_e_matrix(palet, referans, metric='cie76')
+    en_yakin = np.concatenate([mesafe.min(axis=1), mesafe.min(axis=0)])
+    return float(en_yakin.mean()), float(en_yakin.max())
+
+
+class PaletTakipci:
+    """
+    Video / kamera kareleri için akışlı (mini-batch) K-Means palet takipçisi.
+    
+    Her karede `dominant_renkler_bul` ile sıfırdan ve rastgele merkezlerle
+    başlamak yerine önceki palet korunur ve yeni kareden alınan küçük bir
+    piksel partisiyle artımlı güncellenir (Sculley, 2010):
+        
+        n_c ← min(n_c, hafiza) + b_c
+        c   ← c + (b_c / n_c) · (partideki ortalama_c - c)
+    
+    `hafiza` tavanı eski karelerin etkisini sınırlar; palet yavaş ışık
+    değişimlerini izlemeye devam eder. Parti yalnızca örneklenen
+    pikseller LAB'a çevrilerek oluşturulur (kare başına birkaç ms).
+    
+    Kaymanın ölçüsü partinin palete uyumudur: piksellerin en yakın merkeze
+    ortalama ΔE'si, son tohumlamadaki değeri `esik`'ten fazla aşarsa (ör.
+    sahne değişimi) palet kareden yeniden tohumlanır (histogram modu).
+    
+    Kullanım:
+        takipci = PaletTakipci(k=8)
+        for kare in kareler:
+            palet = takipci.guncelle(kare)
+    
+    Args:
+        k: Renk sayısı
+        parti: Kare başına örneklenen piksel sayısı
+        esik: Yeniden tohumlama için ΔE kayma eşiği
+        hafiza: Merkez başına etkin örnek sayısı tavanı
+        seed: Rastgele sayı üreteci tohumu
+    """
+    
+    def __init__(self, k: int = 8, parti: int = 4096, esik: float = 6.0,
+                 hafiza: int = 1024, seed: int = 0):
+        self.k = k
+        self.parti = parti
+        self.esik = esik
+        self.hafiza = hafiza
+        self.rng = np.random.default_rng(seed)
+        self.merkezler = None
+        self.sayilar = None
+        self.taban_hata = 0.0
+        self.kayma = 0.0
+        self.kare_sayisi = 0
+        self.tohumlama_sayisi = 0
+    
+    def _parti_al(self, goruntu: np.ndarray) -> np.ndarray:
+        """Kareden rastgele `parti` piksel seçip yalnızca onları LAB'a çevirir."""
+        bgr = goruntu.reshape(-1, 3)
+        secilen = bgr[self.rng.integers(0, len(bgr), self.parti)]
+        return cv2.cvtColor(secilen[np.newaxis], cv2.COLOR_BGR2LAB)[0].astype(np.float32)
+    
+    def _etiketle(self, parti: np.ndarray) -> np.ndarray:
+        """
+        Partiyi en yakın merkezlere atar.
+        
+        Merkezler her karede değiştiği için `PaletteIndex` yerine kurulum
+        gerektirmeyen `nearest_colors` kullanılır (parti küçüktür).
+        """
+        return nearest_colors(parti, self.merkezler, metric='cie76')[0][:, 0]
+    
+    def _hata(self, parti: np.ndarray, etiketler: np.ndarray) -> float:
+        """Partinin atandığı merkezlere ortalama ΔE'si."""
+        return float(np.sqrt(((parti - self.merkezler[etiketler]) ** 2).sum(axis=1)).mean())
+    
+    def tohumla(self, goruntu: np.ndarray) -> np.ndarray:
+        """
+        Paleti kareden sıfırdan kurar (histogram modunda K-Means).
+        
+        Args:
+            goruntu: BGR formatında kare
+        
+        Returns:
+            np.ndarray: (k, 3) LAB palet (kopya; takipçinin iç durumu değil)
+        """
+        self.merkezler = dominant_renkler_bul(goruntu, k=self.k, histogram='lab',
+                                              seed=int(self.rng.integers(1 << 31)))
+        parti = self._parti_al(goruntu)
+        etiketler = self._etiketle(parti)
+        self.sayilar = np.bincount(etiketler, minlength=len(self.merkezler)).astype(np.float64)
+        self.taban_hata = self._hata(parti, etiketler)
+        self.kayma = 0.0
+        self.tohumlama_sayisi += 1
+        return self.merkezler.copy()
+    
+    def guncelle(self, goruntu: np.ndarray) -> np.ndarray:
+        """
+        Paleti yeni kareyle günceller (ilk karede veya kayma eşiği aşılınca tohumlar).
+        
+        Args:
+            goruntu: BGR formatında kare
+        
+        Returns:
+            np.ndarray: (k, 3) güncel LAB palet; kopyadır, sonraki
+            güncellemeler önceki karelerde döndürülen paletleri değiştirmez
+            (merkez sırası kareler arasında korunur; yeniden tohumlamada
+            değişebilir)
+        """
+        self.kare_sayisi += 1
+        if self.merkezler is None:
+            return self.tohumla(goruntu)
+        
+        parti = self._parti_al(goruntu)
+        etiketler = self._etiketle(parti)
+        
+        # Kayma: partinin palete uyumu, tohumlamadaki uyuma göre ne kadar kötüleşti
+        self.kayma = self._hata(parti, etiketler) - self.taban_hata
+        if self.kayma > self.esik:
+            return self.tohumla(goruntu)
+        
+        # Mini-batch güncellemesi (merkez başına parti ortalamasına doğru)
+        k = len(self.merkezler)
+        adet = np.bincount(etiketler, minlength=k).astype(np.float64)
+        toplam = np.stack([np.bincount(etiketler, weights=parti[:, c], minlength=k)
+                           for c in range(3)], axis=1)
+        dolu = adet > 0
+        np.minimum(self.sayilar, self.hafiza, out=self.sayilar)
+        self.sayilar += adet
+        ortalama = toplam[dolu] / adet[dolu, np.newaxis]
+        oran = (adet[dolu] / self.sayilar[dolu])[:, np.newaxis]
+        self.merkezler[dolu] += (oran * (ortalama - self.merkezler[dolu])).astype(np.float32)
+        return self.merkezler.copy()
+
+
+# Gruplama yöntemleri (renkleri_grupla)
+# - lider: Sıradaki atanmamış renk lider olur, eşik içindeki atanmamış
+#   renkleri grubuna alır (açgözlü; önceki döngü ile aynı sonuç)
+# - tek_baglanti: Eşik içindeki renkler zincirleme aynı gruba düşer
+#   (tek bağlantılı kümeleme = eşik grafının bağlı bileşenleri)
+GRUPLAMA_YONTEMLERI = ('lider', 'tek_baglanti')
+
+# Aday çift üretiminde parti başına en fazla çift sayısı (bellek sınırı)
+CIFT_PARCASI = 1 << 20
+
+
+def _renk_izgarasi(renkler: np.ndarray, kenar: float) -> tuple:
+    """
+    Renkleri kenarı `kenar` olan küp hücrelere yerleştirir.
+    
+    Hücre kenarı ≥ esik ise eşik içindeki iki renk ya aynı ya da komşu
+    hücrededir. Hücre kodunda z ekseni en hızlı değişen eksendir.
+    
+    Returns:
+        tuple: (sira: hücreye göre sıralı renk indeksleri, kod_sirali,
+               hucreler: dolu hücre kodları, baslangic, sayilar: hücrelerin
+               `sira` içindeki aralıkları, koordinat: dolu hücre
+               koordinatları, boyut: ızgara boyutu)
+    """
+    hucre = np.floor(renkler / kenar).astype(np.int64)
+    hucre -= hucre.min(axis=0)
+    boyut = hucre.max(axis=0) + 1
+    kod = (hucre[:, 0] * boyut[1] + hucre[:, 1]) * boyut[2] + hucre[:, 2]
+    
+    sira = np.argsort(kod, kind='stable')
+    kod_sirali = kod[sira]
+    hucreler, baslangic, sayilar = np.unique(kod_sirali, return_index=True, return_counts=True)
+    return sira, kod_sirali, hucreler, baslangic, sayilar, hucre[sira[baslangic]], boyut
+
+
+def _aday_partileri(izgara: tuple, erisim: int = 1, kendi: bool = True, atla=None):
+    """
+    Komşu hücrelerdeki aday renk çiftlerini partiler halinde üretir.
+    
+    Her dolu hücre, her eksende en fazla `erisim` hücre uzaklıktaki
+    "ileri" komşularıyla (her hücre çifti bir kez; erisim=1 için kendisi
+    ve 13 komşu) eşleştirilir. Büyük hücre çiftleri, `a` hücresinin satır
+    aralıklarına bölünür; böylece her parti en fazla CIFT_PARCASI aday
+    çift içerir (tek bir hücre CIFT_PARCASI / 2'den fazla renk içermediği
+    sürece) ve bellek kullanımı renk dağılımından bağımsız kalır.
+    
+    Args:
+        izgara: `_renk_izgarasi` sonucu
+        erisim: Eksen başına komşu hücre uzaklığı
+        kendi: False ise hücre içi çiftler üretilmez
+        atla: İsteğe bağlı atla(a_hucre, b_hucre) → bool maske; her parti
+              üretilmeden hemen önce çağrılır, True olan hücre çiftleri
+              (o anki duruma göre gereksiz olanlar) atlanır
+    
+    Yields:
+        tuple: (ia, ib) int64 aday çiftleri (her sırasız çift bir kez)
+    """
+    sira, _, hucreler, baslangic, sayilar, koordinat, boyut = izgara
+    yarim = max(1, CIFT_PARCASI // 2)
+    adim = range(-erisim, erisim + 1)
+    ofsetler = [(dx, dy, dz) for dx in adim for dy in adim for dz in adim
+                if (dx, dy, dz) > (0, 0, 0) or (kendi and (dx, dy, dz) == (0, 0, 0))]
     
-    for i, renk1 in enumerate(renkler_lab):
-        if i in atanmis:
+    for ofset in ofsetler:
+        # Komşu hücre (varsa) her dolu hücre için
+        komsu = koordinat + ofset
+        gecerli = ((komsu >= 0) & (komsu < boyut)).all(axis=1)
+        komsu_kod = (komsu[:, 0] * boyut[1] + komsu[:, 1]) * boyut[2] + komsu[:, 2]
+        yer = np.minimum(np.searchsorted(hucreler, komsu_kod), len(hucreler) - 1)
+        gecerli &= hucreler[yer] == komsu_kod
+        a = np.flatnonzero(gecerli)
+        if len(a) == 0:
             continue
+        b = yer[a]
+        ca, cb = sayilar[a], sayilar[b]
         
-        gruplar[grup_id].append(renk1)
-        atanmis.add(i)
+        # Hücre çiftlerini `a` satır aralıklarına böl: her öğe en fazla `yarim` çift
+        satir = np.maximum(1, yarim // cb)
+        oge_sayisi = -(-ca // satir)
+        oge = np.repeat(np.arange(len(a)), oge_sayisi)
+        kayma = (np.arange(len(oge)) - np.repeat(np.cumsum(oge_sayisi) - oge_sayisi, oge_sayisi))
+        kayma *= satir[oge]
+        bas_a = baslangic[a][oge] + kayma
+        uzun_a = np.minimum(satir[oge], ca[oge] - kayma)
+        bas_b = baslangic[b][oge]
+        uzun_b = cb[oge]
         
-        for j, renk2 in enumerate(renkler_lab):
-            if j in atanmis:
-                continue
-            
-            de = delta_e_cie76(renk1, renk2)
-            if de <= esik:
-                gruplar[grup_id].append(renk2)
-                atanmis.add(j)
+        # Öğeleri başlangıç konumlarına göre `yarim` boyutlu pencerelere grupla
+        # (parti = pencere içinde başlayan öğeler ≤ yarim + bir öğe ≤ CIFT_PARCASI)
+        boyutlar = uzun_a * uzun_b
+        pencere = (np.cumsum(boyutlar) - boyutlar) // yarim
+        sinirlar = np.flatnonzero(np.diff(pencere)) + 1
         
+        for parti in np.split(np.arange(len(oge)), sinirlar):
+            if atla is not None:
+                parti = parti[~atla(a[oge[parti]], b[oge[parti]])]
+                if len(parti) == 0:
+                    continue
+            ua, ub = uzun_a[parti], uzun_b[parti]
+            tekrar = ua * ub
+            cift = np.repeat(np.arange(len(parti)), tekrar)
+            icerde = np.arange(tekrar.sum()) - np.repeat(np.cumsum(tekrar) - tekrar, tekrar)
+            pa = bas_a[parti][cift] + icerde // ub[cift]
+            pb = bas_b[parti][cift] + icerde % ub[cift]
+            if ofset == (0, 0, 0):
+                tut = pa < pb
+                pa, pb = pa[tut], pb[tut]
+            yield sira[pa], sira[pb]
+
+
+def _esik_icinde(renkler: np.ndarray, ia: np.ndarray, ib: np.ndarray, esik: float) -> np.ndarray:
+    """Aday çiftlerden Delta E (CIE76) ≤ esik olanların maskesi."""
+    return np.sqrt(((renkler[ia] - renkler[ib]) ** 2).sum(axis=1)) <= esik
+
+
+def esik_komsulari(renkler: np.ndarray, esik: float) -> tuple:
+    """
+    Delta E (CIE76) ≤ esik olan tüm renk çiftlerini bulur.
+    
+    N² çiftin hepsi yerine yalnızca komşu ızgara hücrelerindeki adaylar
+    sınanır (bkz. `_aday_partileri`); ara bellek parti boyutuyla sınırlıdır.
+    Sonucun kendisi eşleşen çift sayısı kadardır: renklerin çoğu eşik
+    içindeyse bu N²/2'ye yaklaşır. Gruplama (`renk_gruplari_etiketle`)
+    çiftleri biriktirmez, bu fonksiyonu kullanmaz.
+    
+    Args:
+        renkler: (N, 3) LAB renkler
+        esik: Delta E eşiği (dahil)
+    
+    Returns:
+        tuple: (i, j) int64 dizileri, i < j
+    """
+    renkler = np.asarray(renkler, dtype=np.float64)
+    parcalar_i, parcalar_j = [], []
+    if len(renkler) >= 2 and esik >= 0:
+        for ia, ib in _aday_partileri(_renk_izgarasi(renkler, max(esik, 1.0))):
+            tut = _esik_icinde(renkler, ia, ib, esik)
+            parcalar_i.append(ia[tut])
+            parcalar_j.append(ib[tut])
+    
+    if not parcalar_i:
+        bos = np.zeros(0, dtype=np.int64)
+        return bos, bos.copy()
+    i = np.concatenate(parcalar_i)
+    j = np.concatenate(parcalar_j)
+    return np.minimum(i, j), np.maximum(i, j)
+
+
+def _lider_etiketleri(renkler: np.ndarray, esik: float) -> np.ndarray:
+    """
+    Açgözlü lider gruplaması (önceki çift döngü ile aynı sonuç).
+    
+    Sıradaki atanmamış renk lider olur; adayları yalnızca kendi ve komşu
+    hücrelerindeki renklerdir. z ekseni hücre kodunda en hızlı değiştiği
+    için 3×3×3 komşuluk, sıralı dizide 9 bitişik aralıktır; aralıklar her
+    dolu hücre için bir kez hesaplanır. Kenar listesi tutulmaz.
+    """
+    n = len(renkler)
+    etiketler = np.full(n, -1, dtype=np.int64)
+    if n == 0:
+        return etiketler
+    sira, kod_sirali, hucreler, _, _, koordinat, boyut = _renk_izgarasi(renkler, max(esik, 1.0))
+    
+    # Her dolu hücre için 9 (x, y) komşu sütununun z aralığı → sira aralıkları
+    ilk, son = [], []
+    z_alt = np.maximum(koordinat[:, 2] - 1, 0)
+    z_ust = np.minimum(koordinat[:, 2] + 1, boyut[2] - 1)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            x, y = koordinat[:, 0] + dx, koordinat[:, 1] + dy
+            gecerli = (x >= 0) & (x < boyut[0]) & (y >= 0) & (y < boyut[1])
+            taban = (x * boyut[1] + y) * boyut[2]
+            bas = np.searchsorted(kod_sirali, taban + z_alt, side='left')
+            bit = np.searchsorted(kod_sirali, taban + z_ust, side='right')
+            ilk.append(bas)
+            son.append(np.where(gecerli, bit, bas))
+    araliklar = np.stack([np.stack(ilk, axis=1), np.stack(son, axis=1)], axis=2).tolist()
+    hucre_no = np.searchsorted(hucreler, kod_sirali)[np.argsort(sira)].tolist()
+    
+    atanmis = np.zeros(n, dtype=bool)
+    grup_id = 0
+    for lider in range(n):
+        if atanmis[lider]:
+            continue
+        aday = np.concatenate([sira[bas:bit] for bas, bit in araliklar[hucre_no[lider]] if bit > bas])
+        aday = aday[~atanmis[aday]]
+        uyeler = aday[np.sqrt(((renkler[aday] - renkler[lider]) ** 2).sum(axis=1)) <= esik]
+        atanmis[uyeler] = True
+        atanmis[lider] = True
+        etiketler[uyeler] = grup_id
+        etiketler[lider] = grup_id
         grup_id += 1
+    return etiketler
+
+
+def _birlestir(ebeveyn: np.ndarray, i: np.ndarray, j: np.ndarray):
+    """
+    Kenarları union-find ormanına ekler (vektörel, `ebeveyn` yerinde).
+    
+    Her turda her kenarın büyük kökü küçük köke bağlanır
+    (`np.minimum.at`), ardından işaretçiler köke kadar kısaltılır
+    (işaretçi atlama). Bütün kenarların iki ucu aynı köke ulaşınca durulur;
+    çıkışta `ebeveyn` tamamen sıkıştırılmıştır (her eleman köke işaret eder).
+    """
+    while len(i):
+        ki, kj = ebeveyn[i], ebeveyn[j]
+        farkli = ki != kj
+        if not farkli.any():
+            break
+        ki, kj = ki[farkli], kj[farkli]
+        np.minimum.at(ebeveyn, np.maximum(ki, kj), np.minimum(ki, kj))
+        while True:
+            kisa = ebeveyn[ebeveyn]
+            if np.array_equal(kisa, ebeveyn):
+                break
+            ebeveyn[:] = kisa
+        i, j = i[farkli], j[farkli]
+
+
+def _bilesen_etiketleri(renkler: np.ndarray, esik: float) -> np.ndarray:
+    """
+    Tek bağlantılı gruplama: eşik grafının bağlı bileşenleri.
+    
+    Hücre kenarı esik/√3 seçilir: bir hücrenin köşegeni esik olduğundan
+    hücre içindeki renklerin hepsi birbirine eşik içindedir ve aday
+    sınanmadan tek bileşene bağlanır; eşik içindeki renkler en fazla iki
+    hücre uzaktadır (erisim=2). Hücreler arası aday partileri doğrudan
+    union-find'a verilir, kenarlar biriktirilmez. Her partiden önce iki
+    hücresi zaten aynı tek bileşende olan hücre çiftleri atlanır; yoğun
+    kümelerde adayların çoğu hiç üretilmez. Kök bileşenin en küçük
+    indeksi olduğundan gruplar ilk rengin sırasıyla numaralanır.
+    """
+    n = len(renkler)
+    ebeveyn = np.arange(n)
+    if n < 2 or esik < 0:
+        return ebeveyn
+    
+    # Küçük eşiklerde (kenar < 1) hücre kodu taşmasın diye esik kenarlı ızgara
+    kenar = esik / np.sqrt(3)
+    alt_hucre = kenar >= 1.0
+    izgara = _renk_izgarasi(renkler, kenar if alt_hucre else max(esik, 1.0))
+    sira, _, _, baslangic, sayilar, _, _ = izgara
+    
+    if alt_hucre:
+        # Hücre içi: her renk hücresindeki en küçük indekse bağlanır
+        ebeveyn[sira] = np.repeat(np.minimum.reduceat(sira, baslangic), sayilar)
+    
+    def _ayni_bilesen(a_hucre, b_hucre):
+        """İki hücrenin tüm renkleri aynı kökteyse True."""
+        kokler = ebeveyn[sira]
+        en_kucuk = np.minimum.reduceat(kokler, baslangic)
+        tek_kok = np.where(en_kucuk == np.maximum.reduceat(kokler, baslangic), en_kucuk, -1)
+        return (tek_kok[a_hucre] == tek_kok[b_hucre]) & (tek_kok[a_hucre] >= 0)
+    
+    for ia, ib in _aday_partileri(izgara, erisim=2 if alt_hucre else 1,
+                                  kendi=not alt_hucre, atla=_ayni_bilesen):
+        farkli = ebeveyn[ia] != ebeveyn[ib]
+        ia, ib = ia[farkli], ib[farkli]
+        tut = _esik_icinde(renkler, ia, ib, esik)
+        _birlestir(ebeveyn, ia[tut], ib[tut])
+    
+    _, etiketler = np.unique(ebeveyn, return_inverse=True)
+    return etiketler
+
+
+def renk_gruplari_etiketle(renkler_lab, esik: float = 10.0, yontem: str = 'lider') -> np.ndarray:
+    """
+    Delta E eşiğine göre her renge grup etiketi verir.
     
+    Eşik içindeki renkler ızgara hücreleriyle bulunur; ara bellek renk
+    sayısıyla doğrusal ve parti boyutuyla sınırlıdır (renklerin çoğu eşik
+    içinde olsa da kenar listesi oluşturulmaz).
+    
+    Args:
+        renkler_lab: LAB renk listesi veya (N, 3) dizi
+        esik: Maksimum Delta E değeri (aynı grup için)
+        yontem: 'lider' veya 'tek_baglanti'
+    
+    Returns:
+        np.ndarray: (N,) grup etiketleri (0'dan başlar; grup sırası
+        gruptaki ilk rengin sırasıdır)
+    """
+    if yontem not in GRUPLAMA_YONTEMLERI:
+        raise ValueError(f"Bilinmeyen gruplama: {yontem}. Seçenekler: {GRUPLAMA_YONTEMLERI}")
+    renkler = np.asarray(renkler_lab, dtype=np.float64).reshape(-1, 3)
+    if yontem == 'lider':
+        return _lider_etiketleri(renkler, esik)
+    return _bilesen_etiketleri(renkler, esik)
+
+
+def renkleri_grupla(renkler_lab: list, esik: float = 10.0, yontem: str = 'lider') -> dict:
+    """
+    Delta E eşiğine göre benzer renkleri gruplar.
+    
+    'lider' yönteminde sıradaki atanmamış renk yeni bir grup başlatır ve
+    kendisine Delta E ≤ esik olan atanmamış renkleri alır. 'tek_baglanti'
+    yönteminde eşik içindeki renkler zincirleme birleşir (A~B, B~C ise
+    A, B ve C aynı gruptadır). Çift çift döngü yerine eşik komşuluğu
+    vektörel olarak bulunur (bkz. `renk_gruplari_etiketle`); 100 bin renk
+    saniyeler içinde gruplanır.
+    
+    Args:
+        renkler_lab: LAB renk listesi [(L, a, b), ...]
+        esik: Maksimum Delta E değeri (aynı grup için)
+        yontem: 'lider' veya 'tek_baglanti'
+    
+    Returns:
+        dict: {grup_id: [renkler]} (grup içinde renkler giriş sırasında)
+    """
+    etiketler = renk_gruplari_etiketle(renkler_lab, esik, yontem)
+    gruplar = defaultdict(list)
+    for renk, grup_id in zip(renkler_lab, etiketler.tolist()):
+        gruplar[grup_id].append(renk)
     return dict(gruplar)
 
 
-def renk_haritasi_olustur(goruntu: np.ndarray, esik: float = 15.0) -> np.ndarray:
+def renk_haritasi_olustur(goruntu: np.ndarray, esik: float = 15.0,
+                          dominant: np.ndarray = None) -> tuple:
     """
     Benzer renkleri gruplandırarak renk haritası oluşturur.
     
+    Bütün pikseller tek seferde en yakın baskın renge atanır
+    (`donusumler.PaletteIndex.labels`; küçük paletlerde tek matris çarpımı,
+    etiketler doğrudan uint8 görüntüye yazılır); palet BGR'ye bir kez
+    çevrilir ve harita etiket görüntüsünden tablo okumasıyla çizilir. En
+    fazla 256 baskın renk desteklenir (uint8 etiketler).
+    
+    Palet verilmezse kare başına kullanılabilir olması için histogram
+    modunda bulunur (tüm piksellerle K-Means 1080p'de ~10 sn sürer).
+    
     Args:
         goruntu: BGR formatında görüntü
         esik: Delta E eşiği
+        dominant: İsteğe bağlı baskın renkler (LAB, OpenCV 8-bit ölçeği);
+                  verilmezse `dominant_renkler_bul(goruntu, k=8,
+                  histogram='lab')` kullanılır
     
     Returns:
-        np.ndarray: Gruplandırılmış renk haritası
+        tuple: (renk haritası (H, W, 3) BGR, etiketler (H, W) uint8)
     """
     # LAB'a dönüştür
-    lab = cv2.cvtColor(goruntu, cv2.COLOR_BGR2LAB).astype(np.float32)
+    lab = cv2.cvtColor(goruntu, cv2.COLOR_BGR2LAB)
     
     # Baskın renkleri bul
-    dominant = dominant_renkler_bul(goruntu, k=8)
+    if dominant is None:
+        dominant = dominant_renkler_bul(goruntu, k=8, histogram='lab')
+    
+    if len(dominant) > 256:
+        raise ValueError(f"En fazla 256 baskın renk desteklenir: {len(dominant)}")
     
     # Her pikseli en yakın dominant renge ata
-    h, w = goruntu.shape[:2]
-    sonuc = np.zeros_like(goruntu)
-    
-    for i in range(h):
-        for j in range(w):
-            piksel_lab = lab[i, j]
-            min_mesafe = float('inf')
-            en_yakin = dominant[0]
-            
-            for renk in dominant:
-                mesafe = delta_e_cie76(piksel_lab, renk)
-                if mesafe < min_mesafe:
-                    min_mesafe = mesafe
-                    en_yakin = renk
-            
-            # LAB'dan BGR'ye dönüştür
-            lab_piksel = np.uint8([[en_yakin]])
-            bgr_piksel = cv2.cvtColor(lab_piksel.reshape(1, 1, 3), cv2.COLOR_LAB2BGR)
-            sonuc[i, j] = bgr_piksel[0, 0]
-    
-    return sonuc
+    etiketler = PaletteIndex(dominant).labels(lab, out=np.empty(lab.shape[:2], dtype=np.uint8))
+    
+    # Paleti tek seferde LAB'dan BGR'ye dönüştür, her kanalı tek kanallı
+    # etiket görüntüsünden tablo (LUT) ile boya
+    palet_bgr = cv2.cvtColor(np.uint8([dominant]), cv2.COLOR_LAB2BGR)[0]
+    tablo = np.zeros((3, 256), dtype=np.uint8)
+    tablo[:, :len(palet_bgr)] = palet_bgr.T
+    sonuc = cv2.merge([cv2.LUT(etiketler, tablo[c]) for c in range(3)])
+    
+    return sonuc, etiketler
+
+
+def ornekleme_karsilastir(goruntu: np.ndarray, k: int = 8,
+                          butce: int = PIKSEL_BUTCESI) -> list:
+    """
+    Örnekleme ve histogram modlarını tüm veriyle K-Means'e göre karşılaştırır.
+    
+    Tüm veriyle K-Means'in kendisi de rastgele başlangıca bağlı olduğundan
+    farklı bir OpenCV tohumuyla ikinci bir tam çalıştırma "taban" satırı
+    olarak eklenir; kaymalar bu tabanla birlikte okunmalıdır. Kümeleme
+    hatası (piksellerin atandıkları merkeze ortalama ΔE'si) paletin
+    kendisinin ne kadar iyi olduğunu gösterir.
+    
+    Args:
+        goruntu: BGR formatında görüntü
+        k: Renk sayısı
+        butce: Örnek bütçesi
+    
+    Returns:
+        list: [(yöntem, süre sn, ortalama ΔE kayma, en büyük ΔE kayma,
+               kümeleme hatası ΔE), ...]
+    """
+    import time
+    
+    lab = cv2.cvtColor(goruntu, cv2.COLOR_BGR2LAB).reshape(-1, 3).astype(np.float32)
+    
+    def _olc(ad, tohum, **secenekler):
+        cv2.setRNGSeed(tohum)
+        bas = time.perf_counter()
+        merkezler = dominant_renkler_bul(goruntu, k=k, etiketleri_dondur=True, **secenekler)[0]
+        sure = time.perf_counter() - bas
+        hata = PaletteIndex(merkezler).nearest(lab)[1].mean()
+        return ad, sure, merkezler, float(hata)
+    
+    olcumler = [_olc('tam', 0), _olc('tam (taban)', 1)]
+    olcumler += [_olc(yontem, 0, ornekleme=yontem, butce=butce) for yontem in ORNEKLEME_YONTEMLERI]
+    olcumler += [_olc(f'histogram {uzay}', 0, histogram=uzay) for uzay in ('lab', 'bgr')]
+    
+    referans = olcumler[0][2]
+    return [(ad, sure, *palet_kaymasi(merkezler, referans), hata)
+            for ad, sure, merkezler, hata in olcumler]
 
 
 if __name__ == "__main__":
@@ -121,3 +802,82 @@ if __name__ == "__main__":
     lab2 = (55, 22, 28)
     de = delta_e_cie76(lab1, lab2)
     print(f"LAB{lab1} ve LAB{lab2} arası Delta E: {de:.2f}")
+    
+    # Örnek: 100 bin rengin gruplanması ve tam ΔE matrisiyle doğrulama
+    import time
+    rng = np.random.default_rng(0)
+    renkler = np.column_stack([rng.uniform(0, 100, 100_000), rng.uniform(-100, 100, (100_000, 2))])
+    for yontem in GRUPLAMA_YONTEMLERI:
+        bas = time.perf_counter()
+        etiketler = renk_gruplari_etiketle(renkler, esik=5.0, yontem=yontem)
+        print(f"100 bin renk, {yontem:12s}: {etiketler.max() + 1:6d} grup, "
+              f"{time.perf_counter() - bas:.2f} sn")
+    
+    kucuk = renkler[:2000]
+    matris = np.sqrt(((kucuk[:, np.newaxis] - kucuk[np.newaxis]) ** 2).sum(axis=2)) <= 5.0
+    i, j = esik_komsulari(kucuk, 5.0)
+    dogru = np.array_equal(np.column_stack([i, j])[np.lexsort((j, i))], np.argwhere(np.triu(matris, 1)))
+    print(f"Eşik komşuluğu tam matrisle aynı (2000 renk): {'✓' if dogru else '✗'}")
+    
+    # Yoğun küme: 20 bin renk yarıçapı 10 olan bir topta (hepsi ΔE 20 içinde)
+    yon = rng.normal(size=(20_000, 3))
+    yon /= np.linalg.norm(yon, axis=1, keepdims=True)
+    yogun = 128 + yon * (10 * rng.random(20_000) ** (1 / 3))[:, np.newaxis]
+    for yontem in GRUPLAMA_YONTEMLERI:
+        bas = time.perf_counter()
+        etiketler = renk_gruplari_etiketle(yogun, esik=20.0, yontem=yontem)
+        print(f"Yoğun 20 bin renk, {yontem:12s}: {etiketler.max() + 1:6d} grup, "
+              f"{time.perf_counter() - bas:.2f} sn")
+    
+    # Örnek: 1080p renk haritası süresi (palet önceden bulunmuş)
+    goruntu = cv2.resize(rng.integers(0, 256, (54, 96, 3), dtype=np.uint8), (1920, 1080))
+    dominant = rng.uniform(0, 255, (8, 3)).astype(np.float32)
+    
+    sure = float('inf')
+    for _ in range(3):
+        bas = time.perf_counter()
+        harita, etiketler = renk_haritasi_olustur(goruntu, dominant=dominant)
+        sure = min(sure, time.perf_counter() - bas)
+    
+    # Küçük bir parçada piksel döngüsüyle aynı sonucu vermeli
+    parca = cv2.cvtColor(goruntu[:20, :20], cv2.COLOR_BGR2LAB).astype(np.float32)
+    beklenen = [[np.argmin([delta_e_cie76(p, r) for r in dominant]) for p in satir] for satir in parca]
+    dogru = np.array_equal(etiketler[:20, :20], beklenen)
+    print(f"1080p renk haritası: {sure * 1000:.0f} ms, "
+          f"döngü ile aynı: {'✓' if dogru else '✗'}")
+    
+    # Palet verilmeden (histogram modunda K-Means dahil)
+    bas = time.perf_counter()
+    renk_haritasi_olustur(goruntu)
+    print(f"1080p renk haritası, palet dahil: {(time.perf_counter() - bas) * 1000:.0f} ms")
+    
+    # Örnekleme / histogram: süre ve tüm veriyle K-Means'e göre palet kayması
+    araba = cv2.imread("araba.jpeg")
+    if araba is not None:
+        print(f"\nÖrneklemeli / histogram K-Means (araba.jpeg, {araba.shape[0] * araba.shape[1]} "
+              f"piksel, bütçe {PIKSEL_BUTCESI}):")
+        for yontem, sure, ortalama, en_buyuk, hata in ornekleme_karsilastir(araba):
+            print(f"  {yontem:14s} {sure:6.2f} sn   kayma ΔE ort. {ortalama:5.2f}, "
+                  f"en büyük {en_buyuk:5.2f}   kümeleme hatası {hata:5.2f}")
+    
+    # Palet takipçisi: parlaklığı değişen iki sahnelik yapay 1080p kare dizisi
+    lena = cv2.imread("lena2.png")
+    if araba is not None and lena is not None:
+        print("\nPalet takipçisi (60 kare, 30. karede sahne değişimi):")
+        sahneler = [cv2.resize(g, (1920, 1080)) for g in (araba, lena)]
+        kareler = [cv2.convertScaleAbs(sahneler[i // 30], beta=(i % 30) * 1.5) for i in range(60)]
+        
+        takipci = PaletTakipci(k=8)
+        sureler = []
+        for i, kare in enumerate(kareler):
+            bas = time.perf_counter()
+            palet = takipci.guncelle(kare)
+            sureler.append(time.perf_counter() - bas)
+            if i % 15 == 14:
+                lab = cv2.cvtColor(kare, cv2.COLOR_BGR2LAB).reshape(-1, 3).astype(np.float32)
+                hatalar = [PaletteIndex(p).nearest(lab)[1].mean()
+                           for p in (palet, dominant_renkler_bul(kare, histogram='lab'))]
+                print(f"  kare {i + 1:2d}: kümeleme hatası takipçi {hatalar[0]:5.2f}, "
+                      f"karede sıfırdan {hatalar[1]:5.2f}, kayma {takipci.kayma:5.2f}")
+        print(f"Palet takipçisi: kare başına ortanca {np.median(sureler) * 1000:.1f} ms, "
+              f"{takipci.tohumlama_sayisi} tohumlama / {takipci.kare_sayisi} kare")